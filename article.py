@@ -0,0 +1,73 @@
+"""크롤링 파이프라인 기사 레코드
+
+소스 파서(RSS/네이버)에서 만든 기사를 3일 필터 → 중복 제거 → 이미지 보강 → 정렬까지
+같은 객체로 넘긴다. 발행 시각은 KST aware datetime, URL은 정규화 키와 함께 들고 다니므로
+단계마다 ISO 문자열을 다시 파싱하거나 URL을 다시 정규화하지 않는다.
+JSON(API 응답/파일 저장) 형태로는 저장 직전 to_dict()에서 한 번만 바꾼다.
+"""
+from datetime import datetime
+from typing import Dict, Optional
+from urllib.parse import urlparse, urlunparse
+
+import pytz
+
+KST = pytz.timezone('Asia/Seoul')
+
+
+def normalize_url(url: str) -> str:
+    """URL 정규화 (쿼리/fragment 제거, 끝 '/' 제거)"""
+    try:
+        parsed = urlparse(url)
+        return urlunparse((parsed.scheme, parsed.netloc, parsed.path.rstrip('/'), parsed.params, '', ''))
+    except Exception:
+        return url
+
+
+class Article:
+    """기사 하나
+
+    published_at은 소스 파서가 만든 KST aware datetime(날짜를 못 구했으면 None)이고,
+    url_key는 처음 쓸 때 한 번 정규화해 두었다가 url이 바뀌면(구글 뉴스 resolve 등) 다시 계산한다.
+    """
+
+    __slots__ = ('title', '_url', '_url_key', 'source', 'published_at', 'image_url', 'summary')
+
+    def __init__(self, title: str, url: str, source: str, published_at: Optional[datetime] = None,
+                 image_url: str = '', summary: str = ''):
+        self.title = title
+        self.url = url
+        self.source = source
+        self.published_at = published_at
+        self.image_url = image_url or ''
+        self.summary = summary or ''
+
+    @property
+    def url(self) -> str:
+        return self._url
+
+    @url.setter
+    def url(self, value: str):
+        self._url = value
+        self._url_key = None
+
+    @property
+    def url_key(self) -> str:
+        """정규화 URL (URL 중복 판정 키)"""
+        if self._url_key is None:
+            self._url_key = normalize_url(self._url) if self._url else ''
+        return self._url_key
+
+    def to_dict(self) -> Dict[str, str]:
+        """API/파일 저장 형태 (publishedAt은 ISO 문자열)"""
+        return {
+            'title': self.title,
+            'url': self.url,
+            'source': self.source,
+            'publishedAt': self.published_at.isoformat() if self.published_at else '',
+            'imageUrl': self.image_url,
+            'summary': self.summary,
+        }
+
+    def __repr__(self) -> str:
+        published = self.published_at.isoformat() if self.published_at else None
+        return f"Article({self.title[:30]!r}, {self.url!r}, {published})"
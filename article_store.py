@@ -0,0 +1,382 @@
+"""카테고리별 기사 저장소 (SQLite, WAL)
+
+크롤링 회차마다 카테고리 결과를 runs 한 행 + articles 여러 행으로 한 트랜잭션에 저장하고,
+API는 카테고리의 게시 회차(current 테이블이 가리키는 회차)를 조회한다. 이전 회차도
+ARTICLE_HISTORY_DAYS일 동안 남겨 두므로 articles (category, published_at) 인덱스로 기간별
+기사 이력을 조회할 수 있다 (크롤링 주기가 카테고리마다 달라 회차 수가 아니라 저장 시각으로 정리).
+
+게시는 회차 저장과 같은 트랜잭션에서 current 포인터를 바꾸는 것이라, 읽는 쪽은 락 없이 항상
+완성된 회차 하나를 본다. 기사가 0개인 회차(크롤링 실패 등)는 이력에만 남기고 게시하지 않으며,
+잘못 게시된 회차는 rollback()/publish()로 포인터만 옮겨 즉시 되돌린다 (게시 중인 회차는 보관
+기간 정리에서 지우지 않는다).
+회차마다 미리 직렬화/압축한 API 응답 본문(response_body.EncodedBody)도 bodies 테이블에 같이 넣는다.
+본문은 게시 회차만 읽으므로 게시 회차 + 최근 ARTICLE_BODY_RUNS개 회차(되돌리기용)에만 남긴다
+(그보다 오래된 회차를 게시하면 news_cache가 기사 행으로 다시 만든다).
+
+WAL 모드라 읽기는 쓰기를 막지 않는다 (스레드마다 연결을 따로 쓰고, 저장소 전체 락이 없다).
+읽는 쪽은 BEGIN 트랜잭션 안에서 조회하므로 저장 도중에도 완성된 회차만 보인다.
+
+같은 프로세스의 저장은 generation을 올리고, 다른 프로세스의 저장은 file_stamp()(DB/WAL 파일
+mtime)로 알 수 있다 (news_cache가 둘 다 보고 캐시를 비운다).
+
+기존 data/{category}.json 파일은 migrate_json()으로 가져온다 (이미 회차가 있는 카테고리는 건너뜀).
+
+    python article_store.py migrate [data]
+    python article_store.py runs <category>
+    python article_store.py rollback <category>
+    python article_store.py publish <category> <run_id>
+"""
+import glob
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from response_body import EncodedBody, decode_row
+
+logger = logging.getLogger(__name__)
+
+ARTICLE_STORE_PATH = os.getenv('ARTICLE_STORE_PATH', os.path.join('data', 'articles.sqlite3'))
+ARTICLE_HISTORY_DAYS = int(os.getenv('ARTICLE_HISTORY_DAYS', '30'))  # 이전 회차 보관 기간 (일, 이력 API 최대 조회 기간)
+ARTICLE_BODY_RUNS = int(os.getenv('ARTICLE_BODY_RUNS', '3'))  # 카테고리별로 응답 본문을 남길 최근 회차 수 (게시 회차 제외)
+
+# API 기사 필드 ↔ articles 컬럼
+_FIELDS = (('id', 'article_id'), ('title', 'title'), ('url', 'url'), ('source', 'source'),
+           ('publishedAt', 'published_at'), ('imageUrl', 'image_url'), ('summary', 'summary'))
+_COLUMNS = ', '.join(column for _, column in _FIELDS)
+
+
+def _article(row) -> Dict[str, str]:
+    return {key: value for (key, _), value in zip(_FIELDS, row)}
+
+
+class ArticleStore:
+    """카테고리 → 회차별 기사 목록"""
+
+    def __init__(self, path: str = ARTICLE_STORE_PATH, history_days: int = ARTICLE_HISTORY_DAYS,
+                 body_runs: int = ARTICLE_BODY_RUNS):
+        self.path = path
+        self.history_days = history_days
+        self.body_runs = body_runs
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._local = threading.local()
+        # 이 프로세스에서 저장할 때마다 1씩 증가 (읽기 캐시 무효화용)
+        self.generation = 0
+        conn = self._conn()
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS runs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                category TEXT NOT NULL,
+                category_name TEXT NOT NULL,
+                cached_at TEXT NOT NULL,
+                saved_at REAL NOT NULL,
+                count INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_runs_category ON runs (category, id);
+            CREATE TABLE IF NOT EXISTS articles (
+                run_id INTEGER NOT NULL,
+                category TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                article_id TEXT NOT NULL,
+                title TEXT NOT NULL,
+                url TEXT NOT NULL,
+                source TEXT NOT NULL,
+                published_at TEXT NOT NULL,
+                image_url TEXT NOT NULL,
+                summary TEXT NOT NULL,
+                PRIMARY KEY (run_id, position)
+            );
+            CREATE INDEX IF NOT EXISTS idx_articles_category_published ON articles (category, published_at);
+            CREATE TABLE IF NOT EXISTS current (
+                category TEXT PRIMARY KEY,
+                run_id INTEGER NOT NULL,
+                published_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS demand (
+                category TEXT PRIMARY KEY,
+                requests INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS bodies (
+                run_id INTEGER PRIMARY KEY,
+                etag TEXT NOT NULL,
+                identity BLOB NOT NULL,
+                gzip BLOB,
+                br BLOB
+            );
+            """
+        )
+        # 게시 포인터가 생기기 전에 만든 저장소는 카테고리마다 마지막 회차를 게시 회차로
+        conn.execute(
+            'INSERT OR IGNORE INTO current (category, run_id, published_at) '
+            'SELECT category, MAX(id), ? FROM runs GROUP BY category',
+            (time.time(),),
+        )
+
+    def _conn(self) -> sqlite3.Connection:
+        """스레드별 연결 (autocommit, 트랜잭션은 직접 BEGIN)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def save(self, category: str, category_name: str, articles: List[Dict],
+             cached_at: Optional[str] = None, body: Optional[EncodedBody] = None,
+             publish: Optional[bool] = None) -> int:
+        """회차 하나 저장 + 게시 (한 트랜잭션), 보관 기간이 지난 이전 회차/오래된 본문 삭제, 회차 id 반환
+
+        body를 주면 이 회차의 API 응답 본문으로 같이 저장한다.
+        publish를 주지 않으면 기사가 있거나 게시 회차가 아직 없을 때만 게시한다.
+        """
+        cached_at = cached_at or datetime.now().astimezone().isoformat()
+        now = time.time()
+        conn = self._conn()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            run_id = conn.execute(
+                'INSERT INTO runs (category, category_name, cached_at, saved_at, count) VALUES (?, ?, ?, ?, ?)',
+                (category, category_name, cached_at, now, len(articles)),
+            ).lastrowid
+            conn.executemany(
+                f'INSERT INTO articles (run_id, category, position, {_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                [(run_id, category, position, *(article.get(key) or '' for key, _ in _FIELDS))
+                 for position, article in enumerate(articles)],
+            )
+            if body is not None:
+                conn.execute(
+                    'INSERT INTO bodies (run_id, etag, identity, gzip, br) VALUES (?, ?, ?, ?, ?)',
+                    (run_id, body.etag, body.bodies['identity'], body.bodies.get('gzip'), body.bodies.get('br')),
+                )
+            if publish is None:
+                publish = bool(articles) or self._current(conn, category) is None
+            if publish:
+                self._publish(conn, category, run_id)
+            else:
+                logger.warning(f"[저장소] {category}: 회차 {run_id} ({len(articles)}개) 게시 안 함, 이전 회차 유지")
+            expired = [row[0] for row in conn.execute(
+                'SELECT id FROM runs WHERE category = ? AND saved_at < ? '
+                'AND id NOT IN (SELECT run_id FROM current)',
+                (category, now - self.history_days * 86400),
+            )]
+            if expired:
+                marks = ', '.join('?' * len(expired))
+                conn.execute(f'DELETE FROM articles WHERE run_id IN ({marks})', expired)
+                conn.execute(f'DELETE FROM bodies WHERE run_id IN ({marks})', expired)
+                conn.execute(f'DELETE FROM runs WHERE id IN ({marks})', expired)
+            # 응답 본문은 게시 회차 + 최근 body_runs개 회차만 (기사 행은 이력 조회용으로 남김)
+            conn.execute(
+                'DELETE FROM bodies WHERE run_id IN (SELECT id FROM runs WHERE category = ? '
+                'AND id NOT IN (SELECT run_id FROM current) ORDER BY id DESC LIMIT -1 OFFSET ?)',
+                (category, self.body_runs),
+            )
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        self.generation += 1
+        return run_id
+
+    @staticmethod
+    def _current(conn: sqlite3.Connection, category: str) -> Optional[int]:
+        row = conn.execute('SELECT run_id FROM current WHERE category = ?', (category,)).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _publish(conn: sqlite3.Connection, category: str, run_id: int):
+        conn.execute(
+            'INSERT INTO current (category, run_id, published_at) VALUES (?, ?, ?) '
+            'ON CONFLICT(category) DO UPDATE SET run_id = excluded.run_id, published_at = excluded.published_at',
+            (category, run_id, time.time()),
+        )
+
+    def publish(self, category: str, run_id: int) -> bool:
+        """보관 중인 회차를 게시 회차로 (포인터만 바꿈), 그 카테고리 회차가 아니면 False"""
+        conn = self._conn()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            found = conn.execute('SELECT 1 FROM runs WHERE id = ? AND category = ?', (run_id, category)).fetchone()
+            if found:
+                self._publish(conn, category, run_id)
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        if found:
+            self.generation += 1
+            logger.info(f"[저장소] {category}: 회차 {run_id} 게시")
+        return bool(found)
+
+    def rollback(self, category: str) -> Optional[int]:
+        """게시 회차 바로 이전의 기사가 있는 회차로 되돌리기, 게시한 회차 id (없으면 None)"""
+        conn = self._conn()
+        current = self._current(conn, category)
+        if current is None:
+            return None
+        row = conn.execute(
+            'SELECT id FROM runs WHERE category = ? AND id < ? AND count > 0 ORDER BY id DESC LIMIT 1',
+            (category, current),
+        ).fetchone()
+        if row is None or not self.publish(category, row[0]):
+            return None
+        return row[0]
+
+    def runs(self, category: str) -> List[Dict]:
+        """보관 중인 회차 목록 (최신순, 게시 회차 표시)"""
+        conn = self._conn()
+        current = self._current(conn, category)
+        rows = conn.execute(
+            'SELECT id, cached_at, count FROM runs WHERE category = ? ORDER BY id DESC', (category,)
+        ).fetchall()
+        return [{'id': run_id, 'cached_at': cached_at, 'count': count, 'current': run_id == current}
+                for run_id, cached_at, count in rows]
+
+    def file_stamp(self) -> Tuple[int, int]:
+        """DB/WAL 파일 mtime (ns) - 다른 프로세스가 저장했는지 판단용"""
+        stamp = []
+        for path in (self.path, self.path + '-wal'):
+            try:
+                stamp.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                stamp.append(0)
+        return tuple(stamp)
+
+    def load(self, category: str) -> Optional[Dict]:
+        """카테고리 게시 회차 (기존 JSON 파일과 같은 형태), 없으면 None"""
+        conn = self._conn()
+        conn.execute('BEGIN')
+        try:
+            run = conn.execute(
+                'SELECT r.id, r.category_name, r.cached_at FROM current AS c JOIN runs AS r ON r.id = c.run_id '
+                'WHERE c.category = ?',
+                (category,),
+            ).fetchone()
+            if run is None:
+                return None
+            run_id, category_name, cached_at = run
+            rows = conn.execute(
+                f'SELECT {_COLUMNS} FROM articles WHERE run_id = ? ORDER BY position', (run_id,)
+            ).fetchall()
+        finally:
+            conn.execute('COMMIT')
+        return {
+            'articles': [_article(row) for row in rows],
+            'cached_at': cached_at,
+            'category': category,
+            'category_name': category_name,
+        }
+
+    def load_body(self, category: str) -> Optional[EncodedBody]:
+        """카테고리 게시 회차의 응답 본문 (게시 회차에 본문이 없으면 None)"""
+        row = self._conn().execute(
+            'SELECT b.etag, b.identity, b.gzip, b.br FROM current AS c '
+            'LEFT JOIN bodies AS b ON b.run_id = c.run_id WHERE c.category = ?',
+            (category,),
+        ).fetchone()
+        return decode_row(*row) if row else None
+
+    def counts(self) -> Dict[str, int]:
+        """카테고리별 게시 회차 기사 수"""
+        rows = self._conn().execute(
+            'SELECT c.category, r.count FROM current AS c JOIN runs AS r ON r.id = c.run_id'
+        )
+        return dict(rows.fetchall())
+
+    def count_new(self, category: str, articles: List[Dict]) -> int:
+        """articles 중 게시 회차에 없던 URL 수 (게시 회차가 없으면 전부 새 기사)"""
+        rows = self._conn().execute(
+            'SELECT a.url FROM current AS c JOIN articles AS a ON a.run_id = c.run_id WHERE c.category = ?',
+            (category,),
+        )
+        published = {row[0] for row in rows}
+        return len({article.get('url') for article in articles if article.get('url')} - published)
+
+    def last_saved(self) -> Dict[str, float]:
+        """카테고리별 마지막 회차 저장 시각 (epoch)"""
+        return dict(self._conn().execute('SELECT category, MAX(saved_at) FROM runs GROUP BY category').fetchall())
+
+    def add_requests(self, counts: Dict[str, int]):
+        """카테고리별 /api/news 요청 수 누적 (워밍업 순서용, 재시작해도 유지)"""
+        if not counts:
+            return
+        self._conn().executemany(
+            'INSERT INTO demand (category, requests) VALUES (?, ?) '
+            'ON CONFLICT(category) DO UPDATE SET requests = requests + excluded.requests',
+            list(counts.items()),
+        )
+
+    def request_counts(self) -> Dict[str, int]:
+        return dict(self._conn().execute('SELECT category, requests FROM demand').fetchall())
+
+    def history(self, category: str, since: str = '', limit: int = 200) -> List[Dict]:
+        """보관 중인 회차 전체에서 since(ISO) 이후 발행 기사, 최신순 (같은 URL은 마지막 회차 값)"""
+        rows = self._conn().execute(
+            f'SELECT MAX(run_id), {_COLUMNS} FROM articles '
+            f'WHERE category = ? AND published_at >= ? GROUP BY url ORDER BY published_at DESC LIMIT ?',
+            (category, since, limit),
+        ).fetchall()
+        return [_article(row[1:]) for row in rows]
+
+    def migrate_json(self, data_dir: str) -> int:
+        """data_dir/*.json 가져오기 (회차가 없는 카테고리만), 가져온 파일 수 반환"""
+        existing = {row[0] for row in self._conn().execute('SELECT DISTINCT category FROM runs')}
+        imported = 0
+        for path in sorted(glob.glob(os.path.join(data_dir, '*.json'))):
+            category = os.path.splitext(os.path.basename(path))[0]
+            if category in existing:
+                continue
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"[저장소 이전] {path} 읽기 실패: {e}")
+                continue
+            category = data.get('category') or category
+            articles = data.get('articles') or []
+            self.save(category, data.get('category_name') or category, articles, data.get('cached_at'))
+            logger.info(f"[저장소 이전] {category}: {len(articles)}개 기사")
+            imported += 1
+        return imported
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='기사 저장소 관리')
+    parser.add_argument('--path', default=ARTICLE_STORE_PATH)
+    commands = parser.add_subparsers(dest='command', required=True)
+    migrate = commands.add_parser('migrate', help='data/*.json 가져오기')
+    migrate.add_argument('data_dir', nargs='?', default='data')
+    for name, help_text in (('runs', '보관 중인 회차 목록'), ('rollback', '이전 회차로 되돌리기'),
+                            ('publish', '지정한 회차 게시')):
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument('category')
+        if name == 'publish':
+            command.add_argument('run_id', type=int)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    store = ArticleStore(args.path)
+    if args.command == 'migrate':
+        print(f"{store.migrate_json(args.data_dir)}개 카테고리 가져옴 → {args.path}")
+    elif args.command == 'runs':
+        for run in store.runs(args.category):
+            print(f"{'*' if run['current'] else ' '} {run['id']:>6}  {run['cached_at']}  {run['count']}개")
+    elif args.command == 'rollback':
+        run_id = store.rollback(args.category)
+        print(f"{args.category}: 회차 {run_id} 게시" if run_id else f"{args.category}: 되돌릴 회차 없음")
+    else:
+        ok = store.publish(args.category, args.run_id)
+        print(f"{args.category}: 회차 {args.run_id} 게시" if ok else f"{args.category}: 회차 {args.run_id} 없음")
+
+
+if __name__ == '__main__':
+    main()
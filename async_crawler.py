@@ -0,0 +1,384 @@
+"""RealNewsCrawler용 비동기 fan-out 크롤링 엔진
+
+카테고리 하나에 대해 구글 뉴스, 네이버 뉴스/블로그, 키워드 확장을 공유
+httpx.AsyncClient 위에서 동시에 실행한다. 수집된 기사가 target_count에 도달하면
+아직 실행 중인 소스는 취소한다. 티스토리 RSS는 이전 순차 크롤러와 같이 다른 소스에서
+fallback_count개 미만일 때만 실행한다. 파싱/필터는 RealNewsCrawler의 네트워크 없는
+헬퍼를 그대로 사용하므로 반환되는 기사(article.Article)도 동일하다.
+
+RealNewsCrawler.crawl_google_news 등 소스별 동기 메서드도 run_source()로 이 엔진을
+실행하므로, 소스 수집 로직은 여기 한 곳에만 있다.
+"""
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Callable, Coroutine, Dict, Iterable, List, Optional, Tuple
+
+import feedparser
+import httpx
+
+from article import Article
+from feed_pipeline import SeenKeys, select_entries
+from rate_limit import RATE_LIMITER, HostRateLimiter
+from url_resolver import google_news_article_id
+
+if TYPE_CHECKING:
+    from real_crawler import RealNewsCrawler
+
+logger = logging.getLogger(__name__)
+
+
+def build_client(headers: Dict[str, str], max_connections: int = 20,
+                 limiter: HostRateLimiter = RATE_LIMITER) -> httpx.AsyncClient:
+    """크롤러 헤더를 공유하는 AsyncClient 생성 (모든 요청이 호스트별 속도 제한을 거친다)"""
+    return httpx.AsyncClient(
+        headers=headers,
+        event_hooks={'request': [limiter.httpx_hook]},
+        timeout=httpx.Timeout(10.0),
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections // 2),
+    )
+
+
+def run_sync(coro: Coroutine):
+    """동기 코드에서 코루틴 실행 (이미 이벤트 루프가 실행 중이면 별도 스레드에서 실행)"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+async def crawl_categories(crawler: 'RealNewsCrawler', category_keys: Iterable[str],
+                           on_category_done: Optional[Callable[[str, List[Article]], None]] = None,
+                           max_requests: int = 24, per_category_requests: int = 6) -> Dict[str, Dict]:
+    """여러 카테고리를 하나의 AsyncClient로 동시에 크롤링
+
+    max_requests는 전체 카테고리에 걸친 동시 HTTP 요청 수, per_category_requests는
+    카테고리 하나의 동시 요청 수 상한이다. on_category_done(category, articles)은
+    각 카테고리가 끝나는 즉시 스레드에서 호출된다 (파일 저장 등).
+    카테고리별 결과 {'count', 'elapsed', 'error'}를 반환한다.
+    """
+    global_semaphore = asyncio.Semaphore(max_requests)
+    results: Dict[str, Dict] = {}
+
+    async with build_client(crawler.headers, max_connections=max_requests) as client:
+        async def crawl_one(category_key: str):
+            started = time.perf_counter()
+            result = {'count': 0, 'elapsed': 0.0, 'error': None}
+            try:
+                engine = AsyncCrawlEngine(crawler, client=client, max_concurrency=per_category_requests,
+                                          global_semaphore=global_semaphore)
+                articles = await engine.crawl_category(category_key)
+                result['count'] = len(articles)
+                if on_category_done:
+                    await asyncio.to_thread(on_category_done, category_key, articles)
+            except Exception as e:
+                result['error'] = e
+                logger.error(f"[크롤링 실패] {category_key}: {e}", exc_info=True)
+            result['elapsed'] = time.perf_counter() - started
+            results[category_key] = result
+
+        await asyncio.gather(*(crawl_one(key) for key in category_keys))
+
+    return results
+
+
+class AsyncCrawlEngine:
+    """카테고리 단위 비동기 크롤링 엔진 (소스 동시 실행 + 목표 도달 시 취소)"""
+
+    def __init__(self, crawler: 'RealNewsCrawler', client: Optional[httpx.AsyncClient] = None,
+                 target_count: int = 10, max_concurrency: int = 10,
+                 global_semaphore: Optional[asyncio.Semaphore] = None, fallback_count: int = 5):
+        self.crawler = crawler
+        self.client = client
+        self.target_count = target_count
+        self.fallback_count = fallback_count
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        # 여러 카테고리가 함께 도는 경우 전체 동시 요청 수 제한 (crawl_categories에서 공유)
+        self.global_semaphore = global_semaphore
+        # RSS 소스끼리 공유하는 URL/제목 키 (다른 소스에서 이미 고른 기사는 resolve/이미지 조회 생략)
+        self.seen = SeenKeys()
+
+    def run(self, category_key: str) -> List[Article]:
+        """동기 코드에서 호출"""
+        return run_sync(self.crawl_category(category_key))
+
+    def run_source(self, source: Callable[['AsyncCrawlEngine'], Coroutine]) -> List[Article]:
+        """소스 하나(source(engine) 코루틴)를 동기 코드에서 실행"""
+        return run_sync(self.with_client(source))
+
+    @asynccontextmanager
+    async def limit(self):
+        """카테고리 + 전체 동시 요청 제한 슬롯 확보"""
+        async with self.semaphore:
+            if self.global_semaphore is None:
+                yield
+            else:
+                async with self.global_semaphore:
+                    yield
+
+    async def with_client(self, source: Callable[['AsyncCrawlEngine'], Coroutine]):
+        """source(engine) 실행 (클라이언트가 없으면 이 호출 동안만 생성)"""
+        if self.client is not None:
+            return await source(self)
+
+        async with build_client(self.crawler.headers) as client:
+            self.client = client
+            try:
+                return await source(self)
+            finally:
+                self.client = None
+
+    async def crawl_category(self, category_key: str) -> List[Article]:
+        """카테고리 크롤링 (클라이언트가 없으면 이 호출 동안만 생성)"""
+        return await self.with_client(lambda engine: engine._crawl_category(category_key))
+
+    async def _crawl_category(self, category_key: str) -> List[Article]:
+        crawler = self.crawler
+        if category_key not in crawler.CATEGORIES:
+            logger.error(f"알 수 없는 카테고리: {category_key}")
+            return []
+
+        category_info = crawler.CATEGORIES[category_key]
+        category_name = category_info['name']
+
+        logger.info(f"=" * 60)
+        logger.info(f"[크롤링 시작] 카테고리: {category_name} ({category_key})")
+        logger.info(f"[시간 필터] {crawler.cutoff_date.isoformat()} ~ {crawler.now_kst.isoformat()}")
+
+        all_articles = await self.gather_sources(self.plan_sources(category_info))
+
+        # 티스토리 RSS (fallback, 다른 소스에서 fallback_count개 미만일 때만)
+        if len(all_articles) < self.fallback_count:
+            all_articles.extend(await self.gather_sources([('티스토리 RSS', self.crawl_tistory_rss(max_results=5))]))
+
+        # 3일 필터 적용 (강제)
+        filtered_articles = crawler.filter_by_date(all_articles)
+
+        # 중복 제거
+        unique_articles = crawler.remove_duplicates(filtered_articles)
+
+        # 이미지 개선 (이미지가 없는 항목에 대해)
+        await self.enhance_images(unique_articles)
+
+        # 다른 카테고리/다음 회차에서 재사용하도록 보강된 값 저장
+        crawler.fingerprints.record(category_key, unique_articles, crawler.canonical_url)
+
+        return crawler.finish_category(category_name, unique_articles)
+
+    def plan_sources(self, category_info: Dict) -> List[Tuple[str, Coroutine]]:
+        """카테고리에서 실행할 소스 목록 (라벨, 코루틴)"""
+        crawler = self.crawler
+        category_name = category_info['name']
+        google_query = category_info.get('google_query', category_name)
+        naver_query = category_info.get('naver_query', category_name)
+        keywords = category_info.get('keywords', [])
+
+        sources = [('구글 뉴스', self.crawl_google_news(google_query, max_results=15))]
+
+        if crawler.has_naver_credentials():
+            sources.extend([
+                ('네이버 뉴스', self.crawl_naver_search('news', naver_query, max_results=15)),
+                ('네이버 뉴스 확장', self.crawl_naver_search('news', naver_query, max_results=15, start=16)),
+                ('네이버 블로그', self.crawl_naver_search('blog', naver_query, max_results=15)),
+                ('네이버 블로그 확장', self.crawl_naver_search('blog', naver_query, max_results=15, start=16)),
+            ])
+        else:
+            logger.warning("[네이버] API 키가 설정되지 않아 네이버 소스를 건너뜁니다")
+
+        # 추가 키워드 (상위 2개 키워드만)
+        for keyword in keywords[1:3]:
+            sources.append((f"구글 뉴스 확장 '{keyword}'", self.crawl_google_news(keyword, max_results=10)))
+
+        return sources
+
+    async def gather_sources(self, sources: List[Tuple[str, Coroutine]]) -> List[Article]:
+        """소스를 동시에 실행하고 target_count 도달 시 남은 소스 취소"""
+        tasks = {asyncio.ensure_future(coro): label for label, coro in sources}
+        pending = set(tasks)
+        all_articles = []
+
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    label = tasks[task]
+                    try:
+                        articles = task.result()
+                    except Exception as e:
+                        logger.error(f"[{label}] 오류: {e}")
+                        continue
+                    all_articles.extend(articles)
+                    logger.info(f"[{label}] {len(articles)}개 수집")
+
+                if pending and len(all_articles) >= self.target_count:
+                    logger.info(f"[조기 종료] {len(all_articles)}개 수집 (목표 {self.target_count}개), 실행 중인 소스 {len(pending)}개 취소")
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        return all_articles
+
+    async def fetch(self, url: str, **kwargs) -> Optional[httpx.Response]:
+        """공유 클라이언트 GET (동시 요청 수 제한, 실패 시 None)"""
+        async with self.limit():
+            try:
+                return await self.client.get(url, **kwargs)
+            except Exception as e:
+                logger.debug(f"[비동기 요청 실패] {url}: {e}")
+                return None
+
+    async def fetch_feed(self, url: str):
+        """RSS 피드 조건부 GET (크롤러의 피드 캐시 공유, 실패 시 None)"""
+        return await self.crawler.feed_cache.get_async(self.client, url, limit=self.limit)
+
+    async def resolve_google_news_url(self, google_url: str) -> str:
+        """구글 뉴스 URL을 원문 URL로 변환"""
+        async with self.limit():
+            try:
+                response = await self.client.head(google_url, follow_redirects=True, timeout=5)
+            except Exception as e:
+                logger.debug(f"URL resolve 실패: {e}")
+                return google_url
+        return self.crawler.extract_final_url(str(response.url))
+
+    async def fetch_metadata(self, url: str):
+        """페이지 메타데이터 조회 (크롤러의 회차 메모 공유)"""
+        return await self.crawler.page_metadata.fetch_async(self.client, url, limit=self.limit)
+
+    async def extract_image_from_url(self, url: str) -> Optional[str]:
+        """URL에서 이미지 추출 (og:image 우선)"""
+        return self.crawler.image_from_metadata(await self.fetch_metadata(url))
+
+    async def fetch_published_date_from_url(self, url: str):
+        """URL에서 publishedAt 추출"""
+        return self.crawler.published_date_from_metadata(await self.fetch_metadata(url))
+
+    async def crawl_google_news(self, query: str, max_results: int = 15) -> List[Article]:
+        """구글 뉴스 RSS 크롤링"""
+        crawler = self.crawler
+        stats = {'success': 0, 'failed': 0}
+
+        logger.info(f"[구글 뉴스] 쿼리: {query}, 최대 {max_results}개")
+        response = await self.fetch_feed(crawler.build_google_news_rss_url(query))
+        if response is None:
+            return []
+
+        feed = feedparser.parse(response.content)
+        if not feed.entries:
+            logger.warning(f"[구글 뉴스] RSS 피드가 비어있습니다")
+            return []
+
+        # 파싱 → 3일 필터 → 중복 제거 → 개수 제한을 통과한 항목만 네트워크 작업
+        articles = select_entries(crawler, feed.entries, max_results, resolve=True, seen=self.seen,
+                                  date_stats=stats, label='구글 뉴스')
+        crawler.fingerprints.reuse(articles)
+
+        # 원문 URL resolve (영구 캐시 우선, 미스만 동시 요청, fingerprint로 이미 바뀐 URL 제외)
+        google_urls = [a.url for a in articles if google_news_article_id(a.url)]
+        resolved = await crawler.url_cache.resolve_many_async(google_urls, self.resolve_google_news_url)
+        for article in articles:
+            article.url = resolved.get(article.url, article.url)
+
+        await asyncio.gather(*(self.fill_image(article) for article in articles))
+
+        logger.info(f"[구글 뉴스] 날짜 파싱 성공: {stats['success']}, 실패: {stats['failed']}, 최종 수집: {len(articles)}개")
+        return articles
+
+    async def fill_image(self, article: Article):
+        """이미지가 없으면 og:image 추출"""
+        if not article.image_url:
+            article.image_url = await self.extract_image_from_url(article.url) or ''
+
+    async def crawl_naver_search(self, kind: str, query: str, max_results: int = 15, start: int = 1) -> List[Article]:
+        """네이버 검색 API 크롤링 (kind: news | blog)"""
+        crawler = self.crawler
+        label = crawler.NAVER_LABELS[kind]
+        stats = {'success': 0, 'failed': 0}
+
+        logger.info(f"[{label}] 쿼리: {query}, 최대 {max_results}개, 시작: {start}")
+        request = crawler.naver_search_request(kind, query, max_results, start)
+        response = await self.fetch(request['url'], headers=crawler.naver_api_headers(), params=request['params'])
+        if response is None:
+            return []
+
+        if response.status_code != 200:
+            logger.error(f"[{label}] API 오류: {response.status_code}")
+            return []
+
+        items = response.json().get('items', [])
+        articles = [a for a in (crawler.naver_item_to_article(kind, item) for item in items) if a]
+        crawler.fingerprints.reuse(articles)
+        kept = await asyncio.gather(*(self.enrich_naver_article(article, stats) for article in articles))
+        articles = [article for article, ok in zip(articles, kept) if ok]
+
+        logger.info(f"[{label}] 날짜 파싱 성공: {stats['success']}, 실패: {stats['failed']}, 최종 수집: {len(articles)}개")
+        return articles
+
+    async def enrich_naver_article(self, article: Article, stats: Dict[str, int]) -> bool:
+        """날짜 보완 + 3일 필터 후 이미지 추출 (필터 통과 여부 반환)"""
+        if not article.published_at:
+            article.published_at = await self.fetch_published_date_from_url(article.url)
+
+        if not self.crawler.apply_published_at(article, stats):
+            return False
+
+        await self.fill_image(article)
+        return True
+
+    async def crawl_tistory_rss(self, max_results: int = 10) -> List[Article]:
+        """티스토리 RSS 소스 크롤링 (피드별 동시 실행)"""
+        results = await asyncio.gather(*(
+            self.crawl_tistory_feed(rss_url, max_results) for rss_url in self.crawler.TISTORY_RSS_SOURCES
+        ))
+        return [article for articles in results for article in articles]
+
+    async def crawl_tistory_feed(self, rss_url: str, max_results: int) -> List[Article]:
+        """티스토리 RSS 피드 하나 크롤링"""
+        stats = {'success': 0, 'failed': 0}
+
+        logger.info(f"[티스토리 RSS] 소스: {rss_url}")
+        response = await self.fetch_feed(rss_url)
+        if response is None:
+            return []
+
+        feed = feedparser.parse(response.content)
+        if not feed.entries:
+            logger.warning(f"[티스토리 RSS] 피드가 비어있습니다: {rss_url}")
+            return []
+
+        source = feed.feed.get('title', 'Tistory')
+        articles = select_entries(self.crawler, feed.entries, max_results, source=source, seen=self.seen,
+                                  date_stats=stats, label='티스토리 RSS')
+        self.crawler.fingerprints.reuse(articles)
+        await asyncio.gather(*(self.fill_image(article) for article in articles))
+
+        logger.info(f"[티스토리 RSS] {rss_url}: 날짜 파싱 성공: {stats['success']}, 실패: {stats['failed']}")
+        return articles
+
+    async def enhance_images(self, articles: List[Article]) -> List[Article]:
+        """이미지 URL이 없는 항목에 대해 og:image 추출"""
+        articles_needing_image = [a for a in articles if not a.image_url and a.url]
+
+        if not articles_needing_image:
+            return articles
+
+        logger.info(f"[이미지 개선] {len(articles_needing_image)}개 항목에 대해 이미지 추출 시작")
+
+        images = await asyncio.gather(*(self.extract_image_from_url(a.url) for a in articles_needing_image))
+        for article, image_url in zip(articles_needing_image, images):
+            if image_url:
+                article.image_url = image_url
+
+        image_success = sum(1 for a in articles if a.image_url)
+        logger.info(f"[이미지 개선] 완료: {image_success}/{len(articles)}개 항목에 이미지 있음 ({image_success/len(articles)*100:.1f}%)")
+
+        return articles
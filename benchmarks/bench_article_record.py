@@ -0,0 +1,155 @@
+"""기사 레코드 benchmark: ISO 문자열 dict vs article.Article (12개 카테고리 1회차)
+
+네트워크 없이 카테고리마다 소스 파서 출력만큼(기본 120개)의 합성 기사를 만들어
+3일 필터 → 중복 제거 → 정렬/날짜 범위 로그 → API 형태 변환 → JSON 저장까지 돌린다.
+dict 쪽은 기존 방식(publishedAt ISO 문자열을 단계마다 fromisoformat, 단계마다 URL 정규화,
+저장 전에 dict 복사)을 그대로 재현한다. CPU 시간(process_time)과 tracemalloc 최대 메모리,
+파이프라인 도중 들고 있는 기사 객체 크기를 출력한다.
+
+--no-title-dedupe로 제목 유사도(양쪽 공통 비용)를 빼고 레코드 처리 비용만 비교할 수 있다.
+
+    python benchmarks/bench_article_record.py [--per-category 120] [--repeat 20] [--no-title-dedupe]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from article import KST, Article, normalize_url  # noqa: E402
+from bench_title_dedupe import make_titles  # noqa: E402
+from title_index import unique_title_mask  # noqa: E402
+
+CATEGORIES = 12
+SOURCES = ['Google News', 'Naver News', 'Naver Blog (하루)', 'brunch']
+
+title_mask = unique_title_mask
+
+
+def make_raw(per_category: int, now: datetime, seed: int = 3):
+    """카테고리별 (title, url, source, published_at, image, summary) 목록"""
+    rng = random.Random(seed)
+    titles = make_titles(per_category * CATEGORIES)
+    raw = []
+    for category in range(CATEGORIES):
+        items = []
+        for i in range(per_category):
+            n = category * per_category + i
+            # 약 15%는 3일보다 오래됨, 약 5%는 URL 중복 (utm 파라미터/끝 '/')
+            published = now - timedelta(hours=rng.uniform(0, 90))
+            url = f"https://news.example.kr/{category}/article/{n}"
+            if i and rng.random() < 0.05:
+                url = items[-1][1] + rng.choice(['/', '?utm_source=rss'])
+            items.append((titles[n], url, rng.choice(SOURCES), published,
+                          f"https://img.example.kr/{n}.jpg" if rng.random() < 0.7 else '', '요약 ' * 30))
+        raw.append(items)
+    return raw
+
+
+def run_dicts(raw, now: datetime):
+    cutoff = now - timedelta(days=3)
+    saved = []
+    for category, items in enumerate(raw):
+        articles = [{'title': t, 'url': u, 'source': s, 'publishedAt': p.isoformat(), 'imageUrl': i, 'summary': m}
+                    for t, u, s, p, i, m in items]
+        filtered = []
+        for article in articles:
+            published_at = datetime.fromisoformat(article['publishedAt'].replace('Z', '+00:00')).astimezone(KST)
+            if cutoff <= published_at <= now:
+                filtered.append(article)
+        seen, candidates = set(), []
+        for article in filtered:
+            key = normalize_url(article.get('url', ''))
+            if key and key not in seen:
+                seen.add(key)
+                candidates.append(article)
+        keep = title_mask([a.get('title', '') for a in candidates])
+        unique = [a for a, k in zip(candidates, keep) if k]
+        unique.sort(key=lambda x: x.get('publishedAt', ''), reverse=True)
+        dates = [datetime.fromisoformat(a['publishedAt'].replace('Z', '+00:00')) for a in unique if a.get('publishedAt')]
+        assert all(d >= cutoff for d in dates)
+        formatted = [{'id': f"{category}_{i}", 'title': a.get('title', ''), 'url': a.get('url', ''),
+                      'source': a.get('source', ''), 'publishedAt': a.get('publishedAt', ''),
+                      'imageUrl': a.get('imageUrl', '') or '', 'summary': a.get('summary', '') or ''}
+                     for i, a in enumerate(unique[:30])]
+        saved.append(json.dumps({'articles': formatted}, ensure_ascii=False))
+    return articles, saved
+
+
+def run_records(raw, now: datetime):
+    cutoff = now - timedelta(days=3)
+    saved = []
+    for category, items in enumerate(raw):
+        articles = [Article(t, u, s, p, i, m) for t, u, s, p, i, m in items]
+        filtered = [a for a in articles if a.published_at and cutoff <= a.published_at <= now]
+        seen, candidates = set(), []
+        for article in filtered:
+            if article.url_key and article.url_key not in seen:
+                seen.add(article.url_key)
+                candidates.append(article)
+        keep = title_mask([a.title for a in candidates])
+        unique = [a for a, k in zip(candidates, keep) if k]
+        unique.sort(key=lambda a: a.published_at, reverse=True)
+        assert all(a.published_at >= cutoff for a in unique)
+        formatted = [{'id': f"{category}_{i}", **a.to_dict()} for i, a in enumerate(unique[:30])]
+        saved.append(json.dumps({'articles': formatted}, ensure_ascii=False))
+    return articles, saved
+
+
+def object_bytes(articles) -> int:
+    """기사 객체 자체 크기 (공유 문자열 제외, dict면 해시 테이블 포함)"""
+    total = 0
+    for article in articles:
+        total += sys.getsizeof(article)
+        if isinstance(article, Article):
+            total += sys.getsizeof(article.published_at)
+    return total
+
+
+def measure(func, raw, now, repeat: int):
+    func(raw, now)  # 워밍업 (title_index 등 import/캐시)
+    started = time.process_time()
+    for _ in range(repeat):
+        articles, saved = func(raw, now)
+    cpu = (time.process_time() - started) / repeat
+
+    tracemalloc.start()
+    func(raw, now)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return cpu, peak, object_bytes(articles), saved
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--per-category', type=int, default=120)
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--no-title-dedupe', action='store_true')
+    args = parser.parse_args()
+
+    global title_mask
+    if args.no_title_dedupe:
+        title_mask = lambda titles: [True] * len(titles)  # noqa: E731
+
+    now = datetime.now(KST)
+    raw = make_raw(args.per_category, now)
+    old = measure(run_dicts, raw, now, args.repeat)
+    new = measure(run_records, raw, now, args.repeat)
+    assert [json.loads(s) for s in old[3]] == [json.loads(s) for s in new[3]], '저장 결과가 다름'
+
+    print(f"카테고리 {CATEGORIES}개 × 기사 {args.per_category}개, {args.repeat}회 평균"
+          f"{' (제목 중복 제거 제외)' if args.no_title_dedupe else ''}")
+    print(f"{'':>10}{'CPU ms':>10}{'최대 메모리 KB':>16}{'기사 객체 B/개':>16}")
+    for label, (cpu, peak, size, _) in (('dict', old), ('Article', new)):
+        print(f"{label:>10}{cpu * 1000:>10.1f}{peak / 1024:>16.0f}{size / args.per_category:>16.0f}")
+    print(f"{'감소':>10}{1 - new[0] / old[0]:>10.1%}{1 - new[1] / old[1]:>16.1%}{1 - new[2] / old[2]:>16.1%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""발행 시각 파서 microbenchmark: 기존 parse_published_date vs date_parser.DateParser
+
+소스별로 실제로 들어오는 형태(네이버 뉴스 pubDate RFC 2822, 블로그 postdate YYYYMMDD,
+메타 태그 ISO, 블로그 본문 점/한글 날짜)를 형식별로 N개씩 만들어 항목당 시간과 결과를 비교한다.
+기존 함수는 RealNewsCrawler.parse_published_date(이 변경 전)를 그대로 옮겨 왔다.
+
+    python benchmarks/bench_date_parser.py [--count 20000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import pytz  # noqa: E402
+
+from date_parser import DateParser  # noqa: E402
+
+KST = pytz.timezone('Asia/Seoul')
+
+
+def legacy_parse(date_str):
+    """기존 RealNewsCrawler.parse_published_date"""
+    if not date_str:
+        return None
+    try:
+        if 'T' in date_str or '+' in date_str or 'Z' in date_str:
+            dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+            if dt.tzinfo is None:
+                dt = KST.localize(dt)
+            else:
+                dt = dt.astimezone(KST)
+            return dt
+        try:
+            dt = datetime.strptime(date_str, '%a, %d %b %Y %H:%M:%S %z')
+            return dt.astimezone(KST)
+        except:  # noqa: E722
+            pass
+        if len(date_str) == 8 and date_str.isdigit():
+            dt = datetime.strptime(date_str, '%Y%m%d')
+            return KST.localize(dt)
+        for pattern in ['%Y-%m-%d %H:%M:%S', '%Y-%m-%d', '%Y.%m.%d']:
+            try:
+                dt = datetime.strptime(date_str[:19], pattern)
+                return KST.localize(dt)
+            except:  # noqa: E722
+                continue
+        return None
+    except Exception:
+        return None
+
+
+FORMATS = {
+    'naver.pubDate': lambda d: d.strftime('%a, %d %b %Y %H:%M:%S +0900'),
+    'naver.postdate': lambda d: d.strftime('%Y%m%d'),
+    'meta.iso': lambda d: d.strftime('%Y-%m-%dT%H:%M:%S+09:00'),
+    'meta.iso_z': lambda d: (d - timedelta(hours=9)).strftime('%Y-%m-%dT%H:%M:%SZ'),
+    'page.datetime': lambda d: d.strftime('%Y-%m-%d %H:%M:%S'),
+    'blog.dotted': lambda d: d.strftime('%Y.%m.%d'),
+    'blog.korean': lambda d: f"{d.year}년 {d.month}월 {d.day}일",
+    'blog.relative': lambda d: f"{d.hour + 1}시간 전",
+}
+
+
+def timed(func, values):
+    started = time.perf_counter()
+    results = [func(v) for v in values]
+    return results, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=20000)
+    args = parser.parse_args()
+
+    rng = random.Random(5)
+    now = datetime(2024, 6, 1, 12, 0)
+    dates = [now - timedelta(minutes=rng.randrange(0, 60 * 24 * 3)) for _ in range(args.count)]
+
+    print(f"형식별 {args.count}개, 항목당 µs (기존 / 분류만 / 소스 캐시)")
+    print(f"{'source':>16}{'기존':>10}{'분류':>10}{'캐시':>10}{'배속':>8}{'기존 실패':>10}{'새 실패':>9}{'불일치':>8}")
+    total_old = total_new = 0.0
+    for source, fmt in FORMATS.items():
+        values = [fmt(d) for d in dates]
+        old, old_elapsed = timed(legacy_parse, values)
+        fresh = DateParser()
+        _, plain_elapsed = timed(fresh.parse, values)
+        cached_parser = DateParser()
+        new, new_elapsed = timed(lambda v: cached_parser.parse(v, source), values)
+        mismatch = sum(1 for a, b in zip(old, new) if a is not None and a != b)
+        total_old += old_elapsed
+        total_new += new_elapsed
+        print(f"{source:>16}{old_elapsed / args.count * 1e6:>10.2f}{plain_elapsed / args.count * 1e6:>10.2f}"
+              f"{new_elapsed / args.count * 1e6:>10.2f}{old_elapsed / new_elapsed:>8.1f}"
+              f"{old.count(None):>10}{new.count(None):>9}{mismatch:>8}")
+    print(f"{'전체':>16}{total_old:>9.2f}s{'':>10}{total_new:>9.2f}s{total_old / total_new:>8.1f}")
+
+
+if __name__ == '__main__':
+    main()
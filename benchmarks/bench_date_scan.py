@@ -0,0 +1,92 @@
+"""본문 날짜 추출 benchmark: 문서 전체 텍스트 정규식(full) vs 날짜 후보 영역(scoped)
+
+benchmarks/fixtures/*.html에서 published_time/datePublished 메타 태그를 지워 (메타 태그가 없는
+사이트처럼 만들어) CategoryCrawler.parse_date의 3단계 폴백만 타게 한다. 페이지마다 트리는
+한 번 만들어 두고 날짜 추출 단계(full: get_text + 정규식, scoped: 후보 영역 + 파서)만 반복해서
+시간, 날짜를 찾으려고 읽은 문자 수, 찾은 날짜를 출력한다. --pad N으로 본문 문단을 N배 늘려
+페이지 길이에 따른 비용 변화를 볼 수 있다.
+
+    python benchmarks/bench_date_scan.py [--repeat 50] [--budget 2000] [--pad 1]
+"""
+import argparse
+import glob
+import os
+import re
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from bs4 import BeautifulSoup  # noqa: E402
+
+from date_parser import parse_date  # noqa: E402
+from page_metadata import extract_date_regions  # noqa: E402
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+META_DATE_RE = re.compile(rb'<meta[^>]+(?:published_time|datePublished)[^>]*>', re.I)
+DATE_PATTERNS = [
+    re.compile(r'(\d{4})[-./](\d{1,2})[-./](\d{1,2})'),
+    re.compile(r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일'),
+]
+
+
+def date_full(soup, budget: int):
+    """기존 방식: 문서 전체 get_text() 후 정규식 검색"""
+    text = soup.get_text(separator=' ', strip=True)
+    for pattern in DATE_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            year, month, day = match.groups()
+            return datetime(int(year), int(month), int(day)), len(text)
+    return None, len(text)
+
+
+def date_scoped(soup, budget: int):
+    scanned = 0
+    for text in extract_date_regions(soup, budget):
+        scanned += len(text)
+        published_at = parse_date(text)
+        if published_at:
+            return published_at, scanned
+    return None, scanned
+
+
+def pad_body(html: bytes, times: int) -> bytes:
+    """</body> 앞에 본문 문단을 덧붙여 긴 페이지 흉내"""
+    if times <= 1:
+        return html
+    paragraph = '<p>정부는 오늘 새로운 정책을 발표했다. 전문가들은 시장에 큰 영향을 줄 것으로 내다봤다.</p>'.encode()
+    return html.replace(b'</body>', paragraph * (len(html) // 200) * (times - 1) + b'</body>', 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=50)
+    parser.add_argument('--budget', type=int, default=2000, help='날짜 후보 영역 문자 수 상한')
+    parser.add_argument('--pad', type=int, default=1, help='본문 길이 배수')
+    args = parser.parse_args()
+
+    fixtures = {}
+    for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, '*.html'))):
+        with open(path, 'rb') as f:
+            html = pad_body(META_DATE_RE.sub(b'', f.read()), args.pad)
+        fixtures[os.path.basename(path)] = BeautifulSoup(html, 'html.parser')
+
+    print(f"{args.repeat}회 평균, budget {args.budget}자, 본문 ×{args.pad}")
+    print(f"{'fixture':>18}{'mode':>8}{'ms/page':>10}{'읽은 문자':>10}  날짜")
+    totals = {}
+    for name, soup in fixtures.items():
+        for mode, func in (('full', date_full), ('scoped', date_scoped)):
+            started = time.perf_counter()
+            for _ in range(args.repeat):
+                found, scanned = func(soup, args.budget)
+            elapsed = (time.perf_counter() - started) / args.repeat
+            totals[mode] = totals.get(mode, 0) + elapsed
+            day = found.strftime('%Y-%m-%d') if found else '-'
+            print(f"{name:>18}{mode:>8}{elapsed * 1000:>10.2f}{scanned:>10}  {day}")
+    print(f"{'합계':>18}{'':>8}{'':>10}{'':>10}  scoped/full {totals['scoped'] / totals['full']:.0%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""메타 태그 추출 백엔드 benchmark
+
+benchmarks/fixtures/*.html을 백엔드별로 반복 파싱해서 초당 처리 태그 수와
+페이지 수를 출력하고, 기준 구현(bs4)과 추출 결과가 같은지 확인한다.
+
+    python benchmarks/bench_meta_parser.py [--repeat 50] [--head-only]
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+from html.parser import HTMLParser
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from meta_parser import BACKENDS, available_backends, extract_bs4  # noqa: E402
+from page_metadata import HeadBuffer  # noqa: E402
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+class _TagCounter(HTMLParser):
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def handle_starttag(self, tag, attrs):
+        self.count += 1
+
+
+def count_tags(html: bytes) -> int:
+    counter = _TagCounter()
+    counter.feed(html.decode('utf-8', errors='replace'))
+    counter.close()
+    return counter.count
+
+
+def load_fixtures(head_only: bool):
+    fixtures = {}
+    for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, '*.html'))):
+        with open(path, 'rb') as f:
+            html = f.read()
+        if head_only:
+            buffer = HeadBuffer()
+            buffer.feed(html)
+            html = bytes(buffer.data)
+        fixtures[os.path.basename(path)] = html
+    return fixtures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=50)
+    parser.add_argument('--head-only', action='store_true', help='</head>까지 자른 입력으로 측정')
+    args = parser.parse_args()
+
+    fixtures = load_fixtures(args.head_only)
+    tag_counts = {name: count_tags(html) for name, html in fixtures.items()}
+    expected = {name: extract_bs4(html) for name, html in fixtures.items()}
+    total_tags = sum(tag_counts.values())
+
+    print(f"fixtures: {len(fixtures)}개, 태그 {total_tags}개, {sum(len(h) for h in fixtures.values()) / 1024:.0f}KB, 반복 {args.repeat}회")
+    print(f"{'backend':<12}{'tags/s':>14}{'pages/s':>12}{'ms/page':>10}  일치")
+
+    for name in available_backends():
+        extract = BACKENDS[name]
+        mismatches = []
+        for fixture, html in fixtures.items():
+            got = extract(html)
+            diff = [k for k in expected[fixture] if got.get(k) != expected[fixture][k]]
+            if diff:
+                mismatches.append(f"{fixture}:{','.join(diff)}")
+
+        started = time.perf_counter()
+        for _ in range(args.repeat):
+            for html in fixtures.values():
+                extract(html)
+        elapsed = time.perf_counter() - started
+
+        pages = args.repeat * len(fixtures)
+        agreement = 'OK' if not mismatches else ' '.join(mismatches)
+        print(f"{name:<12}{total_tags * args.repeat / elapsed:>14,.0f}{pages / elapsed:>12,.1f}{elapsed / pages * 1000:>10.2f}  {agreement}")
+
+
+if __name__ == '__main__':
+    main()
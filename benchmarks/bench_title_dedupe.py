@@ -0,0 +1,97 @@
+"""제목 중복 제거 benchmark: SequenceMatcher 루프 vs MinHash/LSH TitleIndex
+
+합성 한국어 헤드라인(원본 + 언론사 꼬리표/띄어쓰기/문장부호/단어 변형 사본)을 만들어
+기존 CategoryCrawler.remove_duplicates 방식(SequenceMatcher > 0.85)과 TitleIndex의
+처리 시간, 남긴 제목 수, 항목별 판정 일치율을 출력한다.
+
+    python benchmarks/bench_title_dedupe.py [--sizes 96,500,1000] [--threshold 0.65]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from difflib import SequenceMatcher
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from title_index import DEFAULT_THRESHOLD, TitleIndex  # noqa: E402
+
+SUBJECTS = ['AI 반도체', '코스피', '서울 아파트값', '프로야구', '손흥민', '전기차 보조금', '청년 월세 지원',
+            '제주 항공편', '넷플릭스 신작', '비트코인', '수능 출제', '폭염 특보', '카카오', '삼성전자', '국민연금',
+            '다이어트 식단', '반려견 산책', '캠핑장 예약', '주담대 금리', '유럽 여행']
+PREDICATES = ['역대 최대 실적 발표', '급락 이후 반등 조짐', '3주 연속 상승세', '개막전 매진 행렬',
+              '시즌 첫 골 폭발', '내년부터 대폭 축소', '신청 방법 총정리', '주말 결항 잇따라',
+              '공개 첫날 1위 등극', '사상 최고치 경신', '난이도 작년 수준', '전국 확대 발령',
+              '새 서비스 출시 예고', '하반기 전망 밝아', '개혁안 국회 제출', '전문가가 추천하는 방법',
+              '이것만 알면 충분', '예약 전쟁 시작', '금리 인하 기대감', '가성비 코스 추천']
+SUFFIXES = ['(종합)', '(2보)', '"주목"']
+OUTLETS = ['연합뉴스', '한국경제', '조선일보', 'SBS 뉴스', '매일경제', '뉴스1']
+
+
+def make_titles(size: int, dup_ratio: float = 0.4, seed: int = 7):
+    rng = random.Random(seed)
+    originals = []
+    titles = []
+    while len(titles) < size:
+        if originals and rng.random() < dup_ratio:
+            base = rng.choice(originals)
+            variant = rng.choice([
+                lambda t: f"{t} - {rng.choice(OUTLETS)}",
+                lambda t: t.replace(' ', '', 1),
+                lambda t: f"[속보] {t}",
+                lambda t: t + '…',
+                lambda t: t.replace('…', ', '),
+                lambda t: f"{t} {rng.choice(SUFFIXES)}",
+            ])
+            titles.append(variant(base))
+        else:
+            title = f"{rng.choice(SUBJECTS)} {rng.choice(PREDICATES)}…{rng.choice(SUBJECTS)}도 {rng.choice(PREDICATES)}"
+            originals.append(title)
+            titles.append(title)
+    return titles
+
+
+def dedupe_sequence_matcher(titles):
+    """기존 방식: 남긴 모든 제목과 SequenceMatcher 비교"""
+    kept = []
+    decisions = []
+    for title in titles:
+        title = title.lower().strip()
+        is_duplicate = any(SequenceMatcher(None, title, seen).ratio() > 0.85 for seen in kept)
+        if not is_duplicate:
+            kept.append(title)
+        decisions.append(not is_duplicate)
+    return decisions
+
+
+def dedupe_index(titles, threshold):
+    index = TitleIndex(threshold=threshold)
+    return [index.add_if_new(title) for title in titles]
+
+
+def timed(func, *args):
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', default='96,500,1000')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    print(f"TitleIndex threshold(Jaccard) {args.threshold}, SequenceMatcher 기준 0.85")
+    print(f"{'titles':>8}{'SM ms':>12}{'index ms':>12}{'배속':>8}{'SM 남김':>10}{'index 남김':>12}{'일치율':>10}")
+    for size in (int(s) for s in args.sizes.split(',')):
+        titles = make_titles(size)
+        expected, sm_elapsed = timed(dedupe_sequence_matcher, titles)
+        got, index_elapsed = timed(dedupe_index, titles, args.threshold)
+        agreement = sum(a == b for a, b in zip(expected, got)) / len(titles)
+        print(f"{size:>8}{sm_elapsed * 1000:>12.1f}{index_elapsed * 1000:>12.1f}{sm_elapsed / index_elapsed:>8.1f}"
+              f"{sum(expected):>10}{sum(got):>12}{agreement:>10.1%}")
+
+
+if __name__ == '__main__':
+    main()
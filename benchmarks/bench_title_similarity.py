@@ -0,0 +1,83 @@
+"""NumPy 일괄 제목 유사도 microbenchmark (1k / 10k / 100k)
+
+bench_title_dedupe.make_titles의 합성 헤드라인으로 bigram CSR 생성, 블록 단위 코사인,
+클러스터링 시간을 재고, 같은 입력에서 MinHash/LSH TitleIndex 순차 처리 시간과 비교한다.
+파이썬 쌍별 코사인(기존 방식과 같은 O(n²))은 --pairwise-max 이하 크기에서만 잰다.
+
+    python benchmarks/bench_title_similarity.py [--sizes 1000,10000,100000] [--block-size 2048]
+"""
+import argparse
+import math
+import os
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_title_dedupe import make_titles  # noqa: E402
+from title_index import TitleIndex, normalize_title  # noqa: E402
+from title_similarity import (DEFAULT_BLOCK_SIZE, DEFAULT_COSINE_THRESHOLD, build_matrix,  # noqa: E402
+                              duplicate_clusters, similar_pairs)
+
+
+def pairwise_python(titles, threshold):
+    """비교 기준: 파이썬 dict 벡터로 모든 쌍 코사인"""
+    vectors = []
+    for title in titles:
+        text = normalize_title(title)
+        counts = Counter(text[i:i + 2] for i in range(len(text) - 1))
+        norm = math.sqrt(sum(v * v for v in counts.values())) or 1.0
+        vectors.append({k: v / norm for k, v in counts.items()})
+    pairs = 0
+    for i in range(len(vectors)):
+        a = vectors[i]
+        for j in range(i + 1, len(vectors)):
+            b = vectors[j]
+            if len(a) > len(b):
+                a, b = b, a
+            if sum(v * b.get(k, 0.0) for k, v in a.items()) >= threshold:
+                pairs += 1
+            a = vectors[i]
+    return pairs
+
+
+def timed(func, *args):
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', default='1000,10000,100000')
+    parser.add_argument('--block-size', type=int, default=DEFAULT_BLOCK_SIZE)
+    parser.add_argument('--threshold', type=float, default=DEFAULT_COSINE_THRESHOLD)
+    parser.add_argument('--pairwise-max', type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"코사인 threshold {args.threshold}, block {args.block_size}")
+    print(f"{'titles':>8}{'CSR ms':>10}{'cosine ms':>12}{'cluster ms':>12}{'쌍':>10}{'클러스터':>10}"
+          f"{'minhash ms':>12}{'python ms':>12}")
+    for size in (int(s) for s in args.sizes.split(',')):
+        titles = make_titles(size)
+        matrix, csr_elapsed = timed(build_matrix, titles)
+        pairs, cosine_elapsed = timed(similar_pairs, matrix, args.threshold, args.block_size)
+        clusters, cluster_elapsed = timed(duplicate_clusters, titles, args.threshold, args.block_size)
+
+        index = TitleIndex()
+        _, minhash_elapsed = timed(lambda: [index.add_if_new(t) for t in titles])
+
+        python_ms = '-'
+        if size <= args.pairwise_max:
+            python_pairs, python_elapsed = timed(pairwise_python, titles, args.threshold)
+            assert python_pairs == len(pairs), (python_pairs, len(pairs))
+            python_ms = f"{python_elapsed * 1000:.0f}"
+
+        print(f"{size:>8}{csr_elapsed * 1000:>10.0f}{cosine_elapsed * 1000:>12.0f}{cluster_elapsed * 1000:>12.0f}"
+              f"{len(pairs):>10}{len(clusters):>10}{minhash_elapsed * 1000:>12.0f}{python_ms:>12}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""카테고리 정의 (slug → 이름/검색어)
+
+크롤러(real_crawler)와 API 서버가 함께 쓴다. API 서버는 카테고리 목록/이름만 필요하므로
+크롤러 모듈(bs4, feedparser) 없이 이 모듈만 import한다.
+"""
+from typing import Dict
+
+CATEGORIES = {
+    'health': {
+        'name': '건강·운동',
+        'keywords': ['건강', '운동', '다이어트', '헬스', '요가', '필라테스'],
+        'google_query': '건강 운동 OR 다이어트 OR 헬스',
+        'naver_query': '건강 운동'
+    },
+    'food': {
+        'name': '맛집·레시피',
+        'keywords': ['맛집', '레시피', '요리', '혼밥', '카페'],
+        'google_query': '맛집 레시피 OR 요리',
+        'naver_query': '맛집 레시피'
+    },
+    'finance': {
+        'name': '재테크·돈관리',
+        'keywords': ['재테크', '투자', '주식', '가계부', '절약'],
+        'google_query': '재테크 투자 OR 주식',
+        'naver_query': '재테크 투자'
+    },
+    'travel': {
+        'name': '여행·주말나들이',
+        'keywords': ['여행', '주말', '당일치기', '여행지', '명소'],
+        'google_query': '여행 주말 OR 당일치기',
+        'naver_query': '여행 주말'
+    },
+    'relationship': {
+        'name': '연애·관계·심리',
+        'keywords': ['연애', '심리', '관계', 'MBTI', '대화법'],
+        'google_query': '연애 심리 OR 관계',
+        'naver_query': '연애 심리'
+    },
+    'self_improvement': {
+        'name': '자기계발·공부법',
+        'keywords': ['자기계발', '공부법', '시간관리', '독서'],
+        'google_query': '자기계발 공부법 OR 시간관리',
+        'naver_query': '자기계발 공부법'
+    },
+    'it': {
+        'name': 'IT·앱·AI 트렌드',
+        'keywords': ['IT', '앱', 'AI', '기술', '스마트폰'],
+        'google_query': 'IT AI OR 앱 OR 기술',
+        'naver_query': 'IT AI'
+    },
+    'beauty': {
+        'name': '뷰티·패션·그루밍',
+        'keywords': ['뷰티', '패션', '스킨케어', '화장품'],
+        'google_query': '뷰티 패션 OR 스킨케어',
+        'naver_query': '뷰티 패션'
+    },
+    'home': {
+        'name': '집·인테리어·살림',
+        'keywords': ['인테리어', '집꾸미기', '정리정돈', '청소'],
+        'google_query': '인테리어 집꾸미기 OR 정리정돈',
+        'naver_query': '인테리어 집꾸미기'
+    },
+    'hobby': {
+        'name': '취미·문화생활',
+        'keywords': ['영화', '드라마', '전시', '음악', '취미'],
+        'google_query': '영화 드라마 OR 전시 OR 음악',
+        'naver_query': '영화 드라마'
+    },
+    'family': {
+        'name': '육아·가족·반려동물',
+        'keywords': ['육아', '아이', '반려동물', '강아지', '고양이'],
+        'google_query': '육아 반려동물 OR 강아지',
+        'naver_query': '육아 반려동물'
+    },
+    'sports': {
+        'name': '스포츠',
+        'keywords': ['스포츠', '축구', '야구', '농구', '배구'],
+        'google_query': '스포츠 축구 OR 야구 OR 농구',
+        'naver_query': '스포츠 축구'
+    }
+}
+
+
+def category_names() -> Dict[str, str]:
+    """slug → 카테고리 이름"""
+    return {key: info['name'] for key, info in CATEGORIES.items()}
@@ -7,11 +7,20 @@ import feedparser
 import logging
 from urllib.parse import urlparse, urljoin, urlunparse, quote
 import time
+import os
 from difflib import SequenceMatcher
 
+from date_parser import parse_date
+from page_metadata import PageMetadata, PageMetadataFetcher
+from rate_limit import RateLimitedSession
+from title_index import unique_title_mask
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# 메타 태그에 날짜가 없을 때: scoped = 날짜 후보 영역만, full = 문서 전체 텍스트 정규식 검색 (기존 방식)
+DATE_SCAN_MODE = os.getenv('DATE_SCAN_MODE', 'scoped')
+
 
 class CategoryCrawler:
     """카테고리별 뉴스 및 블로그를 크롤링하는 클래스 (개선 버전)"""
@@ -90,8 +99,12 @@ class CategoryCrawler:
             'Upgrade-Insecure-Requests': '1'
         }
         self.today = datetime.now().date()
-        self.session = requests.Session()
+        # 도메인별 속도 제한은 세션이 요청마다 토큰 버킷으로 처리한다 (고정 sleep 없음)
+        self.session = RateLimitedSession()
         self.session.headers.update(self.headers)
+        # 기사 상세 페이지는 한 번만 받아서 제목/이미지/요약/날짜를 함께 추출
+        self.page_metadata = PageMetadataFetcher(self.session, include_text=True, get=self.fetch_with_retry,
+                                                 full_text=DATE_SCAN_MODE == 'full')
     
     def normalize_url(self, url: str) -> str:
         """URL 정규화 (중복 제거용)"""
@@ -127,12 +140,11 @@ class CategoryCrawler:
         """제목 유사도 계산"""
         return SequenceMatcher(None, title1.lower(), title2.lower()).ratio()
     
-    def extract_image(self, soup: BeautifulSoup, url: str) -> str:
+    def extract_image(self, meta: PageMetadata, url: str) -> str:
         """이미지 추출 (og:image → twitter:image → 본문 이미지 순서)"""
         # 1. og:image
-        og_image = soup.select_one('meta[property="og:image"]')
-        if og_image and og_image.get('content'):
-            img_url = og_image.get('content')
+        img_url = meta.og_image
+        if img_url:
             if img_url.startswith('http'):
                 return img_url
             elif img_url.startswith('//'):
@@ -142,16 +154,12 @@ class CategoryCrawler:
                 return f"{parsed.scheme}://{parsed.netloc}{img_url}"
         
         # 2. twitter:image
-        twitter_image = soup.select_one('meta[name="twitter:image"]')
-        if twitter_image and twitter_image.get('content'):
-            img_url = twitter_image.get('content')
-            if img_url.startswith('http'):
-                return img_url
+        if meta.twitter_image.startswith('http'):
+            return meta.twitter_image
         
         # 3. 본문의 첫 번째 이미지
-        article_img = soup.select_one('article img, .post img, .content img, .entry-content img')
-        if article_img and article_img.get('src'):
-            img_url = article_img.get('src')
+        img_url = meta.body_image
+        if img_url:
             if img_url.startswith('http'):
                 return img_url
             elif img_url.startswith('//'):
@@ -162,28 +170,16 @@ class CategoryCrawler:
         
         return ''
     
-    def extract_summary(self, soup: BeautifulSoup, content: str = '') -> str:
+    def extract_summary(self, meta: PageMetadata) -> str:
         """요약 추출 (meta description → 본문 첫 2-3문장)"""
         # 1. meta description
-        meta_desc = soup.select_one('meta[name="description"], meta[property="og:description"]')
-        if meta_desc and meta_desc.get('content'):
-            desc = meta_desc.get('content').strip()
-            if len(desc) >= 80:
-                return self.clean_text(desc[:160])
-        
-        # 2. 본문에서 추출
-        if content:
-            # 불필요한 태그 제거
-            for tag in soup(['script', 'style', 'nav', 'header', 'footer', 'aside', 'advertisement']):
-                tag.decompose()
-            
-            # 본문 찾기
-            article_body = soup.select_one('article, .post-content, .entry-content, .article-body, .content')
-            if article_body:
-                text = article_body.get_text(separator=' ', strip=True)
-            else:
-                text = soup.get_text(separator=' ', strip=True)
-            
+        desc = meta.meta_description or meta.og_description
+        if len(desc) >= 80:
+            return self.clean_text(desc[:160])
+        
+        # 2. 본문에서 추출 (script/style/nav 등 제거 후 본문 영역 텍스트)
+        text = meta.body_text
+        if text:
             # 첫 2-3문장 추출
             sentences = re.split(r'[.!?]\s+', text)
             summary = ''
@@ -209,31 +205,30 @@ class CategoryCrawler:
         text = text.replace('&nbsp;', ' ').replace('&amp;', '&')
         return text.strip()
     
-    def parse_date(self, soup: BeautifulSoup, url: str) -> Optional[datetime]:
+    def parse_date(self, meta: PageMetadata, url: str) -> Optional[datetime]:
         """날짜 파싱 (다양한 소스 시도)"""
-        # 1. og:published_time
-        og_date = soup.select_one('meta[property="article:published_time"]')
-        if og_date and og_date.get('content'):
-            try:
-                return datetime.fromisoformat(og_date.get('content').replace('Z', '+00:00'))
-            except:
-                pass
-        
-        # 2. time 태그
-        time_tag = soup.select_one('time[datetime]')
-        if time_tag:
-            try:
-                return datetime.fromisoformat(time_tag.get('datetime').replace('Z', '+00:00'))
-            except:
-                pass
+        # 1. og:published_time → 2. time 태그
+        host = urlparse(url).netloc
+        for value in (meta.published_time, meta.time_datetime):
+            published_at = parse_date(value, host)
+            if published_at:
+                return published_at
+        
+        # 3. 날짜 후보 영역 (JSON-LD/time/.date/글 머리/제목 주변, 우선순위 순으로 첫 번째 날짜)
+        if DATE_SCAN_MODE != 'full':
+            for text in meta.date_regions:
+                published_at = parse_date(text)
+                if published_at:
+                    return published_at
+            return None
         
-        # 3. 날짜 패턴 찾기
+        # 3'. 문서 전체에서 날짜 패턴 찾기
         date_patterns = [
             r'(\d{4})[-./](\d{1,2})[-./](\d{1,2})',
             r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일'
         ]
         
-        text = soup.get_text()
+        text = meta.page_text
         for pattern in date_patterns:
             match = re.search(pattern, text)
             if match:
@@ -273,35 +268,26 @@ class CategoryCrawler:
     def crawl_article_details(self, url: str) -> Optional[Dict]:
         """기사 상세 정보 크롤링"""
         try:
-            response = self.fetch_with_retry(url)
-            if not response:
+            meta = self.page_metadata.fetch(url)
+            if not meta:
                 return None
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # 제목 추출
-            title = ''
-            og_title = soup.select_one('meta[property="og:title"]')
-            if og_title and og_title.get('content'):
-                title = og_title.get('content').strip()
-            else:
-                title_tag = soup.select_one('title, h1, .title')
-                if title_tag:
-                    title = title_tag.get_text(strip=True)
+            # 제목 추출 (og:title → title/h1/.title)
+            title = meta.title
             
             if not title or len(title) < 5:
                 return None
             
             # 이미지 추출
-            image_url = self.extract_image(soup, url)
+            image_url = self.extract_image(meta, url)
             
             # 요약 추출
-            summary = self.extract_summary(soup, response.text)
+            summary = self.extract_summary(meta)
             if not summary or len(summary) < 50:
                 summary = title[:100] + '...'
             
             # 날짜 추출
-            published_at = self.parse_date(soup, url)
+            published_at = self.parse_date(meta, url)
             if not published_at:
                 published_at = datetime.now()
             
@@ -332,7 +318,8 @@ class CategoryCrawler:
             # 방법 1: RSS 피드 시도
             try:
                 rss_url = f'https://search.naver.com/search.naver?where=post&query={quote(keyword)}&display={min(max_results, 50)}'
-                feed = feedparser.parse(rss_url)
+                response = self.session.get(rss_url, timeout=10)
+                feed = feedparser.parse(response.content)
                 if feed.entries:
                     logger.info(f"[네이버 블로그 RSS] 발견된 항목: {len(feed.entries)}개")
                     for entry in feed.entries[:max_results]:
@@ -440,8 +427,6 @@ class CategoryCrawler:
                             
                             if len(articles) >= max_results:
                                 break
-                            
-                            time.sleep(0.1)
                         
                         except Exception as e:
                             logger.debug(f"[네이버 블로그 HTML] 항목 파싱 오류: {e}")
@@ -501,8 +486,6 @@ class CategoryCrawler:
                     })
                     
                     logger.debug(f"[다음 블로그] 수집: {title[:30]}...")
-                    
-                    time.sleep(0.2)
                 
                 except Exception as e:
                     logger.error(f"[다음 블로그] 항목 파싱 오류: {e}")
@@ -568,8 +551,6 @@ class CategoryCrawler:
                     })
                     
                     logger.debug(f"[티스토리] 수집: {title[:30]}...")
-                    
-                    time.sleep(0.2)
                 
                 except Exception as e:
                     logger.error(f"[티스토리] 항목 파싱 오류: {e}")
@@ -582,11 +563,13 @@ class CategoryCrawler:
         
         return articles
     
-    def remove_duplicates(self, articles: List[Dict]) -> List[Dict]:
-        """중복 제거 (URL 정규화 + 제목 유사도)"""
+    def remove_duplicates(self, articles: List[Dict], strategy: Optional[str] = None) -> List[Dict]:
+        """중복 제거 (URL 정규화 + 제목 유사도)
+        
+        제목 유사도 전략은 title_index.STRATEGIES ('minhash' 기본, 'numpy' 일괄 코사인).
+        """
         seen_urls: Set[str] = set()
-        seen_titles: Set[str] = set()
-        unique_articles = []
+        candidates = []
         
         for article in articles:
             # URL 정규화
@@ -596,18 +579,12 @@ class CategoryCrawler:
             if normalized_url in seen_urls:
                 continue
             
-            # 제목 유사도 체크
-            title = article.get('title', '').lower().strip()
-            is_duplicate = False
-            for seen_title in seen_titles:
-                if self.title_similarity(title, seen_title) > 0.85:
-                    is_duplicate = True
-                    break
-            
-            if not is_duplicate:
-                seen_urls.add(normalized_url)
-                seen_titles.add(title)
-                unique_articles.append(article)
+            seen_urls.add(normalized_url)
+            candidates.append(article)
+        
+        # 제목 유사도 체크 (비슷한 제목 중 먼저 나온 기사만 남김)
+        keep = unique_title_mask([a.get('title', '') for a in candidates], strategy)
+        unique_articles = [article for article, kept in zip(candidates, keep) if kept]
         
         logger.info(f"[중복 제거] {len(articles)}개 → {len(unique_articles)}개")
         return unique_articles
@@ -658,19 +635,16 @@ class CategoryCrawler:
                     articles = self.crawl_naver_blog(keyword, max_results=8)
                     all_articles.extend(articles)
                     logger.info(f"[네이버 블로그] {keyword}: {len(articles)}개 수집")
-                    time.sleep(0.5)  # 도메인별 속도 제한
                 
                 if 'daum_blog' in sources:
                     articles = self.crawl_daum_blog(keyword, max_results=8)
                     all_articles.extend(articles)
                     logger.info(f"[다음 블로그] {keyword}: {len(articles)}개 수집")
-                    time.sleep(0.5)
                 
                 if 'tistory' in sources:
                     articles = self.crawl_tistory(keyword, max_results=8)
                     all_articles.extend(articles)
                     logger.info(f"[티스토리] {keyword}: {len(articles)}개 수집")
-                    time.sleep(0.5)
             
             except Exception as e:
                 logger.error(f"[키워드 오류] {keyword}: {e}", exc_info=True)
@@ -0,0 +1,269 @@
+"""카테고리 새로고침 작업 큐 (백그라운드 스레드, 카테고리별 single-flight)
+
+/api/news/refresh는 크롤링(블로킹, 수십 초)을 이벤트 루프에서 직접 돌리지 않고 작업으로
+제출한 뒤 작업 id를 돌려준다. 같은 카테고리 작업이 대기/실행 중이면 새로 만들지 않고 그
+작업에 합류한다. 끝난 작업은 CRAWL_JOB_KEEP개까지 남겨 두고 /api/jobs/{id}로 조회한다.
+
+CrawlJobQueue는 API 프로세스 안에서 크롤링까지 실행한다. API를 조회 전용(API_MODE=serve)으로
+띄우면 StoreJobQueue가 작업을 저장소 DB의 refresh_jobs 테이블에 넣고, 별도 크롤러 워커
+(crawler_worker.py)가 claim()으로 가져가 실행한 뒤 finish()로 결과를 적는다.
+"""
+import asyncio
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CRAWL_JOB_WORKERS = int(os.getenv('CRAWL_JOB_WORKERS', '2'))  # 동시에 실행하는 새로고침 작업 수
+CRAWL_JOB_KEEP = int(os.getenv('CRAWL_JOB_KEEP', '200'))  # 조회용으로 남겨 두는 작업 수
+CRAWL_JOB_TIMEOUT = float(os.getenv('CRAWL_JOB_TIMEOUT', '1800'))  # 워커가 이 시간 넘게 못 끝낸 작업은 실패 처리
+CRAWL_JOB_POLL = float(os.getenv('CRAWL_JOB_POLL', '1.0'))  # StoreJobQueue 상태 확인 간격 (초)
+
+
+@dataclass
+class CrawlJob:
+    """새로고침 작업 하나 (status: queued → running → done | failed)"""
+    id: str
+    category: str
+    status: str = 'queued'
+    submitted_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    count: Optional[int] = None
+    error: str = ''
+    joined: int = 0
+    future: Optional[Future] = field(default=None, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ('done', 'failed')
+
+    def to_dict(self) -> Dict:
+        return {
+            'id': self.id,
+            'category': self.category,
+            'status': self.status,
+            'submitted_at': self.submitted_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'count': self.count,
+            'error': self.error,
+            'joined': self.joined,
+        }
+
+
+class CrawlJobQueue:
+    """run(category) -> 저장된 기사 수 를 백그라운드에서 실행하는 작업 큐"""
+
+    def __init__(self, run: Callable[[str], int], max_workers: int = CRAWL_JOB_WORKERS, keep: int = CRAWL_JOB_KEEP):
+        self.run = run
+        self.keep = keep
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='crawl-job')
+        self._jobs: 'OrderedDict[str, CrawlJob]' = OrderedDict()
+        self._inflight: Dict[str, CrawlJob] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, category: str) -> Tuple[CrawlJob, bool]:
+        """작업 제출, (작업, 새로 만들었는지) 반환 (진행 중인 같은 카테고리 작업이 있으면 그 작업)"""
+        with self._lock:
+            job = self._inflight.get(category)
+            if job is not None:
+                job.joined += 1
+                return job, False
+            job = CrawlJob(id=uuid.uuid4().hex[:12], category=category)
+            self._inflight[category] = job
+            self._jobs[job.id] = job
+            while len(self._jobs) > self.keep:
+                oldest = next(iter(self._jobs.values()))
+                if not oldest.finished:
+                    break
+                self._jobs.popitem(last=False)
+            job.future = self._executor.submit(self._execute, job)
+        logger.info(f"[새로고침 작업] {job.id} {category} 제출")
+        return job, True
+
+    def _execute(self, job: CrawlJob) -> CrawlJob:
+        job.status = 'running'
+        job.started_at = time.time()
+        try:
+            job.count = self.run(job.category)
+            job.status = 'done'
+        except Exception as e:
+            job.error = str(e)
+            job.status = 'failed'
+            logger.error(f"[새로고침 작업] {job.id} {job.category} 실패: {e}", exc_info=True)
+        finally:
+            job.finished_at = time.time()
+            with self._lock:
+                if self._inflight.get(job.category) is job:
+                    del self._inflight[job.category]
+        logger.info(f"[새로고침 작업] {job.id} {job.category} {job.status} "
+                    f"({job.finished_at - job.started_at:.1f}초, 합류 {job.joined}회)")
+        return job
+
+    def get(self, job_id: str) -> Optional[CrawlJob]:
+        return self._jobs.get(job_id)
+
+    def inflight(self) -> Dict[str, str]:
+        """카테고리 → 진행 중인 작업 id"""
+        with self._lock:
+            return {category: job.id for category, job in self._inflight.items()}
+
+    async def wait(self, job: CrawlJob, timeout: float) -> bool:
+        """이벤트 루프를 막지 않고 작업 완료를 최대 timeout초 기다림, 끝났으면 True"""
+        if job.finished:
+            return True
+        try:
+            await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(job.future)), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_JOB_COLUMNS = ('id', 'category', 'status', 'submitted_at', 'started_at', 'finished_at', 'count', 'error', 'joined')
+
+
+class StoreJobQueue:
+    """저장소 DB(refresh_jobs 테이블)를 통한 프로세스 간 작업 큐 (CrawlJobQueue와 같은 조회 인터페이스)"""
+
+    def __init__(self, path: str, keep: int = CRAWL_JOB_KEEP, timeout: float = CRAWL_JOB_TIMEOUT,
+                 poll: float = CRAWL_JOB_POLL):
+        self.path = path
+        self.keep = keep
+        self.timeout = timeout
+        self.poll = poll
+        self.worker = f"{socket.gethostname()}:{os.getpid()}"
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=10, isolation_level=None, check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS refresh_jobs (
+                id TEXT PRIMARY KEY,
+                category TEXT NOT NULL,
+                status TEXT NOT NULL,
+                submitted_at REAL NOT NULL,
+                started_at REAL,
+                finished_at REAL,
+                count INTEGER,
+                error TEXT NOT NULL DEFAULT '',
+                joined INTEGER NOT NULL DEFAULT 0,
+                worker TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_refresh_jobs_status ON refresh_jobs (status, submitted_at);
+        """)
+
+    def _write(self, fn):
+        """BEGIN IMMEDIATE 트랜잭션 안에서 fn(conn) 실행"""
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                result = fn(self._conn)
+                self._conn.execute('COMMIT')
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+        return result
+
+    def _select(self, where: str, params=()) -> List[CrawlJob]:
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(_JOB_COLUMNS)} FROM refresh_jobs WHERE {where}", params
+            ).fetchall()
+        return [CrawlJob(**dict(zip(_JOB_COLUMNS, row))) for row in rows]
+
+    def submit(self, category: str) -> Tuple[CrawlJob, bool]:
+        """작업 등록, (작업, 새로 만들었는지) 반환 (대기/실행 중인 같은 카테고리 작업이 있으면 그 작업)"""
+        def insert(conn: sqlite3.Connection):
+            row = conn.execute(
+                "SELECT id FROM refresh_jobs WHERE category = ? AND status IN ('queued', 'running') "
+                "ORDER BY submitted_at LIMIT 1", (category,)
+            ).fetchone()
+            if row is not None:
+                conn.execute('UPDATE refresh_jobs SET joined = joined + 1 WHERE id = ?', (row[0],))
+                return row[0], False
+            job_id = uuid.uuid4().hex[:12]
+            conn.execute('INSERT INTO refresh_jobs (id, category, status, submitted_at) VALUES (?, ?, ?, ?)',
+                         (job_id, category, 'queued', time.time()))
+            conn.execute(
+                "DELETE FROM refresh_jobs WHERE status IN ('done', 'failed') AND id NOT IN "
+                "(SELECT id FROM refresh_jobs ORDER BY submitted_at DESC LIMIT ?)", (self.keep,)
+            )
+            return job_id, True
+
+        job_id, created = self._write(insert)
+        if created:
+            logger.info(f"[새로고침 작업] {job_id} {category} 등록 (크롤러 워커 대기)")
+        return self.get(job_id), created
+
+    def claim(self) -> Optional[CrawlJob]:
+        """가장 오래 기다린 작업 하나를 running으로 가져감 (워커 쪽), 없으면 None
+
+        timeout 넘게 running인 작업은 워커가 죽은 것으로 보고 실패 처리한다.
+        """
+        def take(conn: sqlite3.Connection):
+            now = time.time()
+            conn.execute(
+                "UPDATE refresh_jobs SET status = 'failed', finished_at = ?, error = ? "
+                "WHERE status = 'running' AND started_at < ?",
+                (now, '크롤러 워커 응답 없음', now - self.timeout)
+            )
+            row = conn.execute(
+                "SELECT id FROM refresh_jobs WHERE status = 'queued' ORDER BY submitted_at LIMIT 1"
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE refresh_jobs SET status = 'running', started_at = ?, worker = ? WHERE id = ?",
+                         (now, self.worker, row[0]))
+            return row[0]
+
+        job_id = self._write(take)
+        return self.get(job_id) if job_id else None
+
+    def finish(self, job: CrawlJob, count: Optional[int] = None, error: str = ''):
+        """워커가 실행 결과 기록"""
+        status = 'failed' if error else 'done'
+        self._write(lambda conn: conn.execute(
+            'UPDATE refresh_jobs SET status = ?, finished_at = ?, count = ?, error = ? WHERE id = ?',
+            (status, time.time(), count, error, job.id)
+        ))
+
+    def get(self, job_id: str) -> Optional[CrawlJob]:
+        jobs = self._select('id = ?', (job_id,))
+        return jobs[0] if jobs else None
+
+    def inflight(self) -> Dict[str, str]:
+        """카테고리 → 대기/실행 중인 작업 id"""
+        jobs = self._select("status IN ('queued', 'running') ORDER BY submitted_at DESC")
+        return {job.category: job.id for job in jobs}
+
+    async def wait(self, job: CrawlJob, timeout: float) -> bool:
+        """poll초마다 저장소를 확인하며 최대 timeout초 기다림, job을 최신 상태로 갱신하고 끝났으면 True
+
+        저장소 조회는 이벤트 루프를 막지 않도록 스레드에서 실행한다.
+        """
+        deadline = time.monotonic() + timeout
+        while not job.finished:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            await asyncio.sleep(min(self.poll, remaining))
+            latest = await asyncio.to_thread(self.get, job.id)
+            if latest is None:
+                return False
+            job.__dict__.update({name: getattr(latest, name) for name in _JOB_COLUMNS})
+        return True
+
+    def shutdown(self):
+        with self._lock:
+            self._conn.close()
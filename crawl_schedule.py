@@ -0,0 +1,134 @@
+"""카테고리별 적응형 크롤링 주기
+
+카테고리마다 새 기사가 나오는 속도가 다르다 (스포츠/IT는 몇 시간이면 바뀌고, 집/자기계발은
+하루에 몇 개 안 된다). 크롤링할 때마다 새 기사 수(게시 중인 회차에 없던 URL 수)를 기록해
+시간당 새 기사 수(rate)를 지수 평균으로 추정하고, 한 번에 CRAWL_TARGET_NEW개쯤 새로
+나올 만큼의 간격으로 다음 크롤링을 잡는다. 간격은 CRAWL_INTERVAL_MIN~MAX 사이로 자르고,
+한 번에 두 배 넘게 늘리지는 않는다 (조용한 회차 한 번으로 최대 간격까지 가지 않도록).
+
+상태는 기사 저장소 DB의 crawl_schedule 테이블에 두므로 재시작해도 유지되고, 조회 전용 API도
+/health에서 카테고리별 다음 크롤링 예정 시각을 보여 줄 수 있다.
+"""
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CRAWL_INTERVAL_MIN = float(os.getenv('CRAWL_INTERVAL_MIN', str(60 * 60)))  # 최소 간격 (초)
+CRAWL_INTERVAL_MAX = float(os.getenv('CRAWL_INTERVAL_MAX', str(24 * 60 * 60)))  # 최대 간격 (초)
+CRAWL_INTERVAL_START = float(os.getenv('CRAWL_INTERVAL_START', str(9 * 60 * 60)))  # 기록이 없을 때 간격 (하루 2~3회)
+CRAWL_TARGET_NEW = float(os.getenv('CRAWL_TARGET_NEW', '5'))  # 크롤링 한 번에 기대하는 새 기사 수
+CRAWL_RATE_SMOOTHING = 0.5  # rate 지수 평균에서 이번 관측의 비중
+CRAWL_SCHEDULE_TICK = float(os.getenv('CRAWL_SCHEDULE_TICK', '60'))  # 예정 시각 확인 간격 (초)
+
+
+def next_interval(interval: float, rate: Optional[float], new_count: int, elapsed: float,
+                  target: float = CRAWL_TARGET_NEW, low: float = CRAWL_INTERVAL_MIN,
+                  high: float = CRAWL_INTERVAL_MAX) -> Tuple[float, float]:
+    """이번 크롤링 결과(elapsed초 동안 새 기사 new_count개) → (다음 간격, 시간당 새 기사 수 평균)"""
+    observed = new_count / max(elapsed / 3600, 1 / 60)
+    rate = observed if rate is None else CRAWL_RATE_SMOOTHING * observed + (1 - CRAWL_RATE_SMOOTHING) * rate
+    wanted = target / rate * 3600 if rate > 0 else high
+    return max(low, min(high, wanted, interval * 2)), rate
+
+
+class CrawlSchedule:
+    """카테고리 → 간격/rate/마지막 크롤링/다음 예정 시각"""
+
+    def __init__(self, path: str, start_interval: float = CRAWL_INTERVAL_START):
+        self.path = path
+        self.start_interval = start_interval
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=10, isolation_level=None, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS crawl_schedule (
+                category TEXT PRIMARY KEY,
+                interval REAL NOT NULL,
+                rate REAL,
+                last_at REAL,
+                last_new INTEGER,
+                next_at REAL NOT NULL,
+                runs INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+
+    def _write(self, fn):
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                result = fn(self._conn)
+                self._conn.execute('COMMIT')
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+        return result
+
+    def seed(self, categories: Iterable[str], last_saved: Dict[str, float]):
+        """기록이 없는 카테고리 등록 (마지막 저장 + 기본 간격, 저장된 적이 없으면 바로)"""
+        now = time.time()
+        rows = [(category, self.start_interval, last_saved.get(category),
+                 last_saved[category] + self.start_interval if category in last_saved else now)
+                for category in categories]
+        self._write(lambda conn: conn.executemany(
+            'INSERT OR IGNORE INTO crawl_schedule (category, interval, last_at, next_at) VALUES (?, ?, ?, ?)', rows
+        ))
+
+    def due(self, now: Optional[float] = None) -> List[str]:
+        """예정 시각이 지난 카테고리 (오래 밀린 순)"""
+        now = now or time.time()
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT category FROM crawl_schedule WHERE next_at <= ? ORDER BY next_at', (now,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def claim(self, categories: List[str], now: Optional[float] = None):
+        """크롤링을 시작한 카테고리를 한 간격 뒤로 미룸 (실패해도 다음 확인 때 다시 돌지 않도록)"""
+        now = now or time.time()
+        self._write(lambda conn: conn.executemany(
+            'UPDATE crawl_schedule SET next_at = ? + interval WHERE category = ?',
+            [(now, category) for category in categories]
+        ))
+
+    def record(self, category: str, new_count: Optional[int], now: Optional[float] = None) -> float:
+        """크롤링 결과 기록 후 다음 예정 시각 반환 (new_count가 None이면 간격은 그대로)"""
+        now = now or time.time()
+
+        def update(conn: sqlite3.Connection):
+            row = conn.execute('SELECT interval, rate, last_at FROM crawl_schedule WHERE category = ?',
+                               (category,)).fetchone()
+            interval, rate, last_at = row if row else (self.start_interval, None, None)
+            if new_count is not None and last_at is not None:
+                interval, rate = next_interval(interval, rate, new_count, now - last_at)
+            conn.execute(
+                'INSERT INTO crawl_schedule (category, interval, rate, last_at, last_new, next_at, runs) '
+                'VALUES (?, ?, ?, ?, ?, ?, 1) ON CONFLICT(category) DO UPDATE SET interval = excluded.interval, '
+                'rate = excluded.rate, last_at = excluded.last_at, last_new = excluded.last_new, '
+                'next_at = excluded.next_at, runs = runs + 1',
+                (category, interval, rate, now, new_count, now + interval),
+            )
+            return interval
+
+        interval = self._write(update)
+        logger.info(f"[크롤링 주기] {category}: 새 기사 {new_count}개 → 다음 크롤링 {interval / 3600:.1f}시간 뒤")
+        return now + interval
+
+    def next_at(self) -> Optional[float]:
+        """가장 가까운 예정 시각"""
+        with self._lock:
+            row = self._conn.execute('SELECT MIN(next_at) FROM crawl_schedule').fetchone()
+        return row[0]
+
+    def plan(self) -> Dict[str, Dict]:
+        """카테고리 → {'next_at', 'interval', 'rate', 'last_at', 'last_new', 'runs'} (예정 시각 순)"""
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT category, next_at, interval, rate, last_at, last_new, runs FROM crawl_schedule ORDER BY next_at'
+            ).fetchall()
+        return {category: {'next_at': next_at, 'interval': interval, 'rate': rate, 'last_at': last_at,
+                           'last_new': last_new, 'runs': runs}
+                for category, next_at, interval, rate, last_at, last_new, runs in rows}
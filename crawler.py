@@ -2,10 +2,11 @@ import requests
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 from typing import List, Dict
-import re
 import feedparser
 import logging
 
+from date_parser import parse_date
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -21,31 +22,15 @@ class SportsCrawler:
     
     def is_today_article(self, date_str: str) -> bool:
         """기사가 오늘 날짜인지 확인"""
-        try:
-            if not date_str:
-                return False
-            
-            # 다양한 날짜 형식 처리
-            date_patterns = [
-                r'(\d{4})[-./](\d{1,2})[-./](\d{1,2})',  # 2024-01-01, 2024.01.01
-                r'(\d{1,2})시간 전',  # N시간 전
-                r'(\d{1,2})분 전',   # N분 전
-            ]
-            
-            for pattern in date_patterns:
-                match = re.search(pattern, date_str)
-                if match:
-                    if '시간 전' in date_str or '분 전' in date_str:
-                        return True
-                    else:
-                        year, month, day = match.groups()
-                        article_date = datetime(int(year), int(month), int(day)).date()
-                        return article_date == self.today
-            
-            return False
-        except Exception as e:
-            logger.error(f"날짜 파싱 오류: {e}")
+        # 2024-01-01, 2024.01.01, 2024년 1월 1일, N시간 전, N분 전 등 (date_parser)
+        published_at = parse_date(date_str)
+        if not published_at:
             return False
+        
+        # 'N시간 전', 'N분 전'은 오늘 기사로 본다
+        if '시간 전' in date_str or '분 전' in date_str:
+            return True
+        return published_at.date() == self.today
     
     def crawl_naver_sports(self) -> List[Dict]:
         """네이버 스포츠 뉴스 크롤링"""
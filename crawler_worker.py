@@ -0,0 +1,373 @@
+"""크롤러 워커 (스케줄 크롤링/워밍업/새로고침 작업 실행)
+
+크롤링(BeautifulSoup 파싱)은 CPU를 많이 써서 API와 같은 프로세스에서 돌면 GIL을 두고
+요청 처리와 경쟁한다. 이 모듈은 크롤링에 필요한 것(real_crawler, async_crawler, apscheduler)을
+모두 맡고, 결과는 공유 기사 저장소(article_store)에만 쓴다.
+
+- API_MODE=all (기본): main.py가 CrawlerWorker를 같은 프로세스에서 띄운다 (이전과 같은 동작)
+- API_MODE=serve: API는 조회만 하고, 크롤링은 이 파일을 따로 실행한 프로세스가 한다
+
+API 프로세스는 저장소 DB/WAL mtime 확인(news_cache)으로 새 회차를 1초 안에 반영한다.
+CRAWLER_NOTIFY_URL(예: http://127.0.0.1:8000/api/internal/invalidate)과 CRAWLER_NOTIFY_TOKEN을
+주면 카테고리를 저장할 때마다 그 주소로 알려 API 캐시를 바로 비운다 (실패해도 크롤링에는
+영향 없음, 토큰이 없으면 알리지 않는다).
+스케줄 크롤링은 카테고리마다 새 기사 수에 맞춰 다음 시각을 잡는다 (crawl_schedule).
+조회 전용 API가 받은 /api/news/refresh 작업은 저장소의 refresh_jobs 테이블(crawl_jobs.StoreJobQueue)을
+통해 이 워커가 가져가 실행한다.
+
+    python crawler_worker.py                      # 데몬 (스케줄 크롤링 + 새로고침 작업)
+    python crawler_worker.py --once               # 전체 카테고리 한 번 크롤링 후 종료
+    python crawler_worker.py --once -c it -c sports
+"""
+import logging
+import os
+import threading
+import time
+import urllib.request
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+import pytz
+from apscheduler.schedulers.background import BackgroundScheduler
+
+from article import Article
+from article_store import ArticleStore
+from async_crawler import crawl_categories, run_sync
+from categories import CATEGORIES
+from crawl_schedule import CRAWL_SCHEDULE_TICK, CrawlSchedule
+from crawl_jobs import CRAWL_JOB_POLL, CRAWL_JOB_WORKERS, StoreJobQueue
+from leader import LEADER_HEARTBEAT, LeaderLease
+from real_crawler import RealNewsCrawler
+from response_body import render_news
+from warmup import WarmupState, follow, order_by_demand
+
+logger = logging.getLogger(__name__)
+
+# 한국 시간대
+KST = pytz.timezone('Asia/Seoul')
+
+# 전체 크롤링 동시성 설정 (CRAWL_PARALLEL=0 이면 카테고리 순차 실행)
+CRAWL_PARALLEL = os.getenv('CRAWL_PARALLEL', '1') != '0'
+CRAWL_MAX_REQUESTS = int(os.getenv('CRAWL_MAX_REQUESTS', '24'))  # 전체 동시 HTTP 요청 수
+CRAWL_PER_CATEGORY_REQUESTS = int(os.getenv('CRAWL_PER_CATEGORY_REQUESTS', '6'))  # 카테고리별 동시 HTTP 요청 수
+
+# 저장 후 API 캐시를 바로 비우도록 알릴 주소와 토큰 (둘 다 있어야 알림, 없으면 API가 파일 mtime으로 알아챔)
+CRAWLER_NOTIFY_URL = os.getenv('CRAWLER_NOTIFY_URL', '')
+CRAWLER_NOTIFY_TOKEN = os.getenv('CRAWLER_NOTIFY_TOKEN', '')
+
+
+class CrawlerWorker:
+    """크롤러 + 스케줄러 + 리더 lease (저장소에 회차를 저장/게시)"""
+
+    def __init__(self, store: ArticleStore, warmup: Optional[WarmupState] = None,
+                 on_crawled: Optional[Callable[[], None]] = None, notify_url: str = CRAWLER_NOTIFY_URL):
+        self.store = store
+        self.warmup = warmup or WarmupState()
+        self.on_crawled = on_crawled
+        if notify_url and not CRAWLER_NOTIFY_TOKEN:
+            logger.warning("[저장 알림] CRAWLER_NOTIFY_TOKEN이 없어 API에 알리지 않습니다 (파일 mtime으로 반영)")
+            notify_url = ''
+        self.notify_url = notify_url
+        self.crawler = RealNewsCrawler()
+        self.scheduler = BackgroundScheduler(timezone=KST)
+        # 여러 프로세스(uvicorn --workers, 크롤러 워커 여러 개) 중 스케줄 크롤링/워밍업을 실행할 리더
+        self.lease = LeaderLease(store.path)
+        # 카테고리별 적응형 크롤링 주기 (저장소 DB 공유)
+        self.schedule = CrawlSchedule(store.path)
+        self._stop = threading.Event()
+        self._job_threads: List[threading.Thread] = []
+
+    def notify(self, category: str):
+        """API 프로세스에 저장 알림 (실패는 로그만)"""
+        if not self.notify_url:
+            return
+        request = urllib.request.Request(self.notify_url, data=category.encode('utf-8'), method='POST',
+                                         headers={'X-Notify-Token': CRAWLER_NOTIFY_TOKEN})
+        try:
+            urllib.request.urlopen(request, timeout=2).close()
+        except Exception as e:
+            logger.warning(f"[저장 알림] {self.notify_url} 실패: {e}")
+
+    def save_news(self, category: str, articles: List[Dict]):
+        """뉴스 데이터를 저장소에 새 회차로 저장 후 게시 (기사가 0개면 이전 게시 회차 유지)"""
+        try:
+            # 게시 회차와 비교한 새 기사 수 (기사가 없으면 실패일 수 있어 주기 계산에 넣지 않음)
+            new_count = self.store.count_new(category, articles) if articles else None
+            data = {
+                'articles': articles,
+                'cached_at': datetime.now(KST).isoformat(),
+                'category': category,
+                'category_name': CATEGORIES.get(category, {}).get('name', category)
+            }
+            # 응답 본문(JSON + gzip/brotli + ETag)을 저장 시점에 한 번만 만든다
+            self.store.save(
+                category,
+                data['category_name'],
+                articles,
+                cached_at=data['cached_at'],
+                body=render_news(data)
+            )
+            logger.info(f"[저장] {category}: {len(articles)}개 기사 저장 완료")
+        except Exception as e:
+            logger.error(f"[저장] {category} 오류: {e}", exc_info=True)
+            return
+        self.notify(category)
+        try:
+            self.schedule.record(category, new_count)
+        except Exception as e:
+            logger.error(f"[크롤링 주기] {category} 기록 오류: {e}", exc_info=True)
+
+    @staticmethod
+    def format_articles(category: str, articles: List[Article]) -> List[Dict]:
+        """크롤링 결과를 API 응답 형태로 포맷팅 (샘플 URL 제외, 저장 직전 한 번만 직렬화)"""
+        formatted_articles = []
+        for i, article in enumerate(articles):
+            url = article.url
+            if 'example.com' in url or not url or url.startswith('https://example'):
+                continue
+
+            formatted = {"id": f"{category}_{i}", **article.to_dict()}
+            if not formatted['publishedAt']:
+                formatted['publishedAt'] = datetime.now(KST).isoformat()
+            formatted_articles.append(formatted)
+        return formatted_articles
+
+    def save_crawled_category(self, category: str, articles: List[Article]) -> int:
+        """크롤링 결과 포맷팅 후 저장, 저장된 기사 수 반환"""
+        formatted_articles = self.format_articles(category, articles)
+        self.save_news(category, formatted_articles)
+        logger.info(f"[크롤링 완료] {category}: {len(formatted_articles)}개 기사")
+        return len(formatted_articles)
+
+    def refresh_category(self, category: str) -> int:
+        """카테고리 하나 크롤링 + 저장 (새로고침 작업), 저장된 기사 수 반환
+
+        작업마다 새 회차(3일 기준 시간, 메타데이터 메모)로 크롤링한다.
+        """
+        logger.info(f"[수동 새로고침] {category} 카테고리 크롤링 시작...")
+        articles = self.crawler.new_run().crawl_category(category)
+        return self.save_crawled_category(category, articles)
+
+    def crawl_all_categories(self, parallel: bool = CRAWL_PARALLEL, categories: Optional[List[str]] = None,
+                             on_saved=None):
+        """모든 카테고리(또는 지정한 카테고리) 크롤링 (스케줄링/워밍업용)
+
+        parallel 모드에서는 모든 카테고리를 동시에 크롤링하고 (전체/카테고리별 동시 요청 수 제한),
+        각 카테고리는 끝나는 즉시 저장소에 저장된다. 카테고리는 주어진 순서대로 시작한다.
+        on_saved(category)는 카테고리 저장 직후 호출된다.
+        """
+        # 이 크롤링만의 회차 (동시에 도는 새로고침 작업의 회차 상태를 건드리지 않는다)
+        crawler = self.crawler.new_run()
+        categories = list(categories or CATEGORIES.keys())
+        logger.info("=" * 60)
+        logger.info(f"[스케줄 크롤링 시작] {len(categories)}개 카테고리 크롤링 시작")
+        logger.info(f"[시간] {datetime.now(KST).strftime('%Y-%m-%d %H:%M:%S')}")
+
+        started = time.perf_counter()
+
+        def save_category(category: str, articles: List[Article]):
+            self.save_crawled_category(category, articles)
+            if on_saved:
+                on_saved(category)
+
+        if parallel:
+            logger.info(f"[병렬 크롤링] 전체 동시 요청: {CRAWL_MAX_REQUESTS}, 카테고리별: {CRAWL_PER_CATEGORY_REQUESTS}")
+            results = run_sync(crawl_categories(
+                crawler,
+                categories,
+                on_category_done=save_category,
+                max_requests=CRAWL_MAX_REQUESTS,
+                per_category_requests=CRAWL_PER_CATEGORY_REQUESTS
+            ))
+        else:
+            results = {}
+            for category in categories:
+                category_started = time.perf_counter()
+                result = {'count': 0, 'elapsed': 0.0, 'error': None}
+                try:
+                    logger.info(f"[크롤링] {category} 시작...")
+                    articles = crawler.crawl_category(category)
+                    result['count'] = len(articles)
+                    save_category(category, articles)
+                except Exception as e:
+                    result['error'] = e
+                    logger.error(f"[크롤링 실패] {category}: {e}", exc_info=True)
+                result['elapsed'] = time.perf_counter() - category_started
+                results[category] = result
+
+        total_elapsed = time.perf_counter() - started
+        success_count = sum(1 for r in results.values() if r['error'] is None)
+        fail_count = len(results) - success_count
+
+        for category in categories:
+            result = results.get(category)
+            if result:
+                status = '성공' if result['error'] is None else f"실패 ({result['error']})"
+                logger.info(f"[카테고리 소요 시간] {category}: {result['elapsed']:.1f}초, {result['count']}개, {status}")
+
+        logger.info(f"[RSS 파이프라인] {crawler.pipeline_stats.summary()}")
+        logger.info(f"[메타데이터 캐시] {crawler.metadata_cache.stats}")
+        logger.info(f"[fingerprint] {crawler.fingerprints.stats}")
+        logger.info(f"[스케줄 크롤링 완료] 성공: {success_count}개, 실패: {fail_count}개, 총 소요 시간: {total_elapsed:.1f}초")
+        logger.info("=" * 60)
+        if self.on_crawled:
+            self.on_crawled()
+
+    def scheduled_crawl(self):
+        """예정 시각이 지난 카테고리 크롤링 (리더에서만 실행, CRAWL_SCHEDULE_TICK초마다 확인)"""
+        try:
+            if not self.lease.acquire():
+                logger.debug(f"[스케줄 크롤링] 리더가 아니라 건너뜀 (리더: {self.lease.holder()})")
+                return
+            due = self.schedule.due()
+            if due:
+                self.schedule.claim(due)
+                logger.info(f"[스케줄 크롤링] 예정 시각이 지난 {len(due)}개 카테고리: {due}")
+                self.crawl_all_categories(categories=due)
+        except Exception as e:
+            logger.error(f"[스케줄 크롤링] 오류: {e}", exc_info=True)
+
+    def run_warmup(self, categories: List[str]):
+        """워밍업 크롤링 (백그라운드 스레드), 끝나면 ready"""
+        try:
+            self.crawl_all_categories(categories=categories,
+                                      on_saved=lambda category: self.warmup.mark(category, 'done'))
+        except Exception as e:
+            logger.error(f"[워밍업] 오류: {e}", exc_info=True)
+        finally:
+            self.warmup.finish()
+            logger.info(f"[워밍업] 완료: {self.warmup.to_dict()['progress']}")
+
+    def start(self, data_dir: Optional[str] = None):
+        """스케줄러 시작 + (리더면) JSON 이전/워밍업"""
+        # 리더 선출 (리더만 스케줄 크롤링/워밍업/JSON 이전 실행), 모든 프로세스가 heartbeat로 갱신/인계
+        is_leader = self.lease.acquire()
+        self.scheduler.add_job(
+            self.lease.acquire,
+            trigger='interval',
+            seconds=LEADER_HEARTBEAT,
+            id='leader_heartbeat',
+            replace_existing=True
+        )
+
+        self.scheduler.start()
+
+        # 이전 버전의 data/*.json을 저장소로 가져오기 (처음 한 번)
+        if is_leader and data_dir:
+            imported = self.store.migrate_json(data_dir)
+            if imported:
+                logger.info(f"[저장소 이전] JSON 파일 {imported}개를 저장소로 가져왔습니다.")
+
+        # 게시된 데이터가 없는 카테고리만 백그라운드에서 크롤링 (요청이 많았던 카테고리부터)
+        # 서버는 바로 요청을 받고, 카테고리는 끝나는 대로 조회 가능해진다
+        logger.info("[초기 크롤링] 저장된 데이터 확인 중...")
+        counts = self.store.counts()
+        missing = [category for category in CATEGORIES.keys() if not counts.get(category)]
+
+        # 주기 기록이 없는 카테고리는 마지막 저장 + 기본 간격으로 등록 (워밍업 대상은 스케줄 크롤링에서 제외)
+        self.schedule.seed(CATEGORIES.keys(), self.store.last_saved())
+        if missing and is_leader:
+            missing = order_by_demand(missing, self.store.request_counts())
+            logger.info(f"[초기 크롤링] 데이터가 없는 {len(missing)}개 카테고리 백그라운드 크롤링 시작: {missing}")
+            self.schedule.claim(missing)
+            self.warmup.start(missing)
+            threading.Thread(target=self.run_warmup, args=(missing,), name='warmup', daemon=True).start()
+        elif missing:
+            logger.info(f"[초기 크롤링] 리더가 크롤링 중, {len(missing)}개 카테고리 게시 대기")
+            self.warmup.start(missing)
+            threading.Thread(target=follow, args=(self.warmup, missing, self.store.counts),
+                             name='warmup', daemon=True).start()
+        else:
+            self.warmup.start([])
+            logger.info("[초기 크롤링] 저장된 데이터가 있어 스킵합니다.")
+
+        # 카테고리별 예정 시각에 맞춰 크롤링 (새 기사가 많은 카테고리일수록 자주)
+        # 한 번짜리 예약을 이어 붙이면 실행이 늦거나 빠지는 순간 체인이 끊기므로, 계속 도는 interval 작업이
+        # TICK마다 예정 시각을 확인한다 (리더 교체/다른 프로세스의 주기 변경도 다음 확인 때 반영).
+        # 크롤링이 TICK보다 길면 그동안의 확인은 건너뛰고, 밀린 확인은 한 번으로 합친다.
+        self.scheduler.add_job(
+            self.scheduled_crawl,
+            trigger='interval',
+            seconds=CRAWL_SCHEDULE_TICK,
+            next_run_time=datetime.now(KST),
+            id='adaptive_crawl',
+            name='카테고리별 적응형 크롤링',
+            replace_existing=True,
+            misfire_grace_time=None,
+            coalesce=True,
+            max_instances=1
+        )
+        logger.info("✅ 스케줄러 시작 완료 (카테고리별 적응형 크롤링 주기)")
+
+    def serve_jobs(self, queue: StoreJobQueue, workers: int = CRAWL_JOB_WORKERS):
+        """조회 전용 API가 등록한 새로고침 작업을 workers개 스레드에서 가져가 실행"""
+        def loop():
+            while not self._stop.is_set():
+                try:
+                    job = queue.claim()
+                except Exception as e:
+                    logger.error(f"[새로고침 작업] 작업 조회 오류: {e}", exc_info=True)
+                    job = None
+                if job is None:
+                    self._stop.wait(CRAWL_JOB_POLL)
+                    continue
+                logger.info(f"[새로고침 작업] {job.id} {job.category} 실행")
+                try:
+                    queue.finish(job, count=self.refresh_category(job.category))
+                except Exception as e:
+                    logger.error(f"[새로고침 작업] {job.id} {job.category} 실패: {e}", exc_info=True)
+                    queue.finish(job, error=str(e) or type(e).__name__)
+
+        for i in range(workers):
+            thread = threading.Thread(target=loop, name=f'crawl-job-{i}', daemon=True)
+            thread.start()
+            self._job_threads.append(thread)
+
+    def stop(self):
+        """스케줄러/작업 스레드 종료 + lease 반납"""
+        self._stop.set()
+        if self.scheduler.running:
+            self.scheduler.shutdown(wait=False)
+        self.lease.release()
+        logger.info("스케줄러 종료 완료")
+
+
+def main():
+    import argparse
+    import signal
+
+    parser = argparse.ArgumentParser(description='크롤러 워커 (공유 기사 저장소에 저장)')
+    parser.add_argument('--path', default=None, help='기사 저장소 경로 (기본: ARTICLE_STORE_PATH)')
+    parser.add_argument('--once', action='store_true', help='한 번 크롤링하고 종료')
+    parser.add_argument('-c', '--category', action='append', choices=list(CATEGORIES),
+                        help='크롤링할 카테고리 (--once, 여러 번 지정 가능)')
+    parser.add_argument('--data-dir', default='data', help='이전 버전 JSON 파일 위치')
+    parser.add_argument('--notify-url', default=CRAWLER_NOTIFY_URL, help='저장 후 알릴 API 주소')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    store = ArticleStore(args.path) if args.path else ArticleStore()
+    worker = CrawlerWorker(store, notify_url=args.notify_url)
+
+    if args.once:
+        worker.crawl_all_categories(categories=args.category)
+        return
+
+    stopped = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stopped.set())
+    queue = StoreJobQueue(store.path)
+    worker.start(args.data_dir)
+    worker.serve_jobs(queue)
+    logger.info(f"[크롤러 워커] 시작 (저장소: {store.path}, 리더: {worker.lease.is_leader})")
+    try:
+        while not stopped.wait(1):
+            pass
+    except KeyboardInterrupt:
+        pass
+    finally:
+        worker.stop()
+        queue.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,246 @@
+"""발행 시각 문자열 fast-path 파서 (형태 분류 → 전용 파서, 소스별 형식 캐시)
+
+기존 parse_published_date는 ISO → RFC 2822(strptime) → YYYYMMDD → strptime 3종을 차례로
+시도하면서 실패할 때마다 예외를 잡았다. 여기서는 앞 몇 글자만 보고 형태를 한 번 정한 뒤
+미리 컴파일한 정규식 하나로 값을 꺼내 datetime을 만든다. 맞지 않으면 예외 대신 None.
+
+소스(네이버 뉴스 pubDate, 블로그 postdate, 사이트 호스트 등)마다 마지막으로 성공한 형태를
+기억해 두고 다음 값은 분류 없이 그 파서부터 시도한다.
+
+지원 형태:
+    iso       2024-01-01T09:00:00+09:00, 2024-01-01 09:00:00, 2024-01-01, ...Z
+    rfc2822   Mon, 01 Jan 2024 09:00:00 +0900 (GMT/UTC 포함)
+    compact   20240101
+    dotted    2024.01.01, 2024. 1. 1. 오후 3:05, 2024/01/01
+    korean    2024년 1월 1일, 2024년 1월 1일 오후 3:05
+    relative  방금 전, 5분 전, 3시간 전, 2일 전, 어제
+    scan      위 형태가 문장 중간에 있는 경우 (예: '입력 2024.01.01. 오후 3:00')
+
+결과는 항상 KST(+09:00) aware datetime이다 (시간대가 없으면 KST로 간주). pytz localize는
+항목당 수 µs가 들어서, 서머타임이 없는 KST는 고정 오프셋(datetime.timezone)으로 붙인다.
+"""
+import re
+import threading
+from calendar import monthrange
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Optional
+
+_KST_OFFSET = timedelta(hours=9)
+KST = timezone(_KST_OFFSET)
+_OFFSETS: Dict[str, timezone] = {'Z': timezone.utc, 'GMT': timezone.utc, 'UTC': timezone.utc, 'UT': timezone.utc,
+                                 '+0900': KST, '+09:00': KST}
+
+_MONTHS = {name: index for index, name in enumerate(
+    ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'], start=1)}
+
+_ISO_RE = re.compile(
+    r'(\d{4})-(\d{1,2})-(\d{1,2})(?:[T ](\d{1,2}):(\d{2})(?::(\d{2})(?:\.\d+)?)?)?\s*(Z|[+-]\d{2}:?\d{2})?'
+)
+_RFC2822_RE = re.compile(
+    r'(?:[A-Za-z]{3},\s*)?(\d{1,2})\s+([A-Za-z]{3})\s+(\d{4})\s+(\d{1,2}):(\d{2})(?::(\d{2}))?\s*'
+    r'([+-]\d{4}|GMT|UTC|UT|Z)?'
+)
+_DOTTED_RE = re.compile(
+    r'(\d{4})[./]\s?(\d{1,2})[./]\s?(\d{1,2})\.?(?:\s*(오전|오후)?\s*(\d{1,2}):(\d{2})(?::(\d{2}))?)?'
+)
+_KOREAN_RE = re.compile(
+    r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일(?:\s*(오전|오후)?\s*(\d{1,2})(?::|시\s*)(\d{2})?)?'
+)
+_RELATIVE_RE = re.compile(r'(\d+)\s*(초|분|시간|일|주)\s*전')
+_RELATIVE_UNITS = {'초': 'seconds', '분': 'minutes', '시간': 'hours', '일': 'days', '주': 'weeks'}
+_SCAN_RE = re.compile(
+    r'\d{4}년\s*\d{1,2}월\s*\d{1,2}일[^\n]{0,12}|\d{4}[./-]\s?\d{1,2}[./-]\s?\d{1,2}[^\n]{0,12}'
+    r'|\d+\s*(?:초|분|시간|일|주)\s*전|방금\s*전?|어제'
+)
+
+
+def _offset(value: Optional[str]) -> Optional[timezone]:
+    """'Z', '+0900', '+09:00', 'GMT' → tzinfo (없으면 None = KST로 간주)"""
+    if not value:
+        return None
+    tz = _OFFSETS.get(value)
+    if tz is None:
+        sign = -1 if value[0] == '-' else 1
+        digits = value[1:].replace(':', '')
+        tz = timezone(sign * timedelta(hours=int(digits[:2]), minutes=int(digits[2:4])))
+        _OFFSETS[value] = tz
+    return tz
+
+
+def _hour(hour: Optional[str], meridiem: Optional[str]) -> int:
+    value = int(hour) if hour else 0
+    if meridiem == '오후' and value < 12:
+        value += 12
+    elif meridiem == '오전' and value == 12:
+        value = 0
+    return value
+
+
+def _build(year, month, day, hour=0, minute=0, second=0, tzinfo=None) -> Optional[datetime]:
+    """범위 검사 후 datetime 생성 (잘못된 값이면 None, 시간대 없으면 KST)"""
+    year, month, day = int(year), int(month), int(day)
+    if not (year >= 1 and 1 <= month <= 12 and 1 <= day <= 31 and hour < 24 and minute < 60 and second < 60):
+        return None
+    if day > 28 and day > monthrange(year, month)[1]:
+        return None
+    if tzinfo is None or tzinfo is KST:
+        return datetime(year, month, day, hour, minute, second, tzinfo=KST)
+    return datetime(year, month, day, hour, minute, second, tzinfo=tzinfo).astimezone(KST)
+
+
+def parse_iso(value: str, now: Optional[datetime] = None) -> Optional[datetime]:
+    # 표준 ISO는 C 구현 fromisoformat이 가장 빠르다 (이 형태에서 실패하는 경우는 드묾)
+    try:
+        dt = datetime.fromisoformat(value[:-1] + '+00:00' if value[-1] == 'Z' else value)
+    except ValueError:
+        dt = None
+    if dt is not None:
+        if dt.tzinfo is None:
+            return dt.replace(tzinfo=KST)
+        return dt if dt.utcoffset() == _KST_OFFSET else dt.astimezone(KST)
+
+    match = _ISO_RE.match(value)
+    if not match:
+        return None
+    year, month, day, hour, minute, second, offset = match.groups()
+    return _build(year, month, day, int(hour or 0), int(minute or 0), int(second or 0), _offset(offset))
+
+
+def parse_rfc2822(value: str, now: Optional[datetime] = None) -> Optional[datetime]:
+    match = _RFC2822_RE.match(value)
+    if not match:
+        return None
+    day, month_name, year, hour, minute, second, offset = match.groups()
+    month = _MONTHS.get(month_name.lower())
+    if not month:
+        return None
+    return _build(year, month, day, int(hour), int(minute), int(second or 0), _offset(offset))
+
+
+def parse_compact(value: str, now: Optional[datetime] = None) -> Optional[datetime]:
+    if len(value) < 8 or not value[:8].isdigit():
+        return None
+    return _build(value[:4], value[4:6], value[6:8])
+
+
+def parse_dotted(value: str, now: Optional[datetime] = None) -> Optional[datetime]:
+    match = _DOTTED_RE.match(value)
+    if not match:
+        return None
+    year, month, day, meridiem, hour, minute, second = match.groups()
+    return _build(year, month, day, _hour(hour, meridiem), int(minute or 0), int(second or 0))
+
+
+def parse_korean(value: str, now: Optional[datetime] = None) -> Optional[datetime]:
+    match = _KOREAN_RE.match(value)
+    if not match:
+        return None
+    year, month, day, meridiem, hour, minute = match.groups()
+    return _build(year, month, day, _hour(hour, meridiem), int(minute or 0))
+
+
+def parse_relative(value: str, now: Optional[datetime] = None) -> Optional[datetime]:
+    now = now or datetime.now(KST)
+    if value.startswith('방금'):
+        return now
+    if value.startswith('어제'):
+        return now - timedelta(days=1)
+    match = _RELATIVE_RE.match(value)
+    if not match:
+        return None
+    amount, unit = match.groups()
+    return now - timedelta(**{_RELATIVE_UNITS[unit]: int(amount)})
+
+
+def parse_scan(value: str, now: Optional[datetime] = None) -> Optional[datetime]:
+    """문장 중간의 날짜 (첫 번째로 보이는 것)"""
+    match = _SCAN_RE.search(value)
+    if not match:
+        return None
+    found = match.group(0)
+    shape = classify(found)
+    return PARSERS[shape](found, now) if shape and shape != 'scan' else None
+
+
+PARSERS: Dict[str, Callable[[str, Optional[datetime]], Optional[datetime]]] = {
+    'iso': parse_iso,
+    'rfc2822': parse_rfc2822,
+    'compact': parse_compact,
+    'dotted': parse_dotted,
+    'korean': parse_korean,
+    'relative': parse_relative,
+    'scan': parse_scan,
+}
+
+
+def classify(value: str) -> Optional[str]:
+    """앞 몇 글자로 형태 판정 (정규식 없이 문자 비교만)"""
+    if len(value) >= 8 and value[:4].isdigit():
+        sep = value[4]
+        if sep == '-':
+            return 'iso'
+        if sep in './':
+            return 'dotted'
+        if sep == '년' or value[4:6].strip() == '년':
+            return 'korean'
+        if value[4:8].isdigit():
+            return 'compact'
+    elif value[:3].isalpha() and value[3:4] == ',':
+        return 'rfc2822'
+    elif value.endswith('전') or value.startswith(('방금', '어제')):
+        return 'relative'
+    return 'scan'
+
+
+class DateParser:
+    """형태 분류 + 소스별 형식 캐시 파서 (스레드 공유 가능)"""
+
+    def __init__(self):
+        self._formats: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.stats = {'cached': 0, 'classified': 0, 'failed': 0}
+
+    def parse(self, value: str, source: str = '', now: Optional[datetime] = None) -> Optional[datetime]:
+        """문자열 → KST aware datetime (형식을 모르면 None)
+
+        source를 주면 그 소스에서 마지막으로 성공한 형식부터 시도한다.
+        relative 형식과 now를 주지 않으면 현재 시각 기준이다.
+        """
+        if not value:
+            return None
+        value = value.strip()
+
+        cached = self._formats.get(source) if source else None
+        if cached:
+            result = PARSERS[cached](value, now)
+            if result is not None:
+                self.stats['cached'] += 1
+                return result
+
+        shape = classify(value)
+        result = PARSERS[shape](value, now)
+        if result is None and shape != 'scan':
+            shape = 'scan'
+            result = parse_scan(value, now)
+        if result is None:
+            self.stats['failed'] += 1
+            return None
+
+        self.stats['classified'] += 1
+        # scan은 문장에서 찾은 것이라 소스 형식으로 기억하지 않는다
+        if source and shape != cached and shape != 'scan':
+            with self._lock:
+                self._formats[source] = shape
+        return result
+
+    def format_for(self, source: str) -> Optional[str]:
+        """소스에 캐시된 형식 이름"""
+        return self._formats.get(source)
+
+
+# 모듈 공용 파서 (크롤러 인스턴스끼리 형식 캐시 공유)
+DATE_PARSER = DateParser()
+
+
+def parse_date(value: str, source: str = '', now: Optional[datetime] = None) -> Optional[datetime]:
+    return DATE_PARSER.parse(value, source, now)
@@ -0,0 +1,144 @@
+"""RSS 피드 조건부 GET 디스크 캐시 (ETag / Last-Modified)
+
+feedparser.parse(url)로 매번 전체 피드를 받는 대신 공유 세션/클라이언트로 요청하고,
+직전 응답의 ETag/Last-Modified를 If-None-Match/If-Modified-Since로 보낸다.
+304면 본문을 다시 받지 않고 캐시된 본문을 돌려주며 not_modified=True로 표시한다
+(= 새 항목 없음). 캐시는 URL sha256 이름의 .json(헤더) + .xml(본문) 파일 쌍이다.
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+FEED_CACHE_DIR = os.getenv('FEED_CACHE_DIR', os.path.join('cache', 'feeds'))
+
+
+@dataclass
+class FeedResponse:
+    """피드 응답 (304인 경우 content는 캐시된 본문)"""
+    url: str
+    content: bytes
+    not_modified: bool = False
+
+
+@asynccontextmanager
+async def _no_limit():
+    yield
+
+
+def _atomic_write(path: str, data: bytes):
+    """임시 파일에 쓴 뒤 rename (읽는 쪽이 잘린 파일을 보지 않도록)"""
+    directory = os.path.dirname(path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class FeedCache:
+    """URL별 피드 본문 + 검증 헤더를 디스크에 보관하는 조건부 GET 캐시"""
+
+    def __init__(self, cache_dir: str = FEED_CACHE_DIR):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self.stats = {'hit_304': 0, 'miss_200': 0, 'error': 0}
+
+    def _paths(self, url: str):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        base = os.path.join(self.cache_dir, key)
+        return base + '.json', base + '.xml'
+
+    def load(self, url: str) -> Optional[Dict]:
+        """캐시 항목 (헤더 + 본문) 로드, 없거나 깨졌으면 None"""
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            with open(body_path, 'rb') as f:
+                entry['content'] = f.read()
+            return entry
+        except (OSError, ValueError):
+            return None
+
+    def store(self, url: str, content: bytes, etag: Optional[str], last_modified: Optional[str]):
+        """본문 먼저, 헤더 나중에 저장 (헤더가 있으면 본문도 있음이 보장됨)"""
+        meta_path, body_path = self._paths(url)
+        entry = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'stored_at': time.time(),
+        }
+        try:
+            _atomic_write(body_path, content)
+            _atomic_write(meta_path, json.dumps(entry, ensure_ascii=False).encode('utf-8'))
+        except OSError as e:
+            logger.warning(f"[피드 캐시] 저장 실패 ({url}): {e}")
+
+    def conditional_headers(self, entry: Optional[Dict]) -> Dict[str, str]:
+        """캐시 항목으로 조건부 요청 헤더 구성"""
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def _count(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+
+    def _handle(self, url: str, entry: Optional[Dict], status: int, headers, content: bytes) -> Optional[FeedResponse]:
+        if status == 304 and entry:
+            self._count('hit_304')
+            logger.info(f"[피드 캐시] 304 변경 없음: {url}")
+            return FeedResponse(url=url, content=entry['content'], not_modified=True)
+
+        if status == 200:
+            self._count('miss_200')
+            self.store(url, content, headers.get('ETag'), headers.get('Last-Modified'))
+            return FeedResponse(url=url, content=content)
+
+        self._count('error')
+        logger.warning(f"[피드 캐시] HTTP {status}: {url}")
+        return None
+
+    def get(self, session: requests.Session, url: str, timeout: int = 10) -> Optional[FeedResponse]:
+        """requests 세션으로 조건부 GET (실패 시 None)"""
+        entry = self.load(url)
+        try:
+            response = session.get(url, headers=self.conditional_headers(entry), timeout=timeout)
+        except Exception as e:
+            self._count('error')
+            logger.warning(f"[피드 캐시] 요청 실패 ({url}): {e}")
+            return None
+        return self._handle(url, entry, response.status_code, response.headers, response.content)
+
+    async def get_async(self, client, url: str, timeout: int = 10, limit=None) -> Optional[FeedResponse]:
+        """httpx.AsyncClient로 조건부 GET (limit: 동시 요청 제한 async context manager 팩토리)"""
+        entry = self.load(url)
+        try:
+            async with (limit() if limit is not None else _no_limit()):
+                response = await client.get(url, headers=self.conditional_headers(entry), timeout=timeout)
+        except Exception as e:
+            self._count('error')
+            logger.warning(f"[피드 캐시] 요청 실패 ({url}): {e}")
+            return None
+        return self._handle(url, entry, response.status_code, response.headers, response.content)
@@ -0,0 +1,146 @@
+"""RSS 항목 단계별 지연 파이프라인 (싼 필터 먼저)
+
+파싱 → 3일 필터 → URL/제목 중복 제거 → 필요한 개수만큼 자르기를 제너레이터로 연결한다.
+원문 URL resolve와 og:image 조회는 파이프라인을 통과한 항목에만 하므로, 나중에
+filter_by_date/remove_duplicates에서 버려질 항목에 네트워크 요청을 쓰지 않는다.
+개수 제한에 걸린 뒤의 항목은 파싱도 하지 않는다.
+
+단계별로 걸러진 항목 수와, 그 항목에 들었을 네트워크 호출 수(구글 뉴스 resolve 1회 +
+media_content가 없으면 이미지 조회 1회)를 PipelineStats에 센다.
+"""
+import logging
+import threading
+from itertools import islice
+from typing import TYPE_CHECKING, Dict, List, Optional, Set
+
+from article import Article
+
+if TYPE_CHECKING:
+    from real_crawler import RealNewsCrawler
+
+logger = logging.getLogger(__name__)
+
+STAGES = ('parse', 'date', 'duplicate', 'truncate')
+STAGE_LABELS = {
+    'parse': '파싱 실패',
+    'date': '3일 필터',
+    'duplicate': '중복',
+    'truncate': '개수 초과',
+}
+
+
+class PipelineStats:
+    """단계별 제외 항목 수 + 아낀 네트워크 호출 수"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.dropped = dict.fromkeys(STAGES, 0)
+        self.saved = dict.fromkeys(STAGES, 0)
+        self.selected = 0
+        self.network_calls = 0  # 통과 항목에 남은 (예상) 네트워크 호출 수
+
+    def drop(self, stage: str, cost: int):
+        self.dropped[stage] += 1
+        self.saved[stage] += cost
+
+    def select(self, cost: int):
+        self.selected += 1
+        self.network_calls += cost
+
+    def merge(self, other: 'PipelineStats'):
+        """다른 집계를 더함 (회차 누적용)"""
+        with self._lock:
+            for stage in STAGES:
+                self.dropped[stage] += other.dropped[stage]
+                self.saved[stage] += other.saved[stage]
+            self.selected += other.selected
+            self.network_calls += other.network_calls
+
+    def summary(self) -> str:
+        stages = ', '.join(
+            f"{STAGE_LABELS[stage]} {self.dropped[stage]}개(호출 {self.saved[stage]}회 절약)" for stage in STAGES
+        )
+        return f"{stages}, 통과 {self.selected}개(호출 {self.network_calls}회)"
+
+
+def network_cost(entry, resolve: bool) -> int:
+    """항목 하나에 드는 네트워크 호출 수 (resolve 1회 + 피드에 이미지가 없으면 조회 1회)"""
+    return int(resolve) + (0 if 'media_content' in entry else 1)
+
+
+def title_key(title: str) -> str:
+    """제목 비교 키 (소문자 + 공백 정규화)"""
+    return ' '.join(title.lower().split())
+
+
+class SeenKeys:
+    """파이프라인 간 공유하는 URL/제목 키 (같은 카테고리의 여러 소스에서 공유)"""
+
+    def __init__(self):
+        self.urls: Set[str] = set()
+        self.titles: Set[str] = set()
+
+    def add(self, url_key: str, title: str) -> bool:
+        """처음 보는 항목이면 기록하고 True"""
+        key = title_key(title)
+        if url_key in self.urls or key in self.titles:
+            return False
+        self.urls.add(url_key)
+        self.titles.add(key)
+        return True
+
+
+def select_entries(crawler: 'RealNewsCrawler', entries: List, max_results: int, source: Optional[str] = None,
+                   resolve: bool = False, seen: Optional[SeenKeys] = None,
+                   date_stats: Optional[Dict[str, int]] = None, label: str = 'RSS') -> List[Article]:
+    """RSS 항목을 싼 필터부터 통과시켜 최대 max_results개의 Article 반환
+
+    resolve=True면 통과 항목마다 구글 뉴스 URL resolve가 뒤따르는 것으로 보고 절약 수를 센다.
+    seen을 넘기면 다른 소스에서 이미 통과한 URL/제목도 중복으로 제외한다.
+    """
+    stats = PipelineStats()
+    if seen is None:
+        seen = SeenKeys()
+    if date_stats is None:
+        date_stats = {'success': 0, 'failed': 0}
+    examined = 0
+
+    def parsed():
+        nonlocal examined
+        for entry in entries:
+            examined += 1
+            try:
+                article = crawler.parse_feed_entry(entry, source=source, stats=date_stats)
+            except Exception as e:
+                logger.error(f"[{label}] 항목 파싱 오류: {e}")
+                article = None
+            if article is None:
+                stats.drop('parse', network_cost(entry, resolve))
+                continue
+            yield entry, article
+
+    def recent(items):
+        for entry, article in items:
+            if not crawler.is_within_3_days(article.published_at):
+                stats.drop('date', network_cost(entry, resolve))
+                continue
+            yield entry, article
+
+    def unique(items):
+        for entry, article in items:
+            if not seen.add(article.url_key, article.title):
+                stats.drop('duplicate', network_cost(entry, resolve))
+                continue
+            yield entry, article
+
+    selected = []
+    for entry, article in islice(unique(recent(parsed())), max_results):
+        stats.select(network_cost(entry, resolve))
+        selected.append(article)
+
+    for entry in entries[examined:]:
+        stats.drop('truncate', network_cost(entry, resolve))
+
+    logger.info(f"[{label} 파이프라인] 입력 {len(entries)}개: {stats.summary()}")
+    crawler.pipeline_stats.merge(stats)
+    return selected
@@ -0,0 +1,245 @@
+"""카테고리/회차 간 기사 fingerprint 저장소
+
+같은 기사가 여러 카테고리(예: health와 sports의 '운동')와 매 회차에 반복해서 들어오므로,
+수집을 마친 기사의 정규화 URL, canonical URL, 제목 SimHash와 보강된 값(원문 URL,
+이미지, 요약)을 SQLite에 남긴다. 다음에 같은 기사가 오면 네트워크 작업(구글 뉴스
+resolve, og:image 조회) 전에 저장된 값을 재사용한다.
+
+제목 SimHash는 64비트이고 해밍 거리 SIMHASH_DISTANCE(3) 이하를 같은 기사로 본다.
+16비트 band 4개 중 하나는 반드시 같으므로 band 컬럼 인덱스로 후보만 조회한다.
+SimHash로만 찾은 기사는 이미지/요약만 채우고, 구글 뉴스 링크를 저장된 원문 URL로 바꾸는 것은
+거리 SIMHASH_URL_DISTANCE(0, 정규화 제목이 같은 경우) 이하일 때만 한다 (비슷한 다른 기사로 링크가
+바뀌지 않도록). 조회 결과(Fingerprint)에는 매칭 방법/거리/조회한 원래 URL이 같이 들어 있다.
+저장소 크기는 MAX_AGE(기본 7일)보다 오래된 항목 삭제 + MAX_ROWS 초과분 오래된 순 삭제로 제한한다.
+"""
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+from article import Article
+from metadata_cache import cache_key
+from title_index import shingles
+from url_resolver import google_news_article_id
+
+logger = logging.getLogger(__name__)
+
+FINGERPRINT_PATH = os.getenv('FINGERPRINT_PATH', os.path.join('cache', 'fingerprints.sqlite3'))
+FINGERPRINT_MAX_ROWS = int(os.getenv('FINGERPRINT_MAX_ROWS', '20000'))
+FINGERPRINT_MAX_AGE = int(os.getenv('FINGERPRINT_MAX_AGE', str(7 * 24 * 3600)))
+
+SIMHASH_BITS = 64
+SIMHASH_DISTANCE = 3
+SIMHASH_URL_DISTANCE = int(os.getenv('FINGERPRINT_URL_DISTANCE', '0'))  # SimHash 매칭으로 URL까지 바꿀 최대 거리
+_BAND_BITS = 16
+_BANDS = SIMHASH_BITS // _BAND_BITS
+
+
+def simhash(title: str) -> int:
+    """제목 문자 2-gram 기반 64비트 SimHash (빈 제목은 0)"""
+    weights = [0] * SIMHASH_BITS
+    grams = shingles(title)
+    if not grams:
+        return 0
+    for gram in grams:
+        value = int.from_bytes(hashlib.blake2b(gram.encode('utf-8'), digest_size=8).digest(), 'big')
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count('1')
+
+
+def _bands(value: int) -> List[int]:
+    return [(value >> (band * _BAND_BITS)) & 0xFFFF for band in range(_BANDS)]
+
+
+def _signed(value: int) -> int:
+    """SQLite INTEGER(부호 있는 64비트)에 넣을 수 있게 변환"""
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+@dataclass
+class Fingerprint:
+    """저장된 기사 (보강이 끝난 값) + 매칭 정보
+
+    matched_by는 'url' | 'canonical' | 'simhash', distance는 SimHash 해밍 거리(URL 매칭이면 0),
+    original_url은 조회할 때 넘긴 URL (reuse가 URL을 바꿔도 원래 링크를 알 수 있도록).
+    """
+    url: str
+    title: str
+    image: str
+    summary: str
+    category: str
+    matched_by: str = ''
+    distance: int = 0
+    original_url: str = ''
+
+
+class FingerprintStore:
+    """정규화 URL / canonical URL / 제목 SimHash → 보강된 기사 값"""
+
+    def __init__(self, path: str = FINGERPRINT_PATH, max_rows: int = FINGERPRINT_MAX_ROWS,
+                 max_age: int = FINGERPRINT_MAX_AGE):
+        self.path = path
+        self.max_rows = max_rows
+        self.max_age = max_age
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS fingerprints (
+                url_key TEXT PRIMARY KEY,
+                canonical_key TEXT NOT NULL,
+                simhash INTEGER NOT NULL,
+                band0 INTEGER NOT NULL,
+                band1 INTEGER NOT NULL,
+                band2 INTEGER NOT NULL,
+                band3 INTEGER NOT NULL,
+                url TEXT NOT NULL,
+                title TEXT NOT NULL,
+                image TEXT NOT NULL,
+                summary TEXT NOT NULL,
+                category TEXT NOT NULL,
+                seen_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_fingerprints_canonical ON fingerprints (canonical_key);
+            CREATE INDEX IF NOT EXISTS idx_fingerprints_band0 ON fingerprints (band0);
+            CREATE INDEX IF NOT EXISTS idx_fingerprints_band1 ON fingerprints (band1);
+            CREATE INDEX IF NOT EXISTS idx_fingerprints_band2 ON fingerprints (band2);
+            CREATE INDEX IF NOT EXISTS idx_fingerprints_band3 ON fingerprints (band3);
+            CREATE INDEX IF NOT EXISTS idx_fingerprints_seen_at ON fingerprints (seen_at);
+            """
+        )
+        self.evict()
+        self.stats = {'url': 0, 'canonical': 0, 'simhash': 0, 'miss': 0, 'saved_calls': 0}
+
+    def evict(self):
+        """오래된 항목 삭제 후 max_rows를 넘는 만큼 오래된 순으로 삭제"""
+        with self._lock:
+            self._conn.execute('DELETE FROM fingerprints WHERE seen_at < ?', (time.time() - self.max_age,))
+            self._conn.execute(
+                'DELETE FROM fingerprints WHERE url_key IN ('
+                'SELECT url_key FROM fingerprints ORDER BY seen_at DESC LIMIT -1 OFFSET ?)',
+                (self.max_rows,),
+            )
+            self._conn.commit()
+
+    def _row(self, row, matched_by: str, original_url: str, distance: int = 0) -> Fingerprint:
+        url, title, image, summary, category = row
+        return Fingerprint(url=url, title=title, image=image, summary=summary, category=category,
+                           matched_by=matched_by, distance=distance, original_url=original_url)
+
+    def lookup(self, url: str, title: str) -> Optional[Fingerprint]:
+        """URL(정규화/canonical) 먼저, 없으면 제목 SimHash로 조회"""
+        columns = 'url, title, image, summary, category'
+        key = cache_key(url) if url else ''
+        value = simhash(title)
+        with self._lock:
+            if key:
+                row = self._conn.execute(f'SELECT {columns} FROM fingerprints WHERE url_key = ?', (key,)).fetchone()
+                if row:
+                    self.stats['url'] += 1
+                    return self._row(row, 'url', url)
+                row = self._conn.execute(f'SELECT {columns} FROM fingerprints WHERE canonical_key = ?', (key,)).fetchone()
+                if row:
+                    self.stats['canonical'] += 1
+                    return self._row(row, 'canonical', url)
+
+            if value:
+                bands = _bands(value)
+                rows = self._conn.execute(
+                    f'SELECT simhash, {columns} FROM fingerprints '
+                    f'WHERE band0 = ? OR band1 = ? OR band2 = ? OR band3 = ?',
+                    bands,
+                ).fetchall()
+                # 가장 가까운 후보 (거리가 같으면 먼저 조회된 것)
+                best = None
+                for stored, *row in rows:
+                    distance = hamming(stored & ((1 << 64) - 1), value)
+                    if distance <= SIMHASH_DISTANCE and (best is None or distance < best[0]):
+                        best = (distance, row)
+                if best is not None:
+                    self.stats['simhash'] += 1
+                    return self._row(best[1], 'simhash', url, best[0])
+
+            self.stats['miss'] += 1
+        return None
+
+    def reuse(self, articles: List[Article]) -> List[Tuple[Article, Fingerprint]]:
+        """저장된 값으로 기사 보강 (네트워크 전), 저장소에 있던 (기사, 조회 결과) 목록 반환
+
+        - 아직 구글 뉴스 링크면 저장된 원문 URL로 바꾼다 (resolve 생략, SimHash 매칭은
+          SIMHASH_URL_DISTANCE 이하만, 바꾸기 전 링크는 조회 결과의 original_url)
+        - 이미지/요약이 비어 있으면 저장된 값으로 채운다 (og:image 조회 생략)
+        """
+        reused = []
+        for article in articles:
+            found = self.lookup(article.url, article.title)
+            if not found:
+                continue
+            saved = 0
+            if (google_news_article_id(article.url) and not google_news_article_id(found.url)
+                    and (found.matched_by != 'simhash' or found.distance <= SIMHASH_URL_DISTANCE)):
+                if found.matched_by == 'simhash':
+                    logger.debug(f"[fingerprint] 제목 SimHash(거리 {found.distance})로 URL 대체: "
+                                 f"{found.original_url} → {found.url}")
+                article.url = found.url
+                saved += 1
+            if not article.image_url and found.image:
+                article.image_url = found.image
+                saved += 1
+            if not article.summary and found.summary:
+                article.summary = found.summary
+            with self._lock:
+                self.stats['saved_calls'] += saved
+            reused.append((article, found))
+        if reused:
+            logger.info(f"[fingerprint] {len(articles)}개 중 {len(reused)}개 재사용")
+        return reused
+
+    def record(self, category: str, articles: List[Article], canonical_for: Optional[Callable[[str], str]] = None):
+        """보강이 끝난 기사 저장 (seen_at 갱신) 후 크기 제한"""
+        now = time.time()
+        rows = []
+        for article in articles:
+            url = article.url
+            if not url or google_news_article_id(url):
+                continue
+            key = cache_key(url)
+            canonical = canonical_for(url) if canonical_for else ''
+            value = simhash(article.title)
+            rows.append((key, cache_key(canonical) if canonical else key, _signed(value), *_bands(value), url,
+                         article.title, article.image_url, article.summary, category, now))
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                """
+                INSERT INTO fingerprints (url_key, canonical_key, simhash, band0, band1, band2, band3,
+                                          url, title, image, summary, category, seen_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url_key) DO UPDATE SET
+                    canonical_key = excluded.canonical_key,
+                    simhash = excluded.simhash,
+                    band0 = excluded.band0, band1 = excluded.band1,
+                    band2 = excluded.band2, band3 = excluded.band3,
+                    title = excluded.title,
+                    image = CASE WHEN excluded.image != '' THEN excluded.image ELSE fingerprints.image END,
+                    summary = CASE WHEN excluded.summary != '' THEN excluded.summary ELSE fingerprints.summary END,
+                    seen_at = excluded.seen_at
+                """,
+                rows,
+            )
+            self._conn.commit()
+        self.evict()
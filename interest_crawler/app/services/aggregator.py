@@ -12,7 +12,7 @@ import httpx
 from zoneinfo import ZoneInfo
 
 from ..models import FeedItem
-from . import og, providers, summarizer
+from . import feed_cache, og, providers, summarizer
 
 
 DEFAULT_HEADERS = {
@@ -86,12 +86,13 @@ async def fetch_and_enrich(categories: Sequence[str]) -> List[FeedItem]:
         for category in categories:
             rss_urls = providers.get_rss_urls(category)
             for rss_url in rss_urls:
-                try:
-                    resp = await client.get(rss_url)
-                    resp.raise_for_status()
-                except Exception:
+                resp = await feed_cache.fetch_feed(client, rss_url)
+                if resp is None:
                     continue
-                feed = feedparser.parse(resp.text)
+                if resp.not_modified:
+                    # 304: 지난 수집 이후 새 항목 없음 (기존 항목은 DB에 이미 있음)
+                    continue
+                feed = feedparser.parse(resp.content)
                 for entry in feed.entries:
                     url = entry.get("link") or entry.get("id")
                     if not url:
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+import httpx
+
+
+# 루트 크롤러(feed_cache.py)와 같은 디스크 형식: sha256(url).json(헤더) + .xml(본문)
+# FEED_CACHE_DIR을 같은 경로로 지정하면 두 앱이 캐시를 공유한다.
+FEED_CACHE_DIR = os.getenv(
+    "FEED_CACHE_DIR", str(Path(__file__).resolve().parents[1] / "cache" / "feeds")
+)
+
+
+@dataclass
+class FeedResponse:
+    url: str
+    content: bytes
+    not_modified: bool = False
+
+
+def _paths(cache_dir: str, url: str):
+    key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    base = os.path.join(cache_dir, key)
+    return base + ".json", base + ".xml"
+
+
+def _atomic_write(path: str, data: bytes) -> None:
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _load(cache_dir: str, url: str) -> Optional[Dict]:
+    meta_path, body_path = _paths(cache_dir, url)
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+        with open(body_path, "rb") as f:
+            entry["content"] = f.read()
+        return entry
+    except (OSError, ValueError):
+        return None
+
+
+def _store(cache_dir: str, url: str, resp: httpx.Response) -> None:
+    meta_path, body_path = _paths(cache_dir, url)
+    entry = {
+        "url": url,
+        "etag": resp.headers.get("ETag"),
+        "last_modified": resp.headers.get("Last-Modified"),
+        "stored_at": time.time(),
+    }
+    try:
+        _atomic_write(body_path, resp.content)
+        _atomic_write(meta_path, json.dumps(entry, ensure_ascii=False).encode("utf-8"))
+    except OSError:
+        pass
+
+
+async def fetch_feed(
+    client: httpx.AsyncClient, url: str, cache_dir: str = FEED_CACHE_DIR
+) -> Optional[FeedResponse]:
+    """ETag/Last-Modified 조건부 GET. 304면 캐시 본문과 not_modified=True, 실패 시 None."""
+    os.makedirs(cache_dir, exist_ok=True)
+    entry = _load(cache_dir, url)
+    headers = {}
+    if entry:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    try:
+        resp = await client.get(url, headers=headers)
+    except Exception:
+        return None
+
+    if resp.status_code == 304 and entry:
+        return FeedResponse(url=url, content=entry["content"], not_modified=True)
+    if resp.status_code != 200:
+        return None
+    _store(cache_dir, url, resp)
+    return FeedResponse(url=url, content=resp.content)
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+
+# 루트 크롤러(metadata_cache.py)와 같은 SQLite 스키마/키 정규화.
+# METADATA_CACHE_PATH를 같은 경로로 지정하면 두 앱이 캐시를 공유한다.
+METADATA_CACHE_PATH = os.getenv(
+    "METADATA_CACHE_PATH",
+    str(Path(__file__).resolve().parents[1] / "cache" / "page_metadata.sqlite3"),
+)
+METADATA_TTL = int(os.getenv("METADATA_TTL", str(7 * 24 * 3600)))
+METADATA_NEGATIVE_TTL = int(os.getenv("METADATA_NEGATIVE_TTL", str(24 * 3600)))
+# 429/5xx/타임아웃처럼 곧 다시 성공할 수 있는 실패는 짧게만 기억한다
+METADATA_TRANSIENT_TTL = int(os.getenv("METADATA_TRANSIENT_TTL", str(15 * 60)))
+
+_TRACKING_PARAMS = ("utm_", "fbclid", "gclid")
+
+_lock = threading.Lock()
+_conn: Optional[sqlite3.Connection] = None
+
+
+def cache_key(url: str) -> str:
+    parsed = urlparse(url.strip())
+    query = sorted(
+        (k, v)
+        for k, v in parse_qsl(parsed.query, keep_blank_values=True)
+        if not k.lower().startswith(_TRACKING_PARAMS)
+    )
+    return urlunparse(
+        (
+            parsed.scheme.lower(),
+            parsed.netloc.lower(),
+            parsed.path.rstrip("/") or "/",
+            parsed.params,
+            urlencode(query),
+            "",
+        )
+    )
+
+
+def _connect() -> sqlite3.Connection:
+    global _conn
+    if _conn is None:
+        os.makedirs(os.path.dirname(METADATA_CACHE_PATH), exist_ok=True)
+        conn = sqlite3.connect(METADATA_CACHE_PATH, check_same_thread=False, timeout=10)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS page_metadata (
+                url TEXT PRIMARY KEY,
+                image TEXT NOT NULL,
+                description TEXT NOT NULL,
+                published TEXT NOT NULL,
+                ok INTEGER NOT NULL,
+                expires_at REAL NOT NULL
+            )
+            """
+        )
+        conn.execute("DELETE FROM page_metadata WHERE expires_at < ?", (time.time(),))
+        conn.commit()
+        _conn = conn
+    return _conn
+
+
+def get(url: str) -> Optional[Dict[str, str]]:
+    """만료되지 않은 항목. 없으면 None, 실패 캐시는 빈 dict."""
+    try:
+        with _lock:
+            row = _connect().execute(
+                "SELECT image, description, ok FROM page_metadata WHERE url = ? AND expires_at >= ?",
+                (cache_key(url), time.time()),
+            ).fetchone()
+    except sqlite3.Error:
+        return None
+    if row is None:
+        return None
+    image, description, ok = row
+    if not ok:
+        return {}
+    return {"image": image, "description": description}
+
+
+def put(
+    url: str,
+    image: str = "",
+    description: str = "",
+    published: str = "",
+    transient: bool = False,
+) -> None:
+    """조회 결과 저장. 값이 하나도 없으면 실패로 보고 NEGATIVE_TTL(일시적 실패는 TRANSIENT_TTL)로 저장."""
+    ok = bool(image or description or published)
+    if ok:
+        ttl = METADATA_TTL
+    else:
+        ttl = METADATA_TRANSIENT_TTL if transient else METADATA_NEGATIVE_TTL
+    try:
+        with _lock:
+            conn = _connect()
+            conn.execute(
+                """
+                INSERT INTO page_metadata (url, image, description, published, ok, expires_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    image = excluded.image,
+                    description = excluded.description,
+                    published = excluded.published,
+                    ok = excluded.ok,
+                    expires_at = excluded.expires_at
+                """,
+                (cache_key(url), image, description, published, int(ok), time.time() + ttl),
+            )
+            conn.commit()
+    except sqlite3.Error:
+        pass
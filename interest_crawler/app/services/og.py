@@ -1,35 +1,133 @@
 from __future__ import annotations
 
-from typing import Dict
+import asyncio
+import codecs
+import re
+from html.parser import HTMLParser
+from typing import Dict, Optional
+from urllib.parse import urljoin
 
 import httpx
-from bs4 import BeautifulSoup
 
+from . import metadata_cache
+
+
+# og 태그는 <head> 안에 있으므로 </head> 또는 이 크기까지만 읽는다
+DEFAULT_MAX_BYTES = 256 * 1024
+_CHUNK_SIZE = 16 * 1024
+_HEAD_END = b"</head>"
+_CHARSET_RE = re.compile(rb"charset\s*=\s*[\"']?\s*([A-Za-z0-9_\-]+)", re.I)
+
+
+async def fetch_og(
+    client: httpx.AsyncClient, url: str, max_bytes: int = DEFAULT_MAX_BYTES
+) -> Dict[str, str]:
+    # 이전 실행에서 받은 값(실패는 빈 dict)이 있으면 요청하지 않는다
+    # 캐시는 동기 SQLite라 이벤트 루프를 막지 않도록 스레드에서 읽고 쓴다
+    cached = await asyncio.to_thread(metadata_cache.get, url)
+    if cached is not None:
+        return cached
 
-async def fetch_og(client: httpx.AsyncClient, url: str) -> Dict[str, str]:
     try:
-        resp = await client.get(url)
-        resp.raise_for_status()
+        async with client.stream("GET", url) as resp:
+            if not resp.is_success:
+                # 404 등은 하루, 408/429/5xx는 잠깐만 기억한다
+                await asyncio.to_thread(
+                    metadata_cache.put, url, transient=_is_transient(resp.status_code)
+                )
+                return {}
+            html = await _read_head(resp, max_bytes)
+    except httpx.TransportError:
+        # 타임아웃/연결 오류
+        await asyncio.to_thread(metadata_cache.put, url, transient=True)
+        return {}
     except Exception:
+        await asyncio.to_thread(metadata_cache.put, url)
         return {}
 
     try:
-        soup = BeautifulSoup(resp.text, "html.parser")
-        og_image = _get_meta(soup, "property", "og:image")
-        og_desc = _get_meta(soup, "property", "og:description")
+        meta = _parse_meta(html)
+        og_image = _get_meta(meta, "property", "og:image")
+        og_desc = _get_meta(meta, "property", "og:description")
         if not og_desc:
-            og_desc = _get_meta(soup, "name", "description")
-        return {
-            "image": og_image or "",
-            "description": og_desc or "",
-        }
+            og_desc = _get_meta(meta, "name", "description")
+        published = _get_meta(meta, "property", "article:published_time")
     except Exception:
+        await asyncio.to_thread(metadata_cache.put, url)
         return {}
 
+    image = _absolute(og_image, url)
+    await asyncio.to_thread(
+        metadata_cache.put, url, image=image, description=og_desc, published=published
+    )
+    return {
+        "image": image,
+        "description": og_desc or "",
+    }
 
-def _get_meta(soup: BeautifulSoup, attr: str, value: str) -> str:
-    tag = soup.find("meta", attrs={attr: value})
-    if not tag:
+
+def _is_transient(status: int) -> bool:
+    return status in (408, 429) or status >= 500
+
+
+def _absolute(image: str, base_url: str) -> str:
+    if not image:
         return ""
-    content = tag.get("content")
+    if image.startswith("//"):
+        return "https:" + image
+    return urljoin(base_url, image)
+
+
+async def _read_head(resp: httpx.Response, max_bytes: int) -> bytes:
+    data = bytearray()
+    async for chunk in resp.aiter_bytes(_CHUNK_SIZE):
+        search_from = max(0, len(data) - len(_HEAD_END) + 1)
+        data.extend(chunk)
+        end = data.lower().find(_HEAD_END, search_from)
+        if end != -1:
+            return bytes(data[: end + len(_HEAD_END)])
+        if len(data) >= max_bytes:
+            return bytes(data[:max_bytes])
+    return bytes(data)
+
+
+class _MetaParser(HTMLParser):
+    """<meta>의 (attr, value)별 첫 번째 content만 모으는 경량 파서"""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.meta: Dict[tuple, Optional[str]] = {}
+
+    def handle_starttag(self, tag, attrs):
+        if tag != "meta":
+            return
+        attrs = dict(attrs)
+        content = attrs.get("content")
+        for attr in ("property", "name"):
+            value = attrs.get(attr)
+            if value is not None:
+                self.meta.setdefault((attr, value), content)
+
+
+def _parse_meta(html: bytes) -> Dict[tuple, Optional[str]]:
+    parser = _MetaParser()
+    parser.feed(html.decode(_charset(html), errors="replace"))
+    parser.close()
+    return parser.meta
+
+
+def _charset(html: bytes) -> str:
+    match = _CHARSET_RE.search(html[:4096])
+    if match:
+        encoding = match.group(1).decode("ascii")
+        try:
+            codecs.lookup(encoding)
+            return encoding
+        except LookupError:
+            pass
+    return "utf-8"
+
+
+def _get_meta(meta: Dict[tuple, Optional[str]], attr: str, value: str) -> str:
+    content = meta.get((attr, value))
     return content.strip() if content else ""
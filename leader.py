@@ -0,0 +1,89 @@
+"""스케줄러 리더 선출 (SQLite lease)
+
+uvicorn --workers N으로 띄우면 프로세스마다 스케줄러가 돌아 정해진 크롤링이 N번 실행된다.
+기사 저장소와 같은 SQLite 파일에 leases 테이블을 두고, lease를 가진 프로세스 하나만
+스케줄 크롤링/워밍업을 실행한다. 리더는 LEADER_HEARTBEAT초마다 lease를 갱신하고,
+리더가 죽거나 멈춰서 LEADER_LEASE_TTL초 동안 갱신하지 못하면 다음 heartbeat에서
+다른 프로세스가 가져간다. 나머지 프로세스는 조회만 하고, 리더가 저장한 새 회차는
+news_cache의 파일 mtime 확인으로 반영된다.
+"""
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+LEADER_LEASE_TTL = float(os.getenv('LEADER_LEASE_TTL', '90'))
+LEADER_HEARTBEAT = float(os.getenv('LEADER_HEARTBEAT', '30'))
+
+
+class LeaderLease:
+    """이름 하나에 대한 만료 시간 있는 lease"""
+
+    def __init__(self, path: str, name: str = 'scheduler', ttl: float = LEADER_LEASE_TTL):
+        self.path = path
+        self.name = name
+        self.ttl = ttl
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self._expires = 0.0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=10, isolation_level=None, check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS leases (name TEXT PRIMARY KEY, owner TEXT NOT NULL, expires_at REAL NOT NULL)'
+        )
+
+    @property
+    def is_leader(self) -> bool:
+        return self._expires > time.time()
+
+    def acquire(self) -> bool:
+        """lease 획득/갱신 (비어 있거나, 만료됐거나, 이미 내 것이면), 리더면 True"""
+        with self._lock:
+            was_leader = self.is_leader
+            now = time.time()
+            try:
+                self._conn.execute('BEGIN IMMEDIATE')
+                try:
+                    row = self._conn.execute('SELECT owner, expires_at FROM leases WHERE name = ?',
+                                             (self.name,)).fetchone()
+                    if row is None or row[0] == self.owner or row[1] < now:
+                        self._conn.execute(
+                            'INSERT INTO leases (name, owner, expires_at) VALUES (?, ?, ?) '
+                            'ON CONFLICT(name) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at',
+                            (self.name, self.owner, now + self.ttl),
+                        )
+                        self._expires = now + self.ttl
+                    else:
+                        self._expires = 0.0
+                    self._conn.execute('COMMIT')
+                except BaseException:
+                    self._conn.execute('ROLLBACK')
+                    raise
+            except sqlite3.Error as e:
+                # DB가 잠겨 갱신하지 못해도 기존 만료 시각까지는 리더로 본다
+                logger.warning(f"[리더 선출] lease 갱신 실패: {e}")
+            if self.is_leader != was_leader:
+                logger.info(f"[리더 선출] {self.name}: {self.owner} {'리더 획득' if self.is_leader else '리더 아님'}")
+            return self.is_leader
+
+    def release(self):
+        """내 lease 반납 (다른 프로세스가 다음 heartbeat에서 바로 가져가도록)"""
+        with self._lock:
+            try:
+                self._conn.execute('DELETE FROM leases WHERE name = ? AND owner = ?', (self.name, self.owner))
+            except sqlite3.Error as e:
+                logger.warning(f"[리더 선출] lease 반납 실패: {e}")
+            self._expires = 0.0
+
+    def holder(self) -> Optional[Dict]:
+        """현재 lease 보유자 {'owner', 'expires_in'} (없거나 만료됐으면 None)"""
+        with self._lock:
+            row = self._conn.execute('SELECT owner, expires_at FROM leases WHERE name = ?', (self.name,)).fetchone()
+        if row is None or row[1] < time.time():
+            return None
+        return {'owner': row[0], 'expires_in': round(row[1] - time.time(), 1)}
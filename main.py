@@ -1,15 +1,23 @@
 from fastapi import FastAPI, Request, Query, HTTPException
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 from fastapi.templating import Jinja2Templates
-from real_crawler import RealNewsCrawler
+from article_store import ARTICLE_HISTORY_DAYS, ArticleStore
+from categories import CATEGORIES, category_names
+from crawl_jobs import CrawlJob, CrawlJobQueue, StoreJobQueue
+from crawl_schedule import CrawlSchedule
+from leader import LeaderLease
+from news_cache import NewsCache
+from warmup import WarmupState, follow
+from response_body import etag_matches, render_news
 import uvicorn
-from typing import List, Dict, Optional
+from typing import Optional
+import asyncio
+import hmac
 import logging
 from datetime import datetime, timedelta
-import json
 import os
-from apscheduler.schedulers.background import BackgroundScheduler
-from apscheduler.triggers.cron import CronTrigger
+import threading
+from collections import Counter
 import pytz
 
 logging.basicConfig(level=logging.INFO)
@@ -20,147 +28,104 @@ app = FastAPI(title="관심사 뉴스 크롤러")
 # 템플릿 설정
 templates = Jinja2Templates(directory="templates")
 
-# 크롤러 인스턴스
-news_crawler = RealNewsCrawler()
+# 실행 모드
+# - all: API + 스케줄러 + 크롤러를 한 프로세스에서 실행 (기본)
+# - serve: 조회 전용 (bs4/feedparser/apscheduler를 import하지 않음), 크롤링은 crawler_worker.py 프로세스가 담당
+API_MODE = os.getenv('API_MODE', 'all')
+SERVE_ONLY = API_MODE == 'serve'
+# 크롤러 워커의 저장 알림(/api/internal/invalidate) 토큰 (없으면 알림을 받지 않음)
+CRAWLER_NOTIFY_TOKEN = os.getenv('CRAWLER_NOTIFY_TOKEN', '')
 
-# 데이터 저장 디렉토리
+# 데이터 저장 디렉토리 (기사 저장소 + 이전 버전의 카테고리별 JSON 파일)
 DATA_DIR = "data"
 os.makedirs(DATA_DIR, exist_ok=True)
 
+# 기사 저장소 (SQLite WAL, 회차별 이력)
+article_store = ArticleStore()
+
 # 한국 시간대
 KST = pytz.timezone('Asia/Seoul')
 
-# 스케줄러 인스턴스
-scheduler = BackgroundScheduler(timezone=KST)
-
+# /api/news 읽기 캐시 (본문 없이 저장된 회차는 render_news로 만든다)
+news_cache = NewsCache(article_store, render=render_news)
 
-def get_cache_file_path(category: str) -> str:
-    """카테고리별 캐시 파일 경로"""
-    return os.path.join(DATA_DIR, f"{category}.json")
+# 시작 시 워밍업 상태 + 카테고리별 /api/news 요청 수 (저장소에 주기적으로 누적, 워밍업 순서용)
+warmup = WarmupState()
+request_counts: Counter = Counter()
+REQUEST_COUNTS_FLUSH_INTERVAL = 10 * 60
+_flush_stop = threading.Event()
 
 
-def save_news_to_file(category: str, articles: List[Dict]):
-    """뉴스 데이터를 JSON 파일로 저장"""
+def flush_request_counts():
+    """메모리의 카테고리별 요청 수를 저장소에 누적"""
+    counts = dict(request_counts)
+    request_counts.subtract(counts)
     try:
-        file_path = get_cache_file_path(category)
-        data = {
-            'articles': articles,
-            'cached_at': datetime.now(KST).isoformat(),
-            'category': category,
-            'category_name': news_crawler.CATEGORIES.get(category, {}).get('name', category)
-        }
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        logger.info(f"[파일 저장] {category}: {len(articles)}개 기사 저장 완료")
+        article_store.add_requests({category: count for category, count in counts.items() if count})
     except Exception as e:
-        logger.error(f"[파일 저장] {category} 오류: {e}", exc_info=True)
+        logger.error(f"[요청 수 저장] 오류: {e}", exc_info=True)
 
 
-def load_news_from_file(category: str) -> Optional[Dict]:
-    """파일에서 뉴스 데이터 로드"""
-    try:
-        file_path = get_cache_file_path(category)
-        if not os.path.exists(file_path):
-            return None
-        
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        logger.info(f"[파일 로드] {category}: {len(data.get('articles', []))}개 기사 로드 완료")
-        return data
-    except Exception as e:
-        logger.error(f"[파일 로드] {category} 오류: {e}", exc_info=True)
-        return None
+def flush_request_counts_loop():
+    """REQUEST_COUNTS_FLUSH_INTERVAL마다 요청 수 누적 (종료 시 멈춤)"""
+    while not _flush_stop.wait(REQUEST_COUNTS_FLUSH_INTERVAL):
+        flush_request_counts()
 
 
-def crawl_all_categories():
-    """모든 카테고리 크롤링 (스케줄링용)"""
-    logger.info("=" * 60)
-    logger.info("[스케줄 크롤링 시작] 모든 카테고리 크롤링 시작")
-    logger.info(f"[시간] {datetime.now(KST).strftime('%Y-%m-%d %H:%M:%S')}")
-    
-    categories = list(news_crawler.CATEGORIES.keys())
-    success_count = 0
-    fail_count = 0
-    
-    for category in categories:
-        try:
-            logger.info(f"[크롤링] {category} 시작...")
-            articles = news_crawler.crawl_category(category)
-            
-            # 포맷팅
-            formatted_articles = []
-            for i, article in enumerate(articles):
-                url = article.get('url', '')
-                if 'example.com' in url or not url or url.startswith('https://example'):
-                    continue
-                
-                formatted_articles.append({
-                    "id": f"{category}_{i}",
-                    "title": article.get('title', ''),
-                    "url": url,
-                    "source": article.get('source', ''),
-                    "publishedAt": article.get('publishedAt', datetime.now(KST).isoformat()),
-                    "imageUrl": article.get('imageUrl', '') or '',
-                    "summary": article.get('summary', '') or ''
-                })
-            
-            # 파일 저장
-            save_news_to_file(category, formatted_articles)
-            success_count += 1
-            logger.info(f"[크롤링 완료] {category}: {len(formatted_articles)}개 기사")
-            
-        except Exception as e:
-            fail_count += 1
-            logger.error(f"[크롤링 실패] {category}: {e}", exc_info=True)
-    
-    logger.info(f"[스케줄 크롤링 완료] 성공: {success_count}개, 실패: {fail_count}개")
-    logger.info("=" * 60)
+if SERVE_ONLY:
+    # 새로고침 작업은 저장소 refresh_jobs 테이블로 크롤러 워커에게 넘긴다
+    crawler_worker = None
+    crawl_jobs = StoreJobQueue(article_store.path)
+    # /health 표시용 (이 프로세스는 lease를 잡지 않고 크롤링 주기도 바꾸지 않는다)
+    scheduler_lease = LeaderLease(article_store.path)
+    crawl_schedule = CrawlSchedule(article_store.path)
+else:
+    from crawler_worker import CrawlerWorker
+
+    # 같은 프로세스의 크롤러 워커 (크롤링 뒤 요청 수를 저장소에 누적)
+    crawler_worker = CrawlerWorker(article_store, warmup=warmup, on_crawled=flush_request_counts)
+    # 수동 새로고침 작업 큐 (백그라운드 스레드, 카테고리별 single-flight)
+    crawl_jobs = CrawlJobQueue(crawler_worker.refresh_category)
+    scheduler_lease = crawler_worker.lease
+    crawl_schedule = crawler_worker.schedule
 
 
 @app.on_event("startup")
 async def startup_event():
     """앱 시작 시 초기화"""
-    logger.info("앱 시작 - 스케줄링 크롤러 준비 중...")
-    
-    # 스케줄러 설정: 매일 8시, 17시에 크롤링
-    scheduler.add_job(
-        crawl_all_categories,
-        trigger=CronTrigger(hour='8,17', minute=0),  # 매일 8시, 17시
-        id='daily_crawl',
-        name='매일 아침 8시, 저녁 5시 크롤링',
-        replace_existing=True
-    )
-    
-    scheduler.start()
-    logger.info("✅ 스케줄러 시작 완료 (매일 8시, 17시 자동 크롤링)")
+    # 카테고리별 요청 수는 10분마다 저장소에 누적 (다음 시작 때 워밍업 순서)
+    threading.Thread(target=flush_request_counts_loop, name='flush-request-counts', daemon=True).start()
     
-    # 앱 시작 시 즉시 한 번 크롤링 (데이터가 없을 경우)
-    logger.info("[초기 크롤링] 저장된 데이터 확인 중...")
-    has_data = False
-    for category in news_crawler.CATEGORIES.keys():
-        if load_news_from_file(category):
-            has_data = True
-            break
+    if crawler_worker is not None:
+        logger.info("앱 시작 - 스케줄링 크롤러 준비 중...")
+        crawler_worker.start(DATA_DIR)
+        return
     
-    if not has_data:
-        logger.info("[초기 크롤링] 저장된 데이터가 없어 즉시 크롤링 시작...")
-        crawl_all_categories()
-    else:
-        logger.info("[초기 크롤링] 저장된 데이터가 있어 스킵합니다.")
+    # 조회 전용: 크롤러 워커가 게시하는 카테고리를 저장소에서 확인해 워밍업 상태만 갱신
+    logger.info("앱 시작 - 조회 전용 모드 (크롤링은 crawler_worker.py 프로세스)")
+    counts = await asyncio.to_thread(article_store.counts)
+    missing = [category for category in CATEGORIES.keys() if not counts.get(category)]
+    warmup.start(missing)
+    if missing:
+        logger.info(f"[초기 크롤링] 크롤러 워커의 {len(missing)}개 카테고리 게시 대기")
+        threading.Thread(target=follow, args=(warmup, missing, article_store.counts),
+                         name='warmup', daemon=True).start()
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    """앱 종료 시 스케줄러 종료"""
-    scheduler.shutdown()
-    logger.info("스케줄러 종료 완료")
+    """앱 종료 시 스케줄러/새로고침 작업 큐 종료"""
+    if crawler_worker is not None:
+        crawler_worker.stop()
+    crawl_jobs.shutdown()
+    _flush_stop.set()
+    flush_request_counts()
 
 
 @app.get("/", response_class=HTMLResponse)
 async def home(request: Request, category: Optional[str] = Query(None)):
     """메인 페이지"""
-    categories = news_crawler.get_all_categories()
+    categories = category_names()
     
     return templates.TemplateResponse(
         "index.html",
@@ -175,7 +140,7 @@ async def home(request: Request, category: Optional[str] = Query(None)):
 @app.get("/api/categories")
 async def get_categories():
     """카테고리 목록 API"""
-    categories = news_crawler.get_all_categories()
+    categories = category_names()
     return {
         "success": True,
         "categories": categories
@@ -183,19 +148,19 @@ async def get_categories():
 
 
 @app.get("/api/news")
-async def get_news(category: Optional[str] = Query(None)):
-    """카테고리별 뉴스 API (파일에서 즉시 반환)"""
+async def get_news(request: Request, category: Optional[str] = Query(None)):
+    """카테고리별 뉴스 API (저장 시점에 만든 본문을 그대로 반환, If-None-Match가 맞으면 304)"""
     if not category:
         return JSONResponse(
             status_code=400,
             content={
                 "success": False,
                 "message": "카테고리를 선택해주세요.",
-                "categories": news_crawler.get_all_categories()
+                "categories": category_names()
             }
         )
     
-    if category not in news_crawler.CATEGORIES:
+    if category not in CATEGORIES:
         return JSONResponse(
             status_code=404,
             content={
@@ -204,35 +169,98 @@ async def get_news(category: Optional[str] = Query(None)):
             }
         )
     
-    # 파일에서 데이터 로드 (즉시 반환)
-    cached_data = load_news_from_file(category)
+    request_counts[category] += 1
     
-    if cached_data and cached_data.get('articles'):
-        logger.info(f"[API] {category} 카테고리 파일에서 로드: {len(cached_data['articles'])}개")
-        return {
-            "success": True,
-            "category": category,
-            "category_name": cached_data.get('category_name', news_crawler.CATEGORIES[category]['name']),
-            "count": len(cached_data['articles']),
-            "articles": cached_data['articles'],
-            "cached_at": cached_data.get('cached_at')
-        }
+    # 미리 직렬화/압축된 본문 (메모리에 있으면 즉시 반환, 없을 때만 스레드에서 저장소 조회)
+    try:
+        found, body = news_cache.cached_body(category)
+        if not found:
+            body = await asyncio.to_thread(news_cache.get_body, category)
+    except Exception as e:
+        logger.error(f"[로드] {category} 오류: {e}", exc_info=True)
+        body = None
+    
+    if body is not None:
+        headers = {"ETag": body.etag, "Vary": "Accept-Encoding", "Cache-Control": "no-cache"}
+        if etag_matches(request.headers.get('if-none-match', ''), body.etag):
+            return Response(status_code=304, headers=headers)
+        encoding = body.choose(request.headers.get('accept-encoding', ''))
+        if encoding != 'identity':
+            headers["Content-Encoding"] = encoding
+        return Response(content=body.bodies[encoding], media_type="application/json", headers=headers)
     else:
-        # 데이터가 없으면 빈 배열 반환
+        # 데이터가 없으면 빈 배열 반환 (워밍업 중이면 그 상태를 알려 줌)
         logger.warning(f"[API] {category} 카테고리 데이터 없음")
+        warming = warmup.pending(category)
         return {
             "success": True,
             "category": category,
-            "category_name": news_crawler.CATEGORIES[category]['name'],
+            "category_name": CATEGORIES[category]['name'],
             "count": 0,
             "articles": [],
-            "message": "아직 수집된 뉴스가 없습니다. 다음 크롤링 시간(오전 8시 또는 오후 5시)을 기다려주세요."
+            "warming": warming,
+            "message": ("첫 수집이 진행 중입니다. 잠시 후 다시 시도해주세요." if warming else
+                        "아직 수집된 뉴스가 없습니다. 다음 크롤링 시간(/health의 crawl_schedule)을 기다려주세요.")
         }
 
 
+@app.get("/api/news/history")
+async def get_news_history(category: Optional[str] = Query(None), days: int = Query(3, ge=1, le=ARTICLE_HISTORY_DAYS)):
+    """카테고리 기사 이력 API (보관 중인 회차 전체에서 최근 days일 발행 기사)"""
+    if not category or category not in CATEGORIES:
+        return JSONResponse(
+            status_code=404,
+            content={
+                "success": False,
+                "message": f"알 수 없는 카테고리: {category}"
+            }
+        )
+    
+    since = (datetime.now(KST) - timedelta(days=days)).isoformat()
+    articles = await asyncio.to_thread(article_store.history, category, since)
+    return {
+        "success": True,
+        "category": category,
+        "category_name": CATEGORIES[category]['name'],
+        "count": len(articles),
+        "articles": articles
+    }
+
+
+def job_response(job: CrawlJob, joined: bool = False, status_codes: bool = True):
+    """새로고침 작업 상태 응답 (끝났으면 기존 새로고침 응답 형태)
+    
+    status_codes면 실패는 500, 아직 진행 중이면 202로 돌려준다 (작업 조회 API는 항상 200).
+    """
+    body = {
+        "success": job.status != 'failed',
+        "category": job.category,
+        "category_name": CATEGORIES[job.category]['name'],
+        "job_id": job.id,
+        "status": job.status,
+        "status_url": f"/api/jobs/{job.id}",
+        "job": job.to_dict()
+    }
+    if job.status == 'done':
+        body.update(message="뉴스가 새로고침되었습니다.", count=job.count)
+        return body
+    if job.status == 'failed':
+        body["message"] = f"새로고침 중 오류가 발생했습니다: {job.error}"
+        status_code = 500
+    else:
+        body["message"] = "이미 진행 중인 새로고침에 합류했습니다." if joined else "새로고침을 진행 중입니다."
+        status_code = 202
+    return JSONResponse(status_code=status_code if status_codes else 200, content=body)
+
+
 @app.get("/api/news/refresh")
-async def refresh_news(category: Optional[str] = Query(None)):
-    """뉴스 수동 새로고침 (즉시 크롤링)"""
+async def refresh_news(category: Optional[str] = Query(None),
+                       wait: Optional[float] = Query(None, ge=0, le=300)):
+    """뉴스 수동 새로고침 (백그라운드 작업 제출 후 작업 id 반환)
+    
+    같은 카테고리 새로고침이 진행 중이면 그 작업에 합류한다.
+    wait=초를 주면 그 시간까지 완료를 기다려 끝났으면 결과를, 아니면 202를 반환한다.
+    """
     if not category:
         return JSONResponse(
             status_code=400,
@@ -242,7 +270,7 @@ async def refresh_news(category: Optional[str] = Query(None)):
             }
         )
     
-    if category not in news_crawler.CATEGORIES:
+    if category not in CATEGORIES:
         return JSONResponse(
             status_code=404,
             content={
@@ -251,86 +279,78 @@ async def refresh_news(category: Optional[str] = Query(None)):
             }
         )
     
-    try:
-        logger.info(f"[수동 새로고침] {category} 카테고리 크롤링 시작...")
-        
-        # 크롤링 수행
-        articles = news_crawler.crawl_category(category)
-        
-        # 포맷팅
-        formatted_articles = []
-        for i, article in enumerate(articles):
-            url = article.get('url', '')
-            if 'example.com' in url or not url or url.startswith('https://example'):
-                continue
-            
-            formatted_articles.append({
-                "id": f"{category}_{i}",
-                "title": article.get('title', ''),
-                "url": url,
-                "source": article.get('source', ''),
-                "publishedAt": article.get('publishedAt', datetime.now(KST).isoformat()),
-                "imageUrl": article.get('imageUrl', '') or '',
-                "summary": article.get('summary', '') or ''
-            })
-        
-        # 파일 저장
-        save_news_to_file(category, formatted_articles)
-        
-        return {
-            "success": True,
-            "message": "뉴스가 새로고침되었습니다.",
-            "category": category,
-            "category_name": news_crawler.CATEGORIES[category]['name'],
-            "count": len(formatted_articles)
-        }
-    
-    except Exception as e:
-        logger.error(f"[수동 새로고침] {category} 오류: {e}", exc_info=True)
+    # StoreJobQueue는 SQLite 호출(busy timeout 최대 10초)이라 이벤트 루프 밖에서 실행
+    job, created = await asyncio.to_thread(crawl_jobs.submit, category)
+    if wait:
+        await crawl_jobs.wait(job, wait)
+    return job_response(job, joined=not created)
+
+
+@app.get("/api/jobs/{job_id}")
+async def get_job(job_id: str):
+    """새로고침 작업 상태 조회"""
+    job = await asyncio.to_thread(crawl_jobs.get, job_id)
+    if job is None:
         return JSONResponse(
-            status_code=500,
+            status_code=404,
             content={
                 "success": False,
-                "message": f"새로고침 중 오류가 발생했습니다: {str(e)}"
+                "message": f"알 수 없는 작업: {job_id}"
             }
         )
+    return job_response(job, status_codes=False)
+
+
+@app.post("/api/internal/invalidate")
+async def invalidate_cache(request: Request):
+    """크롤러 워커의 저장 알림 → 읽기 캐시 즉시 비우기 (CRAWLER_NOTIFY_TOKEN이 맞는 요청만)
+
+    같은 호스트의 리버스 프록시 뒤에서는 외부 요청도 loopback에서 오므로 주소로 허용하지 않는다.
+    """
+    token = request.headers.get('x-notify-token', '')
+    if not CRAWLER_NOTIFY_TOKEN or not hmac.compare_digest(token.encode(), CRAWLER_NOTIFY_TOKEN.encode()):
+        return JSONResponse(status_code=403, content={"success": False, "message": "허용되지 않은 요청입니다."})
+    news_cache.invalidate()
+    return {"success": True}
 
 
 @app.get("/health")
 async def health_check():
     """헬스 체크"""
-    cached_categories = []
-    total_news = 0
-    
-    for category in news_crawler.CATEGORIES.keys():
-        data = load_news_from_file(category)
-        if data and data.get('articles'):
-            cached_categories.append(category)
-            total_news += len(data['articles'])
-    
-    # 다음 크롤링 시간 계산
-    now = datetime.now(KST)
-    next_crawl_times = []
-    
-    # 오늘 8시, 17시 확인
-    today_8am = now.replace(hour=8, minute=0, second=0, microsecond=0)
-    today_5pm = now.replace(hour=17, minute=0, second=0, microsecond=0)
+    # 회차 테이블에서 카테고리별 기사 수만 조회 (기사 본문은 읽지 않음)
+    # SQLite 조회는 크롤러 저장과 겹치면 busy timeout만큼 기다릴 수 있어 모두 스레드에서 실행
+    counts = await asyncio.to_thread(article_store.counts)
+    cached_categories = [category for category in CATEGORIES.keys() if counts.get(category)]
+    total_news = sum(counts[category] for category in cached_categories)
     
-    if now < today_8am:
-        next_crawl_times.append(today_8am.isoformat())
-    elif now < today_5pm:
-        next_crawl_times.append(today_5pm.isoformat())
-    else:
-        # 내일 8시
-        tomorrow_8am = (now + timedelta(days=1)).replace(hour=8, minute=0, second=0, microsecond=0)
-        next_crawl_times.append(tomorrow_8am.isoformat())
+    # 카테고리별 다음 크롤링 예정 (새 기사 수에 맞춰 조정되는 간격, 예정 시각 순)
+    crawl_plan = {
+        category: {
+            "next_crawl": datetime.fromtimestamp(plan['next_at'], KST).isoformat(),
+            "interval_hours": round(plan['interval'] / 3600, 2),
+            "new_per_hour": round(plan['rate'], 2) if plan['rate'] is not None else None,
+            "last_new": plan['last_new'],
+            "last_crawl": datetime.fromtimestamp(plan['last_at'], KST).isoformat() if plan['last_at'] else None,
+        }
+        for category, plan in (await asyncio.to_thread(crawl_schedule.plan)).items()
+    }
+    next_crawl_times = [plan['next_crawl'] for plan in crawl_plan.values()][:1]
     
+    readiness = warmup.to_dict()
     return {
         "status": "healthy",
+        "readiness": readiness['status'],
+        "warmup": readiness,
         "cached_categories": cached_categories,
         "total_news_count": total_news,
         "next_crawl_times": next_crawl_times,
-        "scheduler_running": scheduler.running
+        "crawl_schedule": crawl_plan,
+        "mode": API_MODE,
+        "scheduler_running": crawler_worker.scheduler.running if crawler_worker else False,
+        "scheduler_leader": scheduler_lease.is_leader,
+        "scheduler_lease": await asyncio.to_thread(scheduler_lease.holder),
+        "news_cache": news_cache.stats,
+        "refresh_jobs": await asyncio.to_thread(crawl_jobs.inflight)
     }
 
 
@@ -341,21 +361,22 @@ if __name__ == "__main__":
     print("\n📍 웹 브라우저에서 다음 주소로 접속하세요:")
     print("   👉 http://localhost:8000")
     print("\n⏰ 자동 크롤링 시간:")
-    print("   - 매일 오전 8시")
-    print("   - 매일 오후 5시")
+    print("   - 카테고리별로 새 기사가 나오는 속도에 맞춰 1~24시간 간격 (CRAWL_INTERVAL_MIN/MAX)")
     print("\n📡 API 엔드포인트:")
     print("   - GET /api/categories     : 카테고리 목록 조회")
     print("   - GET /api/news?category= : 카테고리별 뉴스 조회 (즉시 반환)")
-    print("   - GET /api/news/refresh?category= : 수동 새로고침")
+    print("   - GET /api/news/history?category=&days= : 기사 이력 조회")
+    print("   - GET /api/news/refresh?category=&wait= : 수동 새로고침 (백그라운드 작업)")
+    print("   - GET /api/jobs/{job_id}  : 새로고침 작업 상태")
     print("   - GET /health             : 서버 상태 확인")
     print("\n📂 지원 카테고리:")
-    categories = RealNewsCrawler().get_all_categories()
+    categories = category_names()
     for key, name in categories.items():
         print(f"   - {name} ({key})")
     print("\n⚠️  네이버 API 사용 시 환경변수 설정 필요:")
     print("   export NAVER_CLIENT_ID='your_client_id'")
     print("   export NAVER_CLIENT_SECRET='your_client_secret'")
-    print("\n💾 데이터 저장 위치: data/ 디렉토리")
+    print("\n💾 데이터 저장 위치: data/articles.sqlite3 (ARTICLE_STORE_PATH)")
     print("\n⏹️  종료하려면 Ctrl+C를 누르세요\n")
     print("="*60 + "\n")
     
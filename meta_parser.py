@@ -0,0 +1,372 @@
+"""기사 페이지 메타 태그 추출기 (BeautifulSoup 없이)
+
+page_metadata.parse_page_metadata가 BeautifulSoup 트리를 만들어 select_one으로
+읽던 필드를 같은 우선순위로 추출한다. 결과는 PageMetadata 필드명을 키로 하는 dict.
+
+백엔드
+- 'htmlparser': 표준 라이브러리 html.parser.HTMLParser 기반 증분 파서 (기본값, 의존성 없음)
+- 'lxml': lxml.etree HTML 파서 + XPath (requirements.txt에 포함)
+- 'selectolax': selectolax가 설치된 경우에만 사용 가능
+- 'bs4': 기존 BeautifulSoup(html.parser) 구현 (비교/benchmark 기준)
+
+환경변수 META_PARSER_BACKEND로 기본 백엔드를 바꿀 수 있다.
+
+본문 이미지(body_image)는 article 태그/본문 class 컨테이너 안의 img 중에서 고르되, 컨테이너 안의
+관련 기사/광고/사이드바 블록(_EXCLUDED_TAGS, _EXCLUDED_CLASS_RE) 안에 있는 img는 건너뛴다.
+"""
+import os
+import re
+from html.parser import HTMLParser
+from typing import Callable, Dict, List, Optional
+
+# PageMetadata에 채우는 메타 필드 (본문 텍스트 제외)
+META_FIELDS = (
+    'title', 'og_image', 'twitter_image', 'image_src', 'body_image', 'published_time',
+    'time_datetime', 'og_description', 'meta_description', 'canonical_url',
+)
+
+# <meta property=...> / <meta name=...> → 필드
+_META_PROPERTY = {
+    'og:title': 'og_title',
+    'og:image': 'og_image',
+    'og:description': 'og_description',
+    'article:published_time': 'published_time',
+}
+_META_NAME = {
+    'twitter:image': 'twitter_image',
+    'description': 'meta_description',
+}
+_LINK_REL = {
+    'image_src': 'image_src',
+    'canonical': 'canonical_url',
+}
+
+# 본문 이미지 컨테이너 (article 태그 또는 아래 class)
+_BODY_CONTAINER_CLASSES = {'post-content', 'entry-content', 'post', 'content'}
+
+# 컨테이너 안이어도 본문이 아닌 블록 (이 태그나 class 안의 img는 본문 이미지 후보에서 뺀다)
+_EXCLUDED_TAGS = {'aside', 'nav', 'footer'}
+_EXCLUDED_CLASS_RE = re.compile(
+    r'(?:^|[-_])(?:related|relation|recommend|popular|ranking|sidebar|aside|widget|banner|'
+    r'ads?|advert|advertisement|adsbygoogle|sponsor|sponsored|promo|promotion|comments?)(?:$|[-_])',
+    re.I,
+)
+
+# 본문 이미지는 컨테이너 안(제외 블록 밖)의 처음 5개 img 중 src/data-src가 있는 첫 번째
+_BODY_IMAGE_CANDIDATES = 5
+
+_VOID_TAGS = {
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta',
+    'param', 'source', 'track', 'wbr',
+}
+
+_CHARSET_RE = re.compile(rb'charset\s*=\s*["\']?\s*([A-Za-z0-9_\-]+)', re.I)
+
+
+def decode_html(html) -> str:
+    """bytes면 BOM/meta charset을 보고 디코딩 (실패 시 utf-8 대체 문자)"""
+    if isinstance(html, str):
+        return html
+
+    if html.startswith(b'\xef\xbb\xbf'):
+        return html[3:].decode('utf-8', errors='replace')
+
+    match = _CHARSET_RE.search(html[:4096])
+    if match:
+        try:
+            return html.decode(match.group(1).decode('ascii'), errors='replace')
+        except LookupError:
+            pass
+    return html.decode('utf-8', errors='replace')
+
+
+def _strip(value: Optional[str]) -> str:
+    return value.strip() if value else ''
+
+
+def _has_class(attrs: Dict[str, str], names) -> bool:
+    classes = attrs.get('class')
+    if not classes:
+        return False
+    return any(name in names for name in classes.split())
+
+
+def _excluded(tag: str, classes) -> bool:
+    """본문 이미지 후보에서 뺄 블록인지 (classes는 class 속성 문자열 또는 bs4의 class 목록)"""
+    if tag in _EXCLUDED_TAGS:
+        return True
+    if not classes:
+        return False
+    if isinstance(classes, str):
+        classes = classes.split()
+    return any(_EXCLUDED_CLASS_RE.search(name) for name in classes)
+
+
+def _finish(found: Dict[str, str]) -> Dict[str, str]:
+    """og:title 우선 제목 결정 후 META_FIELDS만 반환"""
+    result = {field: found.get(field, '') for field in META_FIELDS}
+    result['title'] = found.get('og_title', '') or found.get('title_text', '')
+    return result
+
+
+class MetaTagParser(HTMLParser):
+    """필요한 태그만 보고 첫 번째 값을 기록하는 증분 파서
+
+    BeautifulSoup select_one과 같게 각 셀렉터에 처음 매칭된 태그의 값을 쓴다
+    (처음 매칭된 태그의 content가 비어 있으면 빈 문자열).
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.found: Dict[str, str] = {}
+        self._stack: List[tuple] = []  # (tag, 본문 이미지 컨테이너 여부, 제외 블록 여부)
+        self._container_depth = 0
+        self._excluded_depth = 0
+        self._body_images_seen = 0
+        self._title_tag: Optional[str] = None  # 제목 텍스트를 모으는 중인 태그
+        self._title_depth = 0
+        self._title_parts: List[str] = []
+
+    # 필드 기록 (처음 본 값만)
+    def _set(self, field: str, value: Optional[str]):
+        if field not in self.found:
+            self.found[field] = _strip(value)
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+
+        if self._title_tag is not None and tag == self._title_tag:
+            self._title_depth += 1
+
+        if tag == 'meta':
+            field = _META_PROPERTY.get(attrs.get('property'))
+            if field:
+                self._set(field, attrs.get('content'))
+            field = _META_NAME.get(attrs.get('name'))
+            if field:
+                self._set(field, attrs.get('content'))
+        elif tag == 'link':
+            field = _LINK_REL.get(_strip(attrs.get('rel')))
+            if field:
+                self._set(field, attrs.get('href'))
+        elif tag == 'time':
+            if 'datetime' in attrs:
+                self._set('time_datetime', attrs.get('datetime'))
+        elif tag == 'img':
+            if (self._container_depth and not self._excluded_depth
+                    and self._body_images_seen < _BODY_IMAGE_CANDIDATES):
+                self._body_images_seen += 1
+                src = attrs.get('src') or attrs.get('data-src')
+                if src:
+                    self._set('body_image', src)
+
+        # 제목 후보: title, h1, .title 중 문서 순서상 첫 번째
+        if 'title_text' not in self.found and self._title_tag is None and tag not in _VOID_TAGS:
+            if tag in ('title', 'h1') or _has_class(attrs, ('title',)):
+                self._title_tag = tag
+                self._title_depth = 1
+                self._title_parts = []
+
+        if tag in _VOID_TAGS:
+            return
+        is_container = tag == 'article' or _has_class(attrs, _BODY_CONTAINER_CLASSES)
+        is_excluded = _excluded(tag, attrs.get('class'))
+        self._stack.append((tag, is_container, is_excluded))
+        if is_container:
+            self._container_depth += 1
+        if is_excluded:
+            self._excluded_depth += 1
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in _VOID_TAGS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if self._title_tag is not None and tag == self._title_tag:
+            self._title_depth -= 1
+            if self._title_depth == 0:
+                self.found['title_text'] = ''.join(self._title_parts).strip()
+                self._title_tag = None
+
+        # 닫히지 않은 태그는 일치하는 태그까지 함께 닫는다
+        for index in range(len(self._stack) - 1, -1, -1):
+            if self._stack[index][0] == tag:
+                for _, is_container, is_excluded in self._stack[index:]:
+                    if is_container:
+                        self._container_depth -= 1
+                    if is_excluded:
+                        self._excluded_depth -= 1
+                del self._stack[index:]
+                break
+
+    def handle_data(self, data):
+        if self._title_tag is not None:
+            self._title_parts.append(data.strip())
+
+    def result(self) -> Dict[str, str]:
+        if self._title_tag is not None and 'title_text' not in self.found:
+            self.found['title_text'] = ''.join(self._title_parts).strip()
+        return _finish(self.found)
+
+
+def extract_htmlparser(html) -> Dict[str, str]:
+    parser = MetaTagParser()
+    parser.feed(decode_html(html))
+    parser.close()
+    return parser.result()
+
+
+_CLASS_XPATH = "contains(concat(' ', normalize-space(@class), ' '), ' {} ')"
+_LXML_BODY_IMAGES = ' | '.join(
+    ['//article//img'] + [f"//*[{_CLASS_XPATH.format(name)}]//img" for name in sorted(_BODY_CONTAINER_CLASSES)]
+)
+_LXML_TITLE = f"//title | //h1 | //*[{_CLASS_XPATH.format('title')}]"
+
+
+def extract_lxml(html) -> Dict[str, str]:
+    from lxml import etree
+
+    root = etree.fromstring(decode_html(html), etree.HTMLParser(recover=True))
+    found: Dict[str, str] = {}
+    if root is None:
+        return _finish(found)
+
+    def first(xpath: str, attr: str, field: str):
+        nodes = root.xpath(xpath)
+        if nodes:
+            found[field] = _strip(nodes[0].get(attr))
+
+    for value, field in _META_PROPERTY.items():
+        first(f'//meta[@property="{value}"]', 'content', field)
+    for value, field in _META_NAME.items():
+        first(f'//meta[@name="{value}"]', 'content', field)
+    for value, field in _LINK_REL.items():
+        first(f'//link[normalize-space(@rel)="{value}"]', 'href', field)
+    first('//time[@datetime]', 'datetime', 'time_datetime')
+
+    images = [img for img in root.xpath(_LXML_BODY_IMAGES)
+              if not any(_excluded(node.tag, node.get('class')) for node in img.iterancestors())]
+    for img in images[:_BODY_IMAGE_CANDIDATES]:
+        src = img.get('src') or img.get('data-src')
+        if src:
+            found['body_image'] = _strip(src)
+            break
+
+    titles = root.xpath(_LXML_TITLE)
+    if titles:
+        found['title_text'] = ''.join(titles[0].itertext()).strip()
+
+    return _finish(found)
+
+
+_CSS_BODY_IMAGES = ', '.join(
+    ['article img'] + [f'.{name} img' for name in sorted(_BODY_CONTAINER_CLASSES)]
+)
+
+
+def extract_selectolax(html) -> Dict[str, str]:
+    from selectolax.parser import HTMLParser as LexborParser
+
+    tree = LexborParser(decode_html(html))
+    found: Dict[str, str] = {}
+
+    def first(selector: str, attr: str, field: str):
+        node = tree.css_first(selector)
+        if node is not None:
+            found[field] = _strip(node.attributes.get(attr))
+
+    for value, field in _META_PROPERTY.items():
+        first(f'meta[property="{value}"]', 'content', field)
+    for value, field in _META_NAME.items():
+        first(f'meta[name="{value}"]', 'content', field)
+    for value, field in _LINK_REL.items():
+        first(f'link[rel="{value}"]', 'href', field)
+    first('time[datetime]', 'datetime', 'time_datetime')
+
+    def in_excluded(node) -> bool:
+        node = node.parent
+        while node is not None:
+            if _excluded(node.tag, node.attributes.get('class')):
+                return True
+            node = node.parent
+        return False
+
+    images = [img for img in tree.css(_CSS_BODY_IMAGES) if not in_excluded(img)]
+    for img in images[:_BODY_IMAGE_CANDIDATES]:
+        src = img.attributes.get('src') or img.attributes.get('data-src')
+        if src:
+            found['body_image'] = _strip(src)
+            break
+
+    title = tree.css_first('title, h1, .title')
+    if title is not None:
+        found['title_text'] = title.text(strip=True)
+
+    return _finish(found)
+
+
+def extract_soup(soup) -> Dict[str, str]:
+    """이미 만들어진 BeautifulSoup 트리에서 추출 (본문 텍스트도 필요한 경우용)"""
+    found: Dict[str, str] = {}
+
+    def first(selector: str, attr: str, field: str):
+        tag = soup.select_one(selector)
+        if tag:
+            found[field] = _strip(tag.get(attr))
+
+    for value, field in _META_PROPERTY.items():
+        first(f'meta[property="{value}"]', 'content', field)
+    for value, field in _META_NAME.items():
+        first(f'meta[name="{value}"]', 'content', field)
+    for value, field in _LINK_REL.items():
+        first(f'link[rel="{value}"]', 'href', field)
+    first('time[datetime]', 'datetime', 'time_datetime')
+
+    images = [img for img in soup.select(_CSS_BODY_IMAGES)
+              if not any(_excluded(parent.name, parent.get('class')) for parent in img.parents)]
+    for img in images[:_BODY_IMAGE_CANDIDATES]:
+        src = img.get('src') or img.get('data-src')
+        if src:
+            found['body_image'] = _strip(src)
+            break
+
+    title = soup.select_one('title, h1, .title')
+    if title:
+        found['title_text'] = title.get_text(strip=True)
+
+    return _finish(found)
+
+
+def extract_bs4(html) -> Dict[str, str]:
+    from bs4 import BeautifulSoup
+
+    return extract_soup(BeautifulSoup(html, 'html.parser'))
+
+
+BACKENDS: Dict[str, Callable[[object], Dict[str, str]]] = {
+    'htmlparser': extract_htmlparser,
+    'lxml': extract_lxml,
+    'selectolax': extract_selectolax,
+    'bs4': extract_bs4,
+}
+
+
+def available_backends() -> List[str]:
+    """현재 환경에서 import 가능한 백엔드 목록"""
+    names = ['htmlparser', 'bs4']
+    for name, module in (('lxml', 'lxml'), ('selectolax', 'selectolax')):
+        try:
+            __import__(module)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+DEFAULT_BACKEND = os.getenv('META_PARSER_BACKEND', 'htmlparser')
+
+
+def extract_meta(html, backend: Optional[str] = None) -> Dict[str, str]:
+    """메타 필드 추출 (backend 미지정 시 DEFAULT_BACKEND)"""
+    return BACKENDS[backend or DEFAULT_BACKEND](html)
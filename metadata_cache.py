@@ -0,0 +1,148 @@
+"""기사 페이지 메타데이터 영구 캐시 (회차 간 공유)
+
+정규화 URL → 대표 이미지, 설명, 발행 시각 문자열을 SQLite에 보관한다.
+기사는 3일 필터 안에서 여러 회차 연속으로 수집되므로 이전 회차에서 받은 값을
+다시 쓴다. 조회 실패(404 등)와 쓸 만한 값이 하나도 없는 페이지는 짧게(NEGATIVE_TTL)
+기억해서 매 회차 다시 요청하지 않는다. 일시적인 실패(429, 5xx, 연결/타임아웃)는
+TRANSIENT_TTL만 기억한다 (잠깐의 장애로 썸네일/설명이 하루 동안 빠지지 않도록).
+"""
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urljoin, urlparse, urlunparse
+
+logger = logging.getLogger(__name__)
+
+METADATA_CACHE_PATH = os.getenv('METADATA_CACHE_PATH', os.path.join('cache', 'page_metadata.sqlite3'))
+
+METADATA_TTL = int(os.getenv('METADATA_TTL', str(7 * 24 * 3600)))  # 성공: 7일
+# 실패: 24시간 (하루 두 번 도는 스케줄에서 다음 회차에도 건너뛰도록)
+METADATA_NEGATIVE_TTL = int(os.getenv('METADATA_NEGATIVE_TTL', str(24 * 3600)))
+# 일시적 실패: 15분 (같은 회차/바로 다음 조회만 건너뜀)
+METADATA_TRANSIENT_TTL = int(os.getenv('METADATA_TRANSIENT_TTL', str(15 * 60)))
+
+# 캐시 키에서 빼는 추적용 쿼리 파라미터
+_TRACKING_PARAMS = ('utm_', 'fbclid', 'gclid')
+
+
+def cache_key(url: str) -> str:
+    """캐시 키 URL (scheme/host 소문자, fragment와 추적 파라미터 제거, 쿼리 정렬)"""
+    parsed = urlparse(url.strip())
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True)
+        if not k.lower().startswith(_TRACKING_PARAMS)
+    )
+    return urlunparse((
+        parsed.scheme.lower(),
+        parsed.netloc.lower(),
+        parsed.path.rstrip('/') or '/',
+        parsed.params,
+        urlencode(query),
+        '',
+    ))
+
+
+@dataclass
+class CachedMetadata:
+    """캐시된 메타데이터 (ok=False면 실패 캐시, 값은 빈 문자열)"""
+    url: str
+    image: str = ''
+    description: str = ''
+    published: str = ''
+    ok: bool = True
+
+    @property
+    def empty(self) -> bool:
+        return not (self.image or self.description or self.published)
+
+
+def absolute_url(value: str, base_url: str) -> str:
+    """상대 경로/프로토콜 생략 이미지 URL을 절대 URL로"""
+    if not value:
+        return ''
+    if value.startswith('//'):
+        return 'https:' + value
+    return urljoin(base_url, value)
+
+
+class MetadataCache:
+    """정규화 URL → 메타데이터 SQLite 캐시 (TTL + 실패 캐시)"""
+
+    def __init__(self, path: str = METADATA_CACHE_PATH, ttl: int = METADATA_TTL,
+                 negative_ttl: int = METADATA_NEGATIVE_TTL, transient_ttl: int = METADATA_TRANSIENT_TTL):
+        self.path = path
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.transient_ttl = transient_ttl
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS page_metadata (
+                url TEXT PRIMARY KEY,
+                image TEXT NOT NULL,
+                description TEXT NOT NULL,
+                published TEXT NOT NULL,
+                ok INTEGER NOT NULL,
+                expires_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute('DELETE FROM page_metadata WHERE expires_at < ?', (time.time(),))
+        self._conn.commit()
+        self.stats = {'hit': 0, 'negative_hit': 0, 'miss': 0}
+
+    def get(self, url: str) -> Optional[CachedMetadata]:
+        """만료되지 않은 항목 (없으면 None, 실패 캐시는 ok=False)"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT image, description, published, ok FROM page_metadata WHERE url = ? AND expires_at >= ?',
+                (cache_key(url), time.time()),
+            ).fetchone()
+            if row is None:
+                self.stats['miss'] += 1
+                return None
+            image, description, published, ok = row
+            self.stats['hit' if ok else 'negative_hit'] += 1
+        return CachedMetadata(url=url, image=image, description=description, published=published, ok=bool(ok))
+
+    def put(self, url: str, image: str = '', description: str = '', published: str = ''):
+        """조회 결과 저장 (값이 하나도 없으면 실패와 같이 짧게)"""
+        entry = CachedMetadata(url=url, image=image or '', description=description or '', published=published or '')
+        if entry.empty:
+            self.put_failure(url)
+            return
+        self._write(entry, self.ttl)
+
+    def put_failure(self, url: str, transient: bool = False):
+        """조회 실패 저장 (NEGATIVE_TTL, 일시적 실패는 TRANSIENT_TTL)"""
+        self._write(CachedMetadata(url=url, ok=False), self.transient_ttl if transient else self.negative_ttl)
+
+    def _write(self, entry: CachedMetadata, ttl: int):
+        try:
+            with self._lock:
+                self._conn.execute(
+                    """
+                    INSERT INTO page_metadata (url, image, description, published, ok, expires_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(url) DO UPDATE SET
+                        image = excluded.image,
+                        description = excluded.description,
+                        published = excluded.published,
+                        ok = excluded.ok,
+                        expires_at = excluded.expires_at
+                    """,
+                    (cache_key(entry.url), entry.image, entry.description, entry.published,
+                     int(entry.ok), time.time() + ttl),
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"[메타데이터 캐시] 저장 실패 ({entry.url}): {e}")
@@ -0,0 +1,105 @@
+"""/api/news 읽기 캐시 (프로세스 메모리)
+
+카테고리 payload(article_store.load 결과)를 메모리에 들고 있다가 저장소 버전이 같으면
+디스크를 보지 않고 그대로 돌려준다. 버전은 두 가지로 확인한다.
+
+- generation: 같은 프로세스의 크롤러가 저장할 때마다 올리는 카운터 (매 요청 비교, 비용 없음)
+- file_stamp: DB/WAL 파일 mtime, 다른 프로세스(워커/크롤러)가 저장한 경우용.
+  stat도 요청마다 하지 않고 NEWS_CACHE_CHECK_INTERVAL초에 한 번만 확인한다.
+
+둘 중 하나라도 바뀌면 전체를 비운다 (카테고리 12개라 다시 읽는 비용이 작다).
+
+get_body()는 저장할 때 만든 응답 본문(response_body.EncodedBody)을 캐시한다. 본문 없이 저장된
+회차(JSON 파일에서 이전한 데이터 등)는 render(payload)로 한 번 만들어 캐시에만 둔다.
+cached_body()는 메모리만 보므로 async 핸들러에서 바로 부르고, 없을 때만 get_body()를 스레드에서 부른다.
+"""
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+from article_store import ArticleStore
+from response_body import EncodedBody
+
+NEWS_CACHE_CHECK_INTERVAL = float(os.getenv('NEWS_CACHE_CHECK_INTERVAL', '1.0'))
+
+
+class NewsCache:
+    """카테고리 → 저장소 마지막 회차 payload"""
+
+    def __init__(self, store: ArticleStore, check_interval: float = NEWS_CACHE_CHECK_INTERVAL,
+                 render: Optional[Callable[[Dict], Optional[EncodedBody]]] = None):
+        self.store = store
+        self.check_interval = check_interval
+        self.render = render
+        self._entries: Dict[str, Optional[Dict]] = {}
+        self._bodies: Dict[str, Optional[EncodedBody]] = {}
+        self._lock = threading.Lock()
+        self._generation = store.generation
+        self._stamp = store.file_stamp()
+        self._next_check = time.monotonic() + check_interval
+        self.stats = {'hits': 0, 'misses': 0, 'invalidations': 0}
+
+    def _validate(self):
+        """저장소가 바뀌었으면 캐시 비우기"""
+        generation = self.store.generation
+        now = time.monotonic()
+        if generation == self._generation and now < self._next_check:
+            return
+        with self._lock:
+            changed = generation != self._generation
+            if changed or now >= self._next_check:
+                stamp = self.store.file_stamp()
+                changed = changed or stamp != self._stamp
+                self._stamp = stamp
+                self._next_check = now + self.check_interval
+            self._generation = generation
+            if changed and (self._entries or self._bodies):
+                self._entries.clear()
+                self._bodies.clear()
+                self.stats['invalidations'] += 1
+
+    def get(self, category: str) -> Optional[Dict]:
+        """카테고리 payload (없으면 None, 없는 것도 캐시)"""
+        self._validate()
+        if category in self._entries:
+            self.stats['hits'] += 1
+            return self._entries[category]
+        generation = self.store.generation
+        data = self.store.load(category)
+        with self._lock:
+            self.stats['misses'] += 1
+            # 읽는 도중 저장됐으면 다음 요청이 다시 읽도록 넣지 않는다
+            if generation == self.store.generation:
+                self._entries[category] = data
+        return data
+
+    def cached_body(self, category: str) -> Tuple[bool, Optional[EncodedBody]]:
+        """메모리에 있는 응답 본문만 (캐시에 있었는지, 본문), 저장소는 읽지 않는다"""
+        self._validate()
+        if category in self._bodies:
+            self.stats['hits'] += 1
+            return True, self._bodies[category]
+        return False, None
+
+    def get_body(self, category: str) -> Optional[EncodedBody]:
+        """카테고리 응답 본문 (회차가 없거나 render가 None을 주면 None)"""
+        found, body = self.cached_body(category)
+        if found:
+            return body
+        generation = self.store.generation
+        body = self.store.load_body(category)
+        if body is None and self.render is not None:
+            data = self.store.load(category)
+            body = self.render(data) if data else None
+        with self._lock:
+            self.stats['misses'] += 1
+            if generation == self.store.generation:
+                self._bodies[category] = body
+        return body
+
+    def invalidate(self):
+        with self._lock:
+            self._entries.clear()
+            self._bodies.clear()
+            self.stats['invalidations'] += 1
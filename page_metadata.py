@@ -0,0 +1,495 @@
+"""기사 페이지 메타데이터 단일 fetch + 파싱
+
+한 URL을 한 번만 다운로드/파싱해서 og:image, twitter:image, published_time,
+description, canonical URL 등을 함께 돌려준다. 날짜 조회와 이미지 조회가
+같은 페이지를 두 번 받지 않도록 크롤링 회차 동안 결과(실패 포함)를 메모한다.
+
+head_only 모드에서는 본문을 스트리밍으로 읽다가 </head> 또는 max_bytes에서
+멈추고 연결을 닫는다 (메타 태그만 필요한 경우 대역폭/지연 절감). <head>에 대표 이미지
+(og:image/twitter:image/image_src)가 없으면 같은 응답을 body_max_bytes까지 이어 읽어
+본문 첫 이미지(body_image)를 찾는다.
+
+cache(metadata_cache.MetadataCache)를 주면 회차 메모 다음으로 영구 캐시를 먼저 보고,
+네트워크로 가져온 결과(실패 포함)를 저장한다. 2xx 응답만 파싱하며, 429/5xx/연결 오류 같은
+일시적 실패는 영구 캐시에 짧게만 남긴다.
+
+include_text 모드에서는 날짜가 있을 법한 영역(JSON-LD datePublished, itemprop/time, 날짜 class,
+글 머리, 제목 주변)의 텍스트만 date_regions로 따로 모은다 (합계 DATE_SCAN_BUDGET자 이내).
+"""
+import asyncio
+import copy
+import json
+import logging
+import os
+import threading
+from concurrent.futures import Future
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable, Dict, Iterator, List, Optional
+
+import requests
+from bs4 import BeautifulSoup, Tag
+
+from date_parser import parse_date
+
+from meta_parser import extract_meta, extract_soup
+from metadata_cache import MetadataCache, absolute_url
+
+logger = logging.getLogger(__name__)
+
+# head_only 모드 기본 최대 읽기 바이트 (</head>가 없거나 늦게 나오는 페이지 상한)
+DEFAULT_MAX_BYTES = 256 * 1024
+
+# head_only 모드에서 <head>에 이미지가 없을 때 본문 이미지를 찾으려고 이어 읽는 상한
+DEFAULT_BODY_MAX_BYTES = int(os.getenv('PAGE_BODY_MAX_BYTES', str(512 * 1024)))
+
+# 스트리밍 읽기 청크 크기
+CHUNK_SIZE = 16 * 1024
+
+_HEAD_END = b'</head>'
+
+# 본문 텍스트 추출 시 제거하는 태그
+NOISE_TAGS = ['script', 'style', 'nav', 'header', 'footer', 'aside', 'advertisement']
+
+# 본문 영역 후보
+ARTICLE_BODY_SELECTOR = 'article, .post-content, .entry-content, .article-body, .content'
+
+# 날짜 후보 영역 텍스트 합계 상한 (문자 수), 영역 하나의 상한
+DATE_SCAN_BUDGET = int(os.getenv('DATE_SCAN_BUDGET', '2000'))
+DATE_REGION_MAX_CHARS = 200
+
+# 날짜가 있을 법한 영역: 날짜 class, 글 머리 class/태그, 제목 class/태그 (제목은 부모 블록을 읽음)
+DATE_CLASSES = {'date', 'post-date', 'entry-date', 'published', 'txt_date', 'se_publishdate', 'blog_date',
+                'article_date', 'se_date', 'date_time'}
+DATE_HEADER_CLASSES = {'post-header', 'entry-header', 'article-header', 'article_info', 'info_view', 'se_title'}
+DATE_TITLE_CLASSES = {'title', 'tit_h3', 'se-title-text', 'tit_view'}
+
+
+@dataclass
+class PageMetadata:
+    """기사 페이지에서 한 번에 추출한 메타데이터 (값이 없으면 빈 문자열)"""
+    url: str
+    final_url: str = ''
+    title: str = ''
+    og_image: str = ''
+    twitter_image: str = ''
+    image_src: str = ''
+    body_image: str = ''
+    published_time: str = ''
+    time_datetime: str = ''
+    og_description: str = ''
+    meta_description: str = ''
+    canonical_url: str = ''
+    # include_text=True 인 fetcher에서만 채워짐 (page_text는 full_text일 때 또는 본문 영역이 없을 때)
+    page_text: str = ''
+    body_text: str = ''
+    date_regions: List[str] = field(default_factory=list)
+
+    @property
+    def description(self) -> str:
+        """og:description 우선, 없으면 meta description"""
+        return self.og_description or self.meta_description
+
+
+def is_transient_status(status: int) -> bool:
+    """다시 요청하면 성공할 수 있는 응답 (408, 429, 5xx)"""
+    return status in (408, 429) or status >= 500
+
+
+@asynccontextmanager
+async def _no_limit():
+    yield
+
+
+def _find_key(data, key: str, depth: int = 0) -> str:
+    """JSON-LD에서 key의 첫 문자열 값 (@graph/목록 안쪽까지, 깊이 제한)"""
+    if depth > 4:
+        return ''
+    if isinstance(data, dict):
+        value = data.get(key)
+        if isinstance(value, str) and value:
+            return value
+        children = data.values()
+    elif isinstance(data, list):
+        children = data
+    else:
+        return ''
+    for child in children:
+        found = _find_key(child, key, depth + 1)
+        if found:
+            return found
+    return ''
+
+
+def _jsonld_published(tag) -> str:
+    try:
+        data = json.loads(tag.string or '')
+    except ValueError:
+        return ''
+    return _find_key(data, 'datePublished').strip()
+
+
+def _region_text(tag, limit: int) -> str:
+    """영역 텍스트 앞부분 (문자열을 limit자까지만 모음)"""
+    parts = []
+    size = 0
+    for text in tag.stripped_strings:
+        parts.append(text)
+        size += len(text) + 1
+        if size >= limit:
+            break
+    return ' '.join(parts)[:limit]
+
+
+def _date_region_kind(tag) -> str:
+    """'exact' = 속성/JSON-LD의 발행 시각, 'text' = 날짜 영역, 'title' = 제목 (부모를 읽음), '' = 아님"""
+    name = tag.name
+    if name == 'script':
+        return 'exact' if tag.get('type') == 'application/ld+json' else ''
+    if name == 'time' and tag.get('datetime'):
+        return 'exact'
+    if tag.get('itemprop') == 'datePublished':
+        return 'exact' if tag.get('content') or tag.get('datetime') else 'text'
+    if name == 'header':
+        return 'text'
+    if name == 'h1':
+        return 'title'
+    for cls in tag.get('class') or ():
+        cls = cls.lower()
+        if cls in DATE_CLASSES or cls in DATE_HEADER_CLASSES or 'date' in cls:
+            return 'text'
+        if cls in DATE_TITLE_CLASSES:
+            return 'title'
+    return ''
+
+
+def extract_date_regions(soup, budget: int = DATE_SCAN_BUDGET) -> List[str]:
+    """날짜가 있을 법한 영역 텍스트 (문서 순서, 합계 budget자 이하)
+
+    트리를 한 번만 훑으면서 JSON-LD datePublished, itemprop/time 속성처럼 확실한 값을 만나면
+    그것만 돌려주고 끝낸다. 날짜 class/글 머리/제목 주변 블록은 앞부분 텍스트만 모으고
+    안쪽은 다시 보지 않으며, 날짜로 읽히는 영역이 나오거나 예산을 다 쓰면 멈춘다.
+    문서 전체 텍스트는 만들지 않는다.
+    """
+    regions: List[str] = []
+    taken = set()
+    stack = [soup]
+    while stack and budget > 0:
+        node = stack.pop()
+        kind = _date_region_kind(node) if node is not soup else ''
+        if kind == 'exact':
+            value = (_jsonld_published(node) if node.name == 'script'
+                     else node.get('content') or node.get('datetime') or '').strip()
+            if value:
+                return [value[:DATE_REGION_MAX_CHARS]]
+            continue
+        if kind:
+            region = node.parent if kind == 'title' and node.parent is not None else node
+            if id(region) not in taken:
+                taken.add(id(region))
+                text = _region_text(region, min(DATE_REGION_MAX_CHARS, budget))
+                if text:
+                    regions.append(text)
+                    budget -= len(text)
+                    if parse_date(text):
+                        break
+            continue
+        # 자식을 문서 순서대로 꺼내도록 역순으로 쌓는다
+        stack.extend(child for child in reversed(node.contents) if isinstance(child, Tag))
+    return regions
+
+
+def parse_page_metadata(html, url: str, final_url: str = '', include_text: bool = False,
+                        backend: Optional[str] = None, full_text: bool = True,
+                        date_budget: int = DATE_SCAN_BUDGET) -> PageMetadata:
+    """HTML에서 메타데이터 추출 (네트워크 호출 없음)
+
+    메타 태그만 필요하면 meta_parser의 경량 파서를 쓰고, 본문 텍스트가 필요하면
+    BeautifulSoup 트리 하나로 메타 태그와 텍스트를 함께 추출한다.
+    full_text=False면 본문 영역이 있는 페이지에서 문서 전체 텍스트(page_text)를 만들지 않는다.
+    """
+    if not include_text:
+        return PageMetadata(url=url, final_url=final_url or url, **extract_meta(html, backend))
+
+    soup = BeautifulSoup(html, 'html.parser')
+    meta = PageMetadata(url=url, final_url=final_url or url, **extract_soup(soup))
+    # JSON-LD/header는 아래에서 지우므로 먼저 모은다
+    meta.date_regions = extract_date_regions(soup, date_budget)
+
+    for tag in soup(NOISE_TAGS):
+        tag.decompose()
+    article_body = soup.select_one(ARTICLE_BODY_SELECTOR)
+    if full_text or article_body is None:
+        meta.page_text = soup.get_text(separator=' ', strip=True)
+    meta.body_text = article_body.get_text(separator=' ', strip=True) if article_body else meta.page_text
+
+    return meta
+
+
+class HeadBuffer:
+    """스트리밍 청크를 모으다가 </head> 또는 max_bytes에서 멈추는 버퍼"""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.data = bytearray()
+        # </head>를 찾았는지, 그 청크에서 </head> 뒤에 남은 bytes (본문 이어 읽기용)
+        self.head_end = False
+        self.rest = b''
+
+    def feed(self, chunk: bytes) -> bool:
+        """청크 추가, 더 읽을 필요가 없으면 True"""
+        # 청크 경계에 걸친 </head>도 찾도록 이전 끝부분부터 검색
+        search_from = max(0, len(self.data) - len(_HEAD_END) + 1)
+        self.data.extend(chunk)
+        end = self.data.lower().find(_HEAD_END, search_from)
+        if end != -1:
+            self.head_end = True
+            self.rest = bytes(self.data[end + len(_HEAD_END):])
+            del self.data[end + len(_HEAD_END):]
+            return True
+        if len(self.data) >= self.max_bytes:
+            del self.data[self.max_bytes:]
+            return True
+        return False
+
+
+def read_head(chunks: Iterator[bytes], max_bytes: int = DEFAULT_MAX_BYTES) -> HeadBuffer:
+    """스트리밍 청크에서 <head>까지만 읽기 (chunks는 이어 읽을 수 있도록 닫지 않는다)"""
+    buffer = HeadBuffer(max_bytes)
+    for chunk in chunks:
+        if buffer.feed(chunk):
+            break
+    return buffer
+
+
+async def read_head_async(chunks: AsyncIterator[bytes], max_bytes: int = DEFAULT_MAX_BYTES) -> HeadBuffer:
+    """httpx 스트리밍 청크에서 <head>까지만 읽기"""
+    buffer = HeadBuffer(max_bytes)
+    async for chunk in chunks:
+        if buffer.feed(chunk):
+            break
+    return buffer
+
+
+def read_body(chunks: Iterator[bytes], buffer: HeadBuffer, max_bytes: int = DEFAULT_BODY_MAX_BYTES) -> bytes:
+    """read_head 뒤에 이어서 문서 앞부분 max_bytes까지 읽기"""
+    data = buffer.data + buffer.rest
+    for chunk in chunks:
+        if len(data) >= max_bytes:
+            break
+        data.extend(chunk)
+    return bytes(data[:max_bytes])
+
+
+async def read_body_async(chunks: AsyncIterator[bytes], buffer: HeadBuffer,
+                          max_bytes: int = DEFAULT_BODY_MAX_BYTES) -> bytes:
+    """read_head_async 뒤에 이어서 문서 앞부분 max_bytes까지 읽기"""
+    data = buffer.data + buffer.rest
+    async for chunk in chunks:
+        if len(data) >= max_bytes:
+            break
+        data.extend(chunk)
+    return bytes(data[:max_bytes])
+
+
+class PageMetadataFetcher:
+    """URL별 메타데이터를 한 번만 가져오는 fetcher (스레드/asyncio 공용 메모)
+
+    같은 URL을 동시에 요청하면 먼저 시작한 요청의 결과를 함께 기다린다.
+    실패(None)도 메모하므로 한 회차 안에서 죽은 페이지를 다시 받지 않는다.
+    head_only=True면 </head>(또는 max_bytes)까지만 읽으므로 본문 텍스트는 그 범위 안에 있을
+    때만 채워진다. 본문 이미지는 <head>에 대표 이미지가 없을 때만 body_max_bytes까지 이어 읽어
+    찾는다. include_text나 get을 쓰면 항상 전체를 읽는다.
+    영구 캐시에서 꺼낸 메타데이터는 og_image(대표 이미지), og_description, published_time만 채워진다.
+    """
+
+    def __init__(self, session: requests.Session, timeout: int = 5, include_text: bool = False,
+                 get: Optional[Callable[[str], Optional[requests.Response]]] = None,
+                 head_only: bool = False, max_bytes: int = DEFAULT_MAX_BYTES,
+                 body_max_bytes: int = DEFAULT_BODY_MAX_BYTES, cache: Optional[MetadataCache] = None, full_text: bool = True,
+                 date_budget: int = DATE_SCAN_BUDGET):
+        self.session = session
+        self.timeout = timeout
+        self.include_text = include_text
+        # include_text일 때 문서 전체 텍스트(page_text)까지 만들지, 날짜 후보 영역 예산
+        self.full_text = full_text
+        self.date_budget = date_budget
+        # 동기 조회 함수 교체용 (예: 재시도 포함 fetch_with_retry), 실패 시 None 반환
+        self.get = get
+        self.head_only = head_only and not include_text and get is None
+        self.max_bytes = max_bytes
+        self.body_max_bytes = body_max_bytes
+        # 본문 텍스트는 영구 캐시에 없으므로 include_text면 쓰지 않는다
+        self.cache = cache if not include_text else None
+        self._futures: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def reset(self):
+        """메모 초기화 (크롤링 회차 시작 시)"""
+        with self._lock:
+            self._futures = {}
+
+    def fork(self) -> 'PageMetadataFetcher':
+        """같은 세션/영구 캐시를 쓰고 회차 메모만 따로 가진 fetcher (동시에 도는 회차끼리 메모를 섞지 않도록)"""
+        fetcher = copy.copy(self)
+        fetcher._futures = {}
+        fetcher._lock = threading.Lock()
+        return fetcher
+
+    def peek(self, url: str) -> Optional[PageMetadata]:
+        """이번 회차에 이미 가져온 메타데이터 (없거나 아직 진행 중이면 None, 네트워크 호출 없음)"""
+        with self._lock:
+            future = self._futures.get(url)
+        if future is None or not future.done():
+            return None
+        return future.result()
+
+    def _claim(self, url: str):
+        """(future, owner) 반환 - owner이면 직접 가져와서 결과를 채워야 한다"""
+        with self._lock:
+            future = self._futures.get(url)
+            if future is not None:
+                return future, False
+            future = Future()
+            self._futures[url] = future
+            return future, True
+
+    def _cached(self, url: str):
+        """영구 캐시 조회 → (찾음 여부, 메타데이터) - 실패 캐시는 (True, None)"""
+        if self.cache is None:
+            return False, None
+        entry = self.cache.get(url)
+        if entry is None:
+            return False, None
+        if not entry.ok:
+            return True, None
+        return True, PageMetadata(url=url, final_url=url, og_image=entry.image,
+                                  og_description=entry.description, published_time=entry.published)
+
+    def _remember(self, url: str, meta: Optional[PageMetadata], transient: bool = False):
+        """가져온 결과를 영구 캐시에 저장 (대표 이미지는 절대 URL로)"""
+        if self.cache is None:
+            return
+        if meta is None:
+            self.cache.put_failure(url, transient=transient)
+            return
+        image = meta.og_image or meta.twitter_image or meta.image_src or meta.body_image
+        self.cache.put(url, image=absolute_url(image, meta.url), description=meta.description,
+                       published=meta.published_time or meta.time_datetime)
+
+    def _parse(self, content, url: str, final_url: str) -> Optional[PageMetadata]:
+        try:
+            return parse_page_metadata(content, url, final_url, include_text=self.include_text,
+                                       full_text=self.full_text, date_budget=self.date_budget)
+        except Exception as e:
+            logger.debug(f"[메타데이터 파싱 실패] {url}: {e}")
+            return None
+
+    @staticmethod
+    def _failed(response, url: str) -> Optional[bool]:
+        """2xx가 아니면 일시적 실패인지 반환 (2xx면 None, 오류 페이지는 파싱하지 않는다)"""
+        if 200 <= response.status_code < 300:
+            return None
+        logger.debug(f"[메타데이터 조회 실패] {url}: HTTP {response.status_code}")
+        return is_transient_status(response.status_code)
+
+    @staticmethod
+    def _needs_body(meta: Optional[PageMetadata], buffer: HeadBuffer) -> bool:
+        """<head>까지만 읽었는데 대표 이미지가 없어 본문 첫 이미지를 찾아야 하는지"""
+        return (meta is not None and buffer.head_end and
+                not (meta.og_image or meta.twitter_image or meta.image_src or meta.body_image))
+
+    def _fill_body_image(self, meta: PageMetadata, content: bytes):
+        body_meta = self._parse(content, meta.url, meta.final_url)
+        if body_meta is not None:
+            meta.body_image = body_meta.body_image
+
+    def fetch(self, url: str) -> Optional[PageMetadata]:
+        """requests 세션으로 메타데이터 조회 (메모 우선)"""
+        if not url:
+            return None
+
+        future, owner = self._claim(url)
+        if not owner:
+            return future.result()
+
+        found, meta = self._cached(url)
+        if found:
+            future.set_result(meta)
+            return meta
+
+        transient = False
+        try:
+            if self.head_only:
+                response = self.session.get(url, timeout=self.timeout, allow_redirects=True, stream=True)
+                try:
+                    transient = self._failed(response, url)
+                    if transient is None:
+                        chunks = response.iter_content(chunk_size=CHUNK_SIZE)
+                        buffer = read_head(chunks, self.max_bytes)
+                        meta = self._parse(bytes(buffer.data), url, response.url)
+                        if self._needs_body(meta, buffer):
+                            self._fill_body_image(meta, read_body(chunks, buffer, self.body_max_bytes))
+                finally:
+                    response.close()
+            else:
+                if self.get is not None:
+                    response = self.get(url)
+                else:
+                    response = self.session.get(url, timeout=self.timeout, allow_redirects=True)
+                # get이 None을 주면 재시도까지 실패한 것 (일시적 실패로 본다)
+                transient = True if response is None else self._failed(response, url)
+                if transient is None:
+                    meta = self._parse(response.content, url, response.url)
+        except Exception as e:
+            transient = True
+            logger.debug(f"[메타데이터 조회 실패] {url}: {e}")
+        self._remember(url, meta, transient=bool(transient))
+        future.set_result(meta)
+        return meta
+
+    async def fetch_async(self, client, url: str, limit=None) -> Optional[PageMetadata]:
+        """httpx.AsyncClient로 메타데이터 조회 (limit: 동시 요청 제한 async context manager 팩토리)"""
+        if not url:
+            return None
+
+        future, owner = self._claim(url)
+        if not owner:
+            # 기다리는 쪽이 취소되어도 공유 future는 취소되지 않도록 shield
+            return await asyncio.shield(asyncio.wrap_future(future))
+
+        found, meta = self._cached(url)
+        if found:
+            future.set_result(meta)
+            return meta
+
+        transient = False
+        try:
+            async with (limit() if limit is not None else _no_limit()):
+                if self.head_only:
+                    async with client.stream('GET', url, timeout=self.timeout) as response:
+                        transient = self._failed(response, url)
+                        if transient is None:
+                            chunks = response.aiter_bytes(CHUNK_SIZE)
+                            buffer = await read_head_async(chunks, self.max_bytes)
+                            meta = self._parse(bytes(buffer.data), url, str(response.url))
+                            if self._needs_body(meta, buffer):
+                                self._fill_body_image(meta, await read_body_async(chunks, buffer,
+                                                                                  self.body_max_bytes))
+                else:
+                    response = await client.get(url, timeout=self.timeout)
+                    transient = self._failed(response, url)
+                    if transient is None:
+                        meta = self._parse(response.content, url, str(response.url))
+        except asyncio.CancelledError:
+            # 취소된 조회는 메모하지 않는다 (기다리던 쪽은 None을 받는다)
+            with self._lock:
+                self._futures.pop(url, None)
+            future.set_result(None)
+            raise
+        except Exception as e:
+            transient = True
+            logger.debug(f"[메타데이터 조회 실패] {url}: {e}")
+        self._remember(url, meta, transient=bool(transient))
+        future.set_result(meta)
+        return meta
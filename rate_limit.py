@@ -0,0 +1,146 @@
+"""호스트별 토큰 버킷 속도 제한 (스레드/asyncio 공용)
+
+고정 time.sleep 대신 도메인마다 초당 요청 수(rps)와 버스트(burst)를 지키도록
+요청 직전에 필요한 만큼만 기다린다. 버킷은 토큰을 먼저 예약하고 대기 시간을
+돌려주는 방식이라 잠금은 계산하는 동안만 잡는다. 그래서 여러 스레드와 코루틴이
+같은 리미터를 공유해도 서로 다른 호스트 요청은 서로를 기다리지 않는다.
+
+설정 (환경변수)
+- RATE_LIMIT_RPS / RATE_LIMIT_BURST: 기본값 (호스트별 설정이 없을 때)
+- RATE_LIMITS: 도메인별 설정 "search.naver.com=2:4,news.google.com=5:10"
+  (도메인은 하위 도메인까지 적용, 가장 구체적인 도메인 우선)
+"""
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RPS = float(os.getenv('RATE_LIMIT_RPS', '5'))
+DEFAULT_BURST = int(os.getenv('RATE_LIMIT_BURST', '10'))
+
+# 검색 결과 HTML을 긁는 호스트는 보수적으로
+DEFAULT_HOST_LIMITS: Dict[str, Tuple[float, int]] = {
+    'search.naver.com': (2.0, 4),
+    'search.daum.net': (2.0, 4),
+    'openapi.naver.com': (8.0, 8),
+}
+
+
+def parse_host_limits(spec: str) -> Dict[str, Tuple[float, int]]:
+    """"domain=rps:burst,..." 파싱 (잘못된 항목은 경고 후 무시)"""
+    limits = {}
+    for item in spec.split(','):
+        item = item.strip()
+        if not item:
+            continue
+        try:
+            domain, value = item.split('=', 1)
+            rps, _, burst = value.partition(':')
+            limits[domain.strip().lower()] = (float(rps), int(burst or max(1, round(float(rps)))))
+        except ValueError:
+            logger.warning(f"[속도 제한] 잘못된 설정 무시: {item}")
+    return limits
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지고 최대 burst개까지 쌓이는 토큰 버킷"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """토큰 하나를 예약하고 기다려야 할 시간(초) 반환"""
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+class HostRateLimiter:
+    """호스트별 TokenBucket 모음"""
+
+    def __init__(self, rps: float = DEFAULT_RPS, burst: int = DEFAULT_BURST,
+                 host_limits: Optional[Dict[str, Tuple[float, int]]] = None):
+        self.rps = rps
+        self.burst = burst
+        self.host_limits = dict(DEFAULT_HOST_LIMITS if host_limits is None else host_limits)
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+        self.stats = {'requests': 0, 'delayed': 0, 'wait_seconds': 0.0}
+
+    @classmethod
+    def from_env(cls) -> 'HostRateLimiter':
+        return cls(host_limits={**DEFAULT_HOST_LIMITS, **parse_host_limits(os.getenv('RATE_LIMITS', ''))})
+
+    def limits_for(self, host: str) -> Tuple[float, int]:
+        """호스트에 적용할 (rps, burst) - 가장 긴(구체적인) 도메인 설정 우선"""
+        matches = [d for d in self.host_limits if host == d or host.endswith('.' + d)]
+        if matches:
+            return self.host_limits[max(matches, key=len)]
+        return self.rps, self.burst
+
+    def bucket(self, host: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(*self.limits_for(host))
+                self._buckets[host] = bucket
+            return bucket
+
+    def reserve(self, url: str) -> float:
+        """url 호스트의 토큰 예약 → 대기 시간(초)"""
+        host = (urlparse(url).hostname or '').lower()
+        delay = self.bucket(host).reserve() if host else 0.0
+        with self._lock:
+            self.stats['requests'] += 1
+            if delay > 0:
+                self.stats['delayed'] += 1
+                self.stats['wait_seconds'] += delay
+        return delay
+
+    def acquire(self, url: str):
+        """스레드용: 필요한 만큼 time.sleep"""
+        delay = self.reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, url: str):
+        """asyncio용: 필요한 만큼 asyncio.sleep (이벤트 루프를 막지 않음)"""
+        delay = self.reserve(url)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def httpx_hook(self, request):
+        """httpx.AsyncClient event_hooks['request']용 (리다이렉트 요청도 포함)"""
+        await self.acquire_async(str(request.url))
+
+
+class RateLimitedSession(requests.Session):
+    """모든 요청(get/head/post, 스트리밍 포함) 전에 호스트별 토큰을 받는 Session"""
+
+    def __init__(self, limiter: Optional[HostRateLimiter] = None):
+        super().__init__()
+        self.limiter = limiter or RATE_LIMITER
+
+    def request(self, method, url, *args, **kwargs):
+        self.limiter.acquire(url)
+        return super().request(method, url, *args, **kwargs)
+
+
+# 프로세스 전체에서 공유하는 기본 리미터
+RATE_LIMITER = HostRateLimiter.from_env()
@@ -1,103 +1,43 @@
-import requests
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Set
-import re
-import feedparser
+import copy
 import logging
-from urllib.parse import urlparse, urljoin, urlunparse, quote, parse_qs
-import time
-from difflib import SequenceMatcher
+from urllib.parse import urlparse, urljoin, quote, parse_qs
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import pytz
+
+from article import KST, Article, normalize_url
+from async_crawler import AsyncCrawlEngine
+from categories import CATEGORIES
+from date_parser import DATE_PARSER
+from feed_cache import FeedCache
+from feed_pipeline import PipelineStats
+from fingerprint_store import FingerprintStore
+from metadata_cache import MetadataCache
+from page_metadata import PageMetadata, PageMetadataFetcher
+from rate_limit import RateLimitedSession
+from title_index import unique_title_mask
+from url_resolver import GoogleNewsURLCache
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# 한국 시간대
-KST = pytz.timezone('Asia/Seoul')
-
 
 class RealNewsCrawler:
     """실제 뉴스/블로그 소스에서 수집하는 크롤러 (3일 필터 + 썸네일 개선)"""
     
-    # 카테고리 정의 (slug 기반)
-    CATEGORIES = {
-        'health': {
-            'name': '건강·운동',
-            'keywords': ['건강', '운동', '다이어트', '헬스', '요가', '필라테스'],
-            'google_query': '건강 운동 OR 다이어트 OR 헬스',
-            'naver_query': '건강 운동'
-        },
-        'food': {
-            'name': '맛집·레시피',
-            'keywords': ['맛집', '레시피', '요리', '혼밥', '카페'],
-            'google_query': '맛집 레시피 OR 요리',
-            'naver_query': '맛집 레시피'
-        },
-        'finance': {
-            'name': '재테크·돈관리',
-            'keywords': ['재테크', '투자', '주식', '가계부', '절약'],
-            'google_query': '재테크 투자 OR 주식',
-            'naver_query': '재테크 투자'
-        },
-        'travel': {
-            'name': '여행·주말나들이',
-            'keywords': ['여행', '주말', '당일치기', '여행지', '명소'],
-            'google_query': '여행 주말 OR 당일치기',
-            'naver_query': '여행 주말'
-        },
-        'relationship': {
-            'name': '연애·관계·심리',
-            'keywords': ['연애', '심리', '관계', 'MBTI', '대화법'],
-            'google_query': '연애 심리 OR 관계',
-            'naver_query': '연애 심리'
-        },
-        'self_improvement': {
-            'name': '자기계발·공부법',
-            'keywords': ['자기계발', '공부법', '시간관리', '독서'],
-            'google_query': '자기계발 공부법 OR 시간관리',
-            'naver_query': '자기계발 공부법'
-        },
-        'it': {
-            'name': 'IT·앱·AI 트렌드',
-            'keywords': ['IT', '앱', 'AI', '기술', '스마트폰'],
-            'google_query': 'IT AI OR 앱 OR 기술',
-            'naver_query': 'IT AI'
-        },
-        'beauty': {
-            'name': '뷰티·패션·그루밍',
-            'keywords': ['뷰티', '패션', '스킨케어', '화장품'],
-            'google_query': '뷰티 패션 OR 스킨케어',
-            'naver_query': '뷰티 패션'
-        },
-        'home': {
-            'name': '집·인테리어·살림',
-            'keywords': ['인테리어', '집꾸미기', '정리정돈', '청소'],
-            'google_query': '인테리어 집꾸미기 OR 정리정돈',
-            'naver_query': '인테리어 집꾸미기'
-        },
-        'hobby': {
-            'name': '취미·문화생활',
-            'keywords': ['영화', '드라마', '전시', '음악', '취미'],
-            'google_query': '영화 드라마 OR 전시 OR 음악',
-            'naver_query': '영화 드라마'
-        },
-        'family': {
-            'name': '육아·가족·반려동물',
-            'keywords': ['육아', '아이', '반려동물', '강아지', '고양이'],
-            'google_query': '육아 반려동물 OR 강아지',
-            'naver_query': '육아 반려동물'
-        },
-        'sports': {
-            'name': '스포츠',
-            'keywords': ['스포츠', '축구', '야구', '농구', '배구'],
-            'google_query': '스포츠 축구 OR 야구 OR 농구',
-            'naver_query': '스포츠 축구'
-        }
+    # 카테고리 정의 (slug 기반, categories.py - API 서버도 크롤러 없이 쓰도록 분리)
+    CATEGORIES = CATEGORIES
+    
+    # 네이버 검색 API 종류별 로그 라벨
+    NAVER_LABELS = {
+        'news': '네이버 뉴스',
+        'blog': '네이버 블로그',
     }
     
+    # 페이지 메타데이터 조회 시 최대 읽기 바이트 (</head>를 못 찾은 경우)
+    PAGE_MAX_BYTES = int(os.getenv('PAGE_MAX_BYTES', str(256 * 1024)))
+    
     # 티스토리 RSS 소스 리스트
     TISTORY_RSS_SOURCES = [
         'https://brunch.co.kr/rss',
@@ -110,108 +50,83 @@ class RealNewsCrawler:
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
         }
-        self.session = requests.Session()
+        # 모든 요청이 호스트별 토큰 버킷을 거친다 (rate_limit.RATE_LIMITER 공유)
+        self.session = RateLimitedSession()
         self.session.headers.update(self.headers)
         
+        # 페이지 메타데이터 (날짜/이미지 조회가 같은 페이지를 한 번만 받도록 회차 단위 메모)
+        # 메타 태그만 필요하므로 </head>까지만 스트리밍으로 읽는다
+        # 이전 회차에 받은 이미지/설명/발행 시각은 영구 캐시에서 재사용 (실패도 짧게 기억)
+        self.metadata_cache = MetadataCache()
+        self.page_metadata = PageMetadataFetcher(self.session, head_only=True, max_bytes=self.PAGE_MAX_BYTES,
+                                                 cache=self.metadata_cache)
+        
+        # RSS 피드 조건부 GET 캐시 (ETag / Last-Modified, 304면 캐시 본문 재사용)
+        self.feed_cache = FeedCache()
+        
+        # 구글 뉴스 리다이렉트 → 원문 URL 영구 캐시 (실패도 짧게 기억)
+        self.url_cache = GoogleNewsURLCache()
+        
+        # 카테고리/회차 간 기사 fingerprint (이미 보강한 기사는 resolve/이미지 조회 생략)
+        self.fingerprints = FingerprintStore()
+        
+        # 발행 시각 파서 (소스별로 마지막에 맞은 형식부터 시도, 인스턴스 간 공유)
+        self.date_parser = DATE_PARSER
+        
         # 네이버 API 키
         self.naver_client_id = os.getenv('NAVER_CLIENT_ID', '')
         self.naver_client_secret = os.getenv('NAVER_CLIENT_SECRET', '')
         
+        self.begin_run()
+    
+    def begin_run(self):
+        """크롤링 회차 시작: 3일 필터 기준 시간 갱신 + 페이지 메타데이터 메모 초기화"""
         # 3일 필터 기준 시간
         self.now_kst = datetime.now(KST)
         self.cutoff_date = self.now_kst - timedelta(days=3)
         self.max_future_date = self.now_kst + timedelta(minutes=10)  # 미래 날짜 보정용
         
+        self.page_metadata.reset()
+        
+        # RSS 파이프라인 단계별 절약 집계 (회차 누적)
+        self.pipeline_stats = PipelineStats()
+        
         logger.info(f"[시간 필터] 현재: {self.now_kst.isoformat()}, 기준: {self.cutoff_date.isoformat()} (최근 3일)")
     
+    def new_run(self) -> 'RealNewsCrawler':
+        """독립된 크롤링 회차용 크롤러
+        
+        세션/영구 캐시/fingerprint는 공유하고, 3일 필터 기준 시간/페이지 메타데이터 메모/파이프라인 집계는
+        따로 가진다. 새로고침 작업과 스케줄 크롤링이 동시에 돌아도 서로의 회차 상태를 바꾸지 않는다.
+        """
+        run = copy.copy(self)
+        run.page_metadata = self.page_metadata.fork()
+        run.begin_run()
+        return run
+    
     def normalize_url(self, url: str) -> str:
         """URL 정규화"""
-        try:
-            parsed = urlparse(url)
-            normalized = urlunparse((
-                parsed.scheme,
-                parsed.netloc,
-                parsed.path.rstrip('/'),
-                parsed.params,
-                '',
-                ''
-            ))
-            return normalized
-        except Exception:
-            return url
-    
-    def parse_published_date(self, date_str: str, url: str = '') -> Optional[datetime]:
-        """날짜 파싱 (한국 시간 기준)"""
-        if not date_str:
-            return None
+        return normalize_url(url)
+    
+    def parse_published_date(self, date_str: str, url: str = '', source: str = '') -> Optional[datetime]:
+        """날짜 파싱 (한국 시간 기준, date_parser 형태 분류 + 소스별 형식 캐시)
         
-        try:
-            # ISO 형식
-            if 'T' in date_str or '+' in date_str or 'Z' in date_str:
-                dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-                if dt.tzinfo is None:
-                    dt = KST.localize(dt)
-                else:
-                    dt = dt.astimezone(KST)
-                return dt
-            
-            # RFC 2822 형식 (RSS)
-            try:
-                dt = datetime.strptime(date_str, '%a, %d %b %Y %H:%M:%S %z')
-                return dt.astimezone(KST)
-            except:
-                pass
-            
-            # YYYYMMDD 형식 (네이버 블로그)
-            if len(date_str) == 8 and date_str.isdigit():
-                dt = datetime.strptime(date_str, '%Y%m%d')
-                return KST.localize(dt)
-            
-            # 기타 형식 시도
-            patterns = [
-                '%Y-%m-%d %H:%M:%S',
-                '%Y-%m-%d',
-                '%Y.%m.%d',
-            ]
-            
-            for pattern in patterns:
-                try:
-                    dt = datetime.strptime(date_str[:19], pattern)
-                    return KST.localize(dt)
-                except:
-                    continue
-            
+        source를 주지 않으면 url의 호스트를 형식 캐시 키로 쓴다.
+        """
+        return self.date_parser.parse(date_str, source or (urlparse(url).netloc if url else ''))
+    
+    def published_date_from_metadata(self, meta: Optional[PageMetadata]) -> Optional[datetime]:
+        """메타데이터에서 publishedAt 추출 (article:published_time → time[datetime])"""
+        if not meta:
             return None
         
-        except Exception as e:
-            logger.debug(f"[날짜 파싱 실패] {date_str[:50]}: {e}")
-            return None
-    
-    def fetch_published_date_from_url(self, url: str) -> Optional[datetime]:
-        """URL에서 publishedAt 추출"""
-        try:
-            response = self.session.get(url, timeout=5, allow_redirects=True)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # og:published_time
-            og_date = soup.select_one('meta[property="article:published_time"]')
-            if og_date and og_date.get('content'):
-                dt = self.parse_published_date(og_date.get('content'))
-                if dt:
-                    return dt
-            
-            # time 태그
-            time_tag = soup.select_one('time[datetime]')
-            if time_tag:
-                dt = self.parse_published_date(time_tag.get('datetime'))
+        for value in (meta.published_time, meta.time_datetime):
+            if value:
+                dt = self.parse_published_date(value, meta.url)
                 if dt:
                     return dt
-            
-            return None
         
-        except Exception as e:
-            logger.debug(f"[URL 날짜 추출 실패] {url}: {e}")
-            return None
+        return None
     
     def is_within_3_days(self, published_at: Optional[datetime]) -> bool:
         """3일 필터 체크"""
@@ -236,53 +151,15 @@ class RealNewsCrawler:
         
         return is_valid
     
-    def extract_image_from_url(self, url: str) -> Optional[str]:
-        """URL에서 이미지 추출 (og:image 우선)"""
-        try:
-            response = self.session.get(url, timeout=5, allow_redirects=True)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # 1. og:image
-            og_image = soup.select_one('meta[property="og:image"]')
-            if og_image and og_image.get('content'):
-                img_url = og_image.get('content')
-                return self.normalize_image_url(img_url, url)
-            
-            # 2. twitter:image
-            twitter_image = soup.select_one('meta[name="twitter:image"]')
-            if twitter_image and twitter_image.get('content'):
-                img_url = twitter_image.get('content')
-                return self.normalize_image_url(img_url, url)
-            
-            # 3. link rel="image_src"
-            link_image = soup.select_one('link[rel="image_src"]')
-            if link_image and link_image.get('href'):
-                img_url = link_image.get('href')
-                return self.normalize_image_url(img_url, url)
-            
-            # 4. 본문 첫 번째 큰 이미지
-            article_images = soup.select('article img, .post-content img, .entry-content img')
-            for img in article_images[:5]:
-                src = img.get('src') or img.get('data-src')
-                if src:
-                    # 큰 이미지 필터링 (너비/높이 속성 체크)
-                    width = img.get('width', '')
-                    height = img.get('height', '')
-                    if width and height:
-                        try:
-                            w, h = int(width), int(height)
-                            if w >= 200 and h >= 200:
-                                return self.normalize_image_url(src, url)
-                        except:
-                            pass
-                    # 속성이 없어도 시도
-                    return self.normalize_image_url(src, url)
-            
+    def image_from_metadata(self, meta: Optional[PageMetadata]) -> Optional[str]:
+        """메타데이터에서 이미지 선택 (og:image → twitter:image → image_src → 본문 첫 이미지)"""
+        if not meta:
             return None
         
-        except Exception as e:
-            logger.debug(f"[이미지 추출 실패] {url}: {e}")
+        img_url = meta.og_image or meta.twitter_image or meta.image_src or meta.body_image
+        if not img_url:
             return None
+        return self.normalize_image_url(img_url, meta.url)
     
     def normalize_image_url(self, img_url: str, base_url: str) -> str:
         """이미지 URL 정규화"""
@@ -299,560 +176,224 @@ class RealNewsCrawler:
         else:
             return urljoin(base_url, img_url)
     
-    def resolve_google_news_url(self, google_url: str) -> str:
-        """구글 뉴스 URL을 원문 URL로 변환"""
-        try:
-            response = self.session.head(google_url, allow_redirects=True, timeout=5)
-            final_url = response.url
-            
-            if 'news.google.com' in final_url:
-                parsed = urlparse(final_url)
-                if parsed.query:
-                    params = parse_qs(parsed.query)
-                    if 'url' in params:
-                        return params['url'][0]
-            
-            return final_url
-        except Exception as e:
-            logger.debug(f"URL resolve 실패: {e}")
-            return google_url
-    
-    def crawl_google_news(self, query: str, max_results: int = 15, page: int = 1) -> List[Dict]:
-        """구글 뉴스 RSS 크롤링"""
-        articles = []
-        parse_success = 0
-        parse_failed = 0
-        
-        try:
-            logger.info(f"[구글 뉴스] 쿼리: {query}, 최대 {max_results}개, 페이지 {page}")
-            rss_url = f'https://news.google.com/rss/search?q={quote(query)}&hl=ko&gl=KR&ceid=KR:ko'
-            
-            feed = feedparser.parse(rss_url)
-            
-            if not feed.entries:
-                logger.warning(f"[구글 뉴스] RSS 피드가 비어있습니다")
-                return articles
-            
-            logger.info(f"[구글 뉴스] 발견된 항목: {len(feed.entries)}개")
-            
-            for entry in feed.entries[:max_results]:
-                try:
-                    title = entry.get('title', '').strip()
-                    link = entry.get('link', '')
-                    
-                    if not title or not link:
-                        continue
-                    
-                    # 원문 URL resolve
-                    original_url = self.resolve_google_news_url(link)
-                    
-                    # 날짜 파싱
-                    published_at = None
-                    if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                        try:
-                            dt = datetime(*entry.published_parsed[:6])
-                            published_at = KST.localize(dt)
-                            parse_success += 1
-                        except Exception as e:
-                            logger.debug(f"[구글 뉴스] 날짜 파싱 실패: {e}")
-                            parse_failed += 1
-                            continue
-                    else:
-                        parse_failed += 1
-                        continue
-                    
-                    # 3일 필터 체크
-                    if not self.is_within_3_days(published_at):
-                        continue
-                    
-                    # 이미지 추출
-                    image_url = None
-                    if 'media_content' in entry:
-                        image_url = entry.media_content[0].get('url', '')
-                    
-                    # og:image 추출 시도
-                    if not image_url:
-                        image_url = self.extract_image_from_url(original_url)
-                    
-                    # 요약 (HTML 태그 제거)
-                    summary = entry.get('summary', '')
-                    if summary:
-                        summary = BeautifulSoup(summary, 'html.parser').get_text(strip=True)[:200]
-                    else:
-                        summary = None
-                    
-                    articles.append({
-                        'title': title,
-                        'url': original_url,
-                        'source': entry.get('source', {}).get('title', 'Google News'),
-                        'publishedAt': published_at.isoformat(),
-                        'imageUrl': image_url or '',
-                        'summary': summary or ''
-                    })
-                    
-                    logger.debug(f"[구글 뉴스] 수집: {title[:50]}... ({published_at.isoformat()})")
-                
-                except Exception as e:
-                    logger.error(f"[구글 뉴스] 항목 파싱 오류: {e}")
-                    continue
-            
-            logger.info(f"[구글 뉴스] 날짜 파싱 성공: {parse_success}, 실패: {parse_failed}, 최종 수집: {len(articles)}개")
+    def canonical_url(self, url: str) -> str:
+        """이번 회차에 받은 페이지의 canonical URL (메타데이터를 받지 않았으면 빈 문자열)"""
+        meta = self.page_metadata.peek(url)
+        if not meta or not meta.canonical_url:
+            return ''
+        return urljoin(meta.final_url or url, meta.canonical_url)
+    
+    def extract_final_url(self, final_url: str) -> str:
+        """리다이렉트 최종 URL에서 원문 URL 추출 (news.google.com의 url 파라미터 처리)"""
+        if 'news.google.com' in final_url:
+            parsed = urlparse(final_url)
+            if parsed.query:
+                params = parse_qs(parsed.query)
+                if 'url' in params:
+                    return params['url'][0]
+        
+        return final_url
+    
+    def build_google_news_rss_url(self, query: str) -> str:
+        """구글 뉴스 검색 RSS URL"""
+        return f'https://news.google.com/rss/search?q={quote(query)}&hl=ko&gl=KR&ceid=KR:ko'
+    
+    def naver_api_headers(self) -> Dict[str, str]:
+        """네이버 검색 API 인증 헤더"""
+        return {
+            'X-Naver-Client-Id': self.naver_client_id,
+            'X-Naver-Client-Secret': self.naver_client_secret
+        }
+    
+    def has_naver_credentials(self) -> bool:
+        """네이버 API 키 설정 여부"""
+        return bool(self.naver_client_id and self.naver_client_secret)
+    
+    def parse_feed_entry(self, entry, source: Optional[str] = None,
+                         stats: Optional[Dict[str, int]] = None) -> Optional[Article]:
+        """RSS 항목을 Article로 변환 (날짜 파싱만, 네트워크 호출 없음)
+        
+        3일 필터는 feed_pipeline.select_entries에서 적용한다.
+        반환되는 기사의 url은 RSS 링크 그대로이고, image_url은 media_content가 없으면 비어 있다.
+        """
+        if stats is None:
+            stats = {'success': 0, 'failed': 0}
+        
+        title = entry.get('title', '').strip()
+        link = entry.get('link', '')
+        
+        if not title or not link:
+            return None
+        
+        # 날짜 파싱
+        if hasattr(entry, 'published_parsed') and entry.published_parsed:
+            try:
+                dt = datetime(*entry.published_parsed[:6])
+                published_at = KST.localize(dt)
+                stats['success'] += 1
+            except Exception as e:
+                logger.debug(f"[RSS] 날짜 파싱 실패: {e}")
+                stats['failed'] += 1
+                return None
+        else:
+            stats['failed'] += 1
+            return None
         
-        except Exception as e:
-            logger.error(f"[구글 뉴스] 크롤링 오류: {e}", exc_info=True)
+        # 이미지 (피드에 포함된 경우)
+        image_url = None
+        if 'media_content' in entry:
+            image_url = entry.media_content[0].get('url', '')
         
-        return articles
+        # 요약 (HTML 태그 제거)
+        summary = entry.get('summary', '')
+        if summary:
+            summary = BeautifulSoup(summary, 'html.parser').get_text(strip=True)[:200]
+        else:
+            summary = None
+        
+        return Article(
+            title=title,
+            url=link,
+            source=source or entry.get('source', {}).get('title', 'Google News'),
+            published_at=published_at,
+            image_url=image_url or '',
+            summary=summary or ''
+        )
     
-    def crawl_naver_news(self, query: str, max_results: int = 15, start: int = 1) -> List[Dict]:
-        """네이버 뉴스 API 크롤링"""
-        articles = []
-        parse_success = 0
-        parse_failed = 0
-        
-        if not self.naver_client_id or not self.naver_client_secret:
-            logger.warning("[네이버 뉴스] API 키가 설정되지 않았습니다")
-            return articles
-        
-        try:
-            logger.info(f"[네이버 뉴스] 쿼리: {query}, 최대 {max_results}개, 시작: {start}")
-            url = 'https://openapi.naver.com/v1/search/news.json'
-            headers = {
-                'X-Naver-Client-Id': self.naver_client_id,
-                'X-Naver-Client-Secret': self.naver_client_secret
-            }
-            params = {
-                'query': query,
-                'display': min(max_results, 100),
-                'start': start,
-                'sort': 'date'
-            }
-            
-            response = self.session.get(url, headers=headers, params=params, timeout=10)
-            
-            if response.status_code != 200:
-                logger.error(f"[네이버 뉴스] API 오류: {response.status_code}")
-                return articles
-            
-            data = response.json()
-            items = data.get('items', [])
-            
-            logger.info(f"[네이버 뉴스] 발견된 항목: {len(items)}개")
-            
-            for item in items:
-                try:
-                    title = BeautifulSoup(item.get('title', ''), 'html.parser').get_text(strip=True)
-                    link = item.get('link', '')
-                    description = BeautifulSoup(item.get('description', ''), 'html.parser').get_text(strip=True)
-                    pub_date = item.get('pubDate', '')
-                    
-                    if not title or not link:
-                        continue
-                    
-                    # 날짜 파싱
-                    published_at = self.parse_published_date(pub_date, link)
-                    
-                    if not published_at:
-                        # URL에서 날짜 추출 시도
-                        published_at = self.fetch_published_date_from_url(link)
-                    
-                    if not published_at:
-                        parse_failed += 1
-                        logger.debug(f"[네이버 뉴스] 날짜 파싱 실패: {title[:30]}...")
-                        continue
-                    
-                    parse_success += 1
-                    
-                    # 3일 필터 체크
-                    if not self.is_within_3_days(published_at):
-                        continue
-                    
-                    # 이미지 추출
-                    image_url = item.get('thumbnail', '') or ''
-                    if not image_url:
-                        image_url = self.extract_image_from_url(link)
-                    
-                    articles.append({
-                        'title': title,
-                        'url': link,
-                        'source': 'Naver News',
-                        'publishedAt': published_at.isoformat(),
-                        'imageUrl': image_url or '',
-                        'summary': description[:200] if description else ''
-                    })
-                    
-                    logger.debug(f"[네이버 뉴스] 수집: {title[:50]}... ({published_at.isoformat()})")
-                
-                except Exception as e:
-                    logger.error(f"[네이버 뉴스] 항목 파싱 오류: {e}")
-                    continue
-            
-            logger.info(f"[네이버 뉴스] 날짜 파싱 성공: {parse_success}, 실패: {parse_failed}, 최종 수집: {len(articles)}개")
+    def parse_naver_item(self, item: Dict, source: str, date_field: str) -> Optional[Article]:
+        """네이버 검색 API 항목을 Article로 변환 (네트워크 호출 없음)
+        
+        published_at은 파싱 실패 시 None이며, apply_published_at에서 확정한다.
+        """
+        title = BeautifulSoup(item.get('title', ''), 'html.parser').get_text(strip=True)
+        link = item.get('link', '')
+        description = BeautifulSoup(item.get('description', ''), 'html.parser').get_text(strip=True)
+        
+        if not title or not link:
+            return None
         
-        except Exception as e:
-            logger.error(f"[네이버 뉴스] 크롤링 오류: {e}", exc_info=True)
+        return Article(
+            title=title,
+            url=link,
+            source=source,
+            published_at=self.parse_published_date(item.get(date_field, ''), link, source=f'naver.{date_field}'),
+            image_url=item.get('thumbnail', '') or '',
+            summary=description[:200] if description else ''
+        )
+    
+    def apply_published_at(self, article: Article, stats: Dict[str, int]) -> bool:
+        """발행 시각 확정 여부를 집계하고 3일 필터 통과 여부 반환"""
+        if not article.published_at:
+            stats['failed'] += 1
+            logger.debug(f"[{article.source}] 날짜 파싱 실패: {article.title[:30]}...")
+            return False
         
-        return articles
+        stats['success'] += 1
+        return self.is_within_3_days(article.published_at)
+    
+    def crawl_google_news(self, query: str, max_results: int = 15) -> List[Article]:
+        """구글 뉴스 RSS 크롤링 (AsyncCrawlEngine 소스를 동기로 실행)"""
+        return AsyncCrawlEngine(self).run_source(lambda engine: engine.crawl_google_news(query, max_results))
     
-    def crawl_naver_blog(self, query: str, max_results: int = 15, start: int = 1) -> List[Dict]:
+    def crawl_naver_news(self, query: str, max_results: int = 15, start: int = 1) -> List[Article]:
+        """네이버 뉴스 API 크롤링"""
+        return AsyncCrawlEngine(self).run_source(
+            lambda engine: engine.crawl_naver_search('news', query, max_results, start))
+    
+    def crawl_naver_blog(self, query: str, max_results: int = 15, start: int = 1) -> List[Article]:
         """네이버 블로그 API 크롤링"""
-        articles = []
-        parse_success = 0
-        parse_failed = 0
-        
-        if not self.naver_client_id or not self.naver_client_secret:
-            logger.warning("[네이버 블로그] API 키가 설정되지 않았습니다")
-            return articles
-        
-        try:
-            logger.info(f"[네이버 블로그] 쿼리: {query}, 최대 {max_results}개, 시작: {start}")
-            url = 'https://openapi.naver.com/v1/search/blog.json'
-            headers = {
-                'X-Naver-Client-Id': self.naver_client_id,
-                'X-Naver-Client-Secret': self.naver_client_secret
-            }
-            params = {
+        return AsyncCrawlEngine(self).run_source(
+            lambda engine: engine.crawl_naver_search('blog', query, max_results, start))
+    
+    def naver_search_request(self, kind: str, query: str, max_results: int, start: int) -> Dict:
+        """네이버 검색 API 요청 정보 (url, params)"""
+        return {
+            'url': f'https://openapi.naver.com/v1/search/{kind}.json',
+            'params': {
                 'query': query,
                 'display': min(max_results, 100),
                 'start': start,
                 'sort': 'date'
             }
-            
-            response = self.session.get(url, headers=headers, params=params, timeout=10)
-            
-            if response.status_code != 200:
-                logger.error(f"[네이버 블로그] API 오류: {response.status_code}")
-                return articles
-            
-            data = response.json()
-            items = data.get('items', [])
-            
-            logger.info(f"[네이버 블로그] 발견된 항목: {len(items)}개")
-            
-            for item in items:
-                try:
-                    title = BeautifulSoup(item.get('title', ''), 'html.parser').get_text(strip=True)
-                    link = item.get('link', '')
-                    description = BeautifulSoup(item.get('description', ''), 'html.parser').get_text(strip=True)
-                    bloggername = item.get('bloggername', '')
-                    postdate = item.get('postdate', '')
-                    
-                    if not title or not link:
-                        continue
-                    
-                    # 날짜 파싱 (YYYYMMDD 형식)
-                    published_at = self.parse_published_date(postdate, link)
-                    
-                    if not published_at:
-                        # URL에서 날짜 추출 시도
-                        published_at = self.fetch_published_date_from_url(link)
-                    
-                    if not published_at:
-                        parse_failed += 1
-                        logger.debug(f"[네이버 블로그] 날짜 파싱 실패: {title[:30]}...")
-                        continue
-                    
-                    parse_success += 1
-                    
-                    # 3일 필터 체크
-                    if not self.is_within_3_days(published_at):
-                        continue
-                    
-                    # 이미지 추출
-                    image_url = self.extract_image_from_url(link)
-                    
-                    articles.append({
-                        'title': title,
-                        'url': link,
-                        'source': f'Naver Blog ({bloggername})' if bloggername else 'Naver Blog',
-                        'publishedAt': published_at.isoformat(),
-                        'imageUrl': image_url or '',
-                        'summary': description[:200] if description else ''
-                    })
-                    
-                    logger.debug(f"[네이버 블로그] 수집: {title[:50]}... ({published_at.isoformat()})")
-                
-                except Exception as e:
-                    logger.error(f"[네이버 블로그] 항목 파싱 오류: {e}")
-                    continue
-            
-            logger.info(f"[네이버 블로그] 날짜 파싱 성공: {parse_success}, 실패: {parse_failed}, 최종 수집: {len(articles)}개")
-        
-        except Exception as e:
-            logger.error(f"[네이버 블로그] 크롤링 오류: {e}", exc_info=True)
-        
-        return articles
+        }
     
-    def crawl_tistory_rss(self, max_results: int = 10) -> List[Dict]:
-        """티스토리 RSS 소스 크롤링"""
-        articles = []
-        parse_success = 0
-        parse_failed = 0
-        
-        for rss_url in self.TISTORY_RSS_SOURCES:
-            try:
-                logger.info(f"[티스토리 RSS] 소스: {rss_url}")
-                feed = feedparser.parse(rss_url)
-                
-                if not feed.entries:
-                    logger.warning(f"[티스토리 RSS] 피드가 비어있습니다: {rss_url}")
-                    continue
-                
-                for entry in feed.entries[:max_results]:
-                    try:
-                        title = entry.get('title', '').strip()
-                        link = entry.get('link', '')
-                        
-                        if not title or not link:
-                            continue
-                        
-                        # 날짜 파싱
-                        published_at = None
-                        if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                            try:
-                                dt = datetime(*entry.published_parsed[:6])
-                                published_at = KST.localize(dt)
-                                parse_success += 1
-                            except:
-                                parse_failed += 1
-                                continue
-                        else:
-                            parse_failed += 1
-                            continue
-                        
-                        # 3일 필터 체크
-                        if not self.is_within_3_days(published_at):
-                            continue
-                        
-                        # 이미지 추출
-                        image_url = None
-                        if 'media_content' in entry:
-                            image_url = entry.media_content[0].get('url', '')
-                        
-                        if not image_url:
-                            image_url = self.extract_image_from_url(link)
-                        
-                        # 요약
-                        summary = entry.get('summary', '')
-                        if summary:
-                            summary = BeautifulSoup(summary, 'html.parser').get_text(strip=True)[:200]
-                        else:
-                            summary = None
-                        
-                        articles.append({
-                            'title': title,
-                            'url': link,
-                            'source': feed.feed.get('title', 'Tistory'),
-                            'publishedAt': published_at.isoformat(),
-                            'imageUrl': image_url or '',
-                            'summary': summary or ''
-                        })
-                    
-                    except Exception as e:
-                        logger.debug(f"[티스토리 RSS] 항목 파싱 오류: {e}")
-                        continue
-                
-                logger.info(f"[티스토리 RSS] {rss_url}: 날짜 파싱 성공: {parse_success}, 실패: {parse_failed}")
-            
-            except Exception as e:
-                logger.error(f"[티스토리 RSS] 크롤링 오류 ({rss_url}): {e}")
-                continue
+    def naver_item_to_article(self, kind: str, item: Dict) -> Optional[Article]:
+        """네이버 검색 API 항목 변환 (news: pubDate/썸네일, blog: postdate/블로거명)"""
+        if kind == 'news':
+            return self.parse_naver_item(item, 'Naver News', 'pubDate')
         
-        return articles
+        bloggername = item.get('bloggername', '')
+        return self.parse_naver_item(item, f'Naver Blog ({bloggername})' if bloggername else 'Naver Blog', 'postdate')
     
-    def filter_by_date(self, articles: List[Dict]) -> List[Dict]:
-        """3일 필터 적용"""
+    def crawl_tistory_rss(self, max_results: int = 10) -> List[Article]:
+        """티스토리 RSS 소스 크롤링 (AsyncCrawlEngine 소스를 동기로 실행)"""
+        return AsyncCrawlEngine(self).run_source(lambda engine: engine.crawl_tistory_rss(max_results))
+    
+    def filter_by_date(self, articles: List[Article]) -> List[Article]:
+        """3일 필터 적용 (소스 파서에서 정한 published_at 그대로 비교)"""
         filtered = []
         dropped_no_date = 0
         dropped_old = 0
         
         for article in articles:
-            published_at_str = article.get('publishedAt', '')
-            if not published_at_str:
+            if not article.published_at:
                 dropped_no_date += 1
                 continue
             
-            try:
-                published_at = datetime.fromisoformat(published_at_str.replace('Z', '+00:00'))
-                if published_at.tzinfo is None:
-                    published_at = KST.localize(published_at)
-                else:
-                    published_at = published_at.astimezone(KST)
-                
-                if not self.is_within_3_days(published_at):
-                    dropped_old += 1
-                    continue
-                
-                filtered.append(article)
-            
-            except Exception as e:
-                logger.debug(f"[날짜 필터] 파싱 실패: {published_at_str}: {e}")
-                dropped_no_date += 1
+            if not self.is_within_3_days(article.published_at):
+                dropped_old += 1
                 continue
+            
+            filtered.append(article)
         
         logger.info(f"[3일 필터] 입력: {len(articles)}개, 날짜 없음 제외: {dropped_no_date}개, 과거 제외: {dropped_old}개, 최종: {len(filtered)}개")
         
         return filtered
     
-    def remove_duplicates(self, articles: List[Dict]) -> List[Dict]:
-        """중복 제거"""
+    def remove_duplicates(self, articles: List[Article], strategy: Optional[str] = None) -> List[Article]:
+        """중복 제거 (URL 정규화 + 제목 near-duplicate, 먼저 나온 기사를 남김)
+        
+        제목 유사도 전략은 title_index.STRATEGIES ('minhash' 기본, 'numpy' 일괄 코사인).
+        """
         seen_urls: Set[str] = set()
-        unique_articles = []
+        candidates = []
         
         for article in articles:
-            normalized_url = self.normalize_url(article.get('url', ''))
-            
-            if normalized_url in seen_urls or not normalized_url:
+            if article.url_key in seen_urls or not article.url_key:
                 continue
             
-            seen_urls.add(normalized_url)
-            unique_articles.append(article)
+            seen_urls.add(article.url_key)
+            candidates.append(article)
+        
+        # 같은 기사가 다른 URL(언론사 재전송, 검색 소스별 링크)로 들어온 경우
+        keep = unique_title_mask([a.title for a in candidates], strategy)
+        unique_articles = [article for article, kept in zip(candidates, keep) if kept]
         
         logger.info(f"[중복 제거] {len(articles)}개 → {len(unique_articles)}개")
         return unique_articles
     
-    def enhance_images(self, articles: List[Dict], max_workers: int = 5) -> List[Dict]:
-        """이미지 URL이 없는 항목에 대해 og:image 추출 (동시성 제한)"""
-        articles_needing_image = [a for a in articles if not a.get('imageUrl')]
-        
-        if not articles_needing_image:
-            return articles
-        
-        logger.info(f"[이미지 개선] {len(articles_needing_image)}개 항목에 대해 이미지 추출 시작")
-        
-        def fetch_image(article):
-            url = article.get('url', '')
-            if not url:
-                return article
-            
-            image_url = self.extract_image_from_url(url)
-            if image_url:
-                article['imageUrl'] = image_url
-                return article
-            return article
-        
-        # 동시성 제한으로 이미지 추출
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {executor.submit(fetch_image, article): article for article in articles_needing_image}
-            
-            for future in as_completed(futures):
-                try:
-                    future.result()
-                except Exception as e:
-                    logger.debug(f"[이미지 추출] 오류: {e}")
-        
-        image_success = sum(1 for a in articles if a.get('imageUrl'))
-        logger.info(f"[이미지 개선] 완료: {image_success}/{len(articles)}개 항목에 이미지 있음 ({image_success/len(articles)*100:.1f}%)")
-        
-        return articles
+    def crawl_category(self, category_key: str) -> List[Article]:
+        """카테고리별 뉴스 수집 (3일 필터 강제, 모든 소스 비동기 동시 수집)"""
+        return AsyncCrawlEngine(self).run(category_key)
     
-    def crawl_category(self, category_key: str) -> List[Dict]:
-        """카테고리별 뉴스 수집 (3일 필터 강제)"""
-        if category_key not in self.CATEGORIES:
-            logger.error(f"알 수 없는 카테고리: {category_key}")
-            return []
-        
-        category_info = self.CATEGORIES[category_key]
-        category_name = category_info['name']
-        google_query = category_info.get('google_query', category_name)
-        naver_query = category_info.get('naver_query', category_name)
-        keywords = category_info.get('keywords', [])
-        
-        logger.info(f"=" * 60)
-        logger.info(f"[크롤링 시작] 카테고리: {category_name} ({category_key})")
-        logger.info(f"[시간 필터] {self.cutoff_date.isoformat()} ~ {self.now_kst.isoformat()}")
-        
-        all_articles = []
-        target_count = 10
-        
-        # 1. 구글 뉴스 RSS
-        try:
-            articles = self.crawl_google_news(google_query, max_results=15)
-            all_articles.extend(articles)
-            logger.info(f"[구글 뉴스] {len(articles)}개 수집")
-        except Exception as e:
-            logger.error(f"[구글 뉴스] 오류: {e}")
-        
-        # 2. 네이버 뉴스 API (확장 가능)
-        if len(all_articles) < target_count:
-            try:
-                articles = self.crawl_naver_news(naver_query, max_results=15)
-                all_articles.extend(articles)
-                logger.info(f"[네이버 뉴스] {len(articles)}개 수집")
-                
-                # 부족하면 페이지네이션 확장
-                if len(all_articles) < target_count:
-                    articles = self.crawl_naver_news(naver_query, max_results=15, start=16)
-                    all_articles.extend(articles)
-                    logger.info(f"[네이버 뉴스 확장] {len(articles)}개 추가 수집")
-            except Exception as e:
-                logger.error(f"[네이버 뉴스] 오류: {e}")
-        
-        # 3. 네이버 블로그 API (확장 가능)
-        if len(all_articles) < target_count:
-            try:
-                articles = self.crawl_naver_blog(naver_query, max_results=15)
-                all_articles.extend(articles)
-                logger.info(f"[네이버 블로그] {len(articles)}개 수집")
-                
-                # 부족하면 페이지네이션 확장
-                if len(all_articles) < target_count:
-                    articles = self.crawl_naver_blog(naver_query, max_results=15, start=16)
-                    all_articles.extend(articles)
-                    logger.info(f"[네이버 블로그 확장] {len(articles)}개 추가 수집")
-            except Exception as e:
-                logger.error(f"[네이버 블로그] 오류: {e}")
-        
-        # 4. 추가 키워드로 확장 (부족할 때만)
-        if len(all_articles) < target_count and len(keywords) > 1:
-            logger.info(f"[키워드 확장] 추가 키워드로 검색 시작")
-            for keyword in keywords[1:3]:  # 상위 2개 키워드만
-                try:
-                    articles = self.crawl_google_news(keyword, max_results=10)
-                    all_articles.extend(articles)
-                    logger.info(f"[구글 뉴스 확장] 키워드 '{keyword}': {len(articles)}개 수집")
-                    
-                    if len(all_articles) >= target_count:
-                        break
-                except Exception as e:
-                    logger.error(f"[키워드 확장] 오류: {e}")
-        
-        # 5. 티스토리 RSS (fallback)
-        if len(all_articles) < 5:
-            try:
-                articles = self.crawl_tistory_rss(max_results=5)
-                all_articles.extend(articles)
-                logger.info(f"[티스토리 RSS] {len(articles)}개 수집")
-            except Exception as e:
-                logger.error(f"[티스토리 RSS] 오류: {e}")
-        
-        # 3일 필터 적용 (강제)
-        filtered_articles = self.filter_by_date(all_articles)
-        
-        # 중복 제거
-        unique_articles = self.remove_duplicates(filtered_articles)
-        
-        # 이미지 개선 (이미지가 없는 항목에 대해)
-        enhanced_articles = self.enhance_images(unique_articles)
-        
-        # 날짜순 정렬 (최신순)
-        try:
-            enhanced_articles.sort(key=lambda x: x.get('publishedAt', ''), reverse=True)
-        except:
-            pass
+    def finish_category(self, category_name: str, articles: List[Article]) -> List[Article]:
+        """정렬 + 날짜 범위 검증 로그 후 최대 30개 반환"""
+        # 날짜순 정렬 (최신순, filter_by_date를 거쳐 모두 발행 시각이 있다)
+        articles.sort(key=lambda a: a.published_at, reverse=True)
         
         # 날짜 범위 검증 로그
-        if enhanced_articles:
-            dates = [datetime.fromisoformat(a.get('publishedAt', '').replace('Z', '+00:00')) for a in enhanced_articles if a.get('publishedAt')]
+        if articles:
+            dates = [a.published_at for a in articles]
             if dates:
                 min_date = min(dates)
                 max_date = max(dates)
                 logger.info(f"[날짜 범위 검증] 최신: {max_date.isoformat()}, 최구: {min_date.isoformat()}")
                 logger.info(f"[날짜 범위 검증] 모든 날짜가 {self.cutoff_date.isoformat()} 이후: {all(d >= self.cutoff_date for d in dates)}")
         
-        logger.info(f"[최종 결과] {category_name}: {len(enhanced_articles)}개 기사")
+        logger.info(f"[최종 결과] {category_name}: {len(articles)}개 기사")
         logger.info(f"=" * 60)
         
-        return enhanced_articles[:30]  # 최대 30개 반환
+        return articles[:30]  # 최대 30개 반환
     
     def get_all_categories(self) -> Dict:
         """모든 카테고리 정보 반환"""
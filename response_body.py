@@ -0,0 +1,137 @@
+"""미리 직렬화/압축한 API 응답 본문 (ETag, Content-Encoding 선택)
+
+/api/news 응답은 두 크롤링 사이에 모든 클라이언트에게 같으므로, 저장할 때 한 번
+JSON bytes로 만들고 gzip/brotli 압축본과 내용 해시(ETag)를 함께 보관한다.
+요청 시에는 Accept-Encoding에 맞는 bytes를 그대로 보내고, If-None-Match가 맞으면 304.
+
+brotli는 선택 의존성이다 (brotli 또는 brotlicffi가 있을 때만 'br' 본문을 만든다).
+
+news_payload/render_news는 API 서버와 크롤러 워커가 같은 본문을 만들도록 여기에 둔다.
+"""
+import gzip
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+from categories import CATEGORIES
+
+# 서버가 고르는 순서 (클라이언트가 받을 수 있는 것 중 앞쪽)
+ENCODINGS = ('br', 'gzip', 'identity')
+
+_brotli = None
+
+
+def brotli_module():
+    """brotli 모듈 (없으면 None)"""
+    global _brotli
+    if _brotli is None:
+        for name in ('brotli', 'brotlicffi'):
+            try:
+                _brotli = __import__(name)
+                break
+            except ImportError:
+                continue
+        else:
+            _brotli = False
+    return _brotli or None
+
+
+@dataclass
+class EncodedBody:
+    """인코딩별 본문 bytes + ETag"""
+    etag: str
+    bodies: Dict[str, bytes] = field(default_factory=dict)
+
+    def choose(self, accept_encoding: str) -> str:
+        """Accept-Encoding에서 받을 수 있는 인코딩 중 서버 선호 순서로 하나"""
+        accepted = parse_accept_encoding(accept_encoding)
+        for encoding in ENCODINGS:
+            if encoding in self.bodies and accepted.get(encoding, accepted.get('*', 0)) > 0:
+                return encoding
+        return 'identity'
+
+
+def parse_accept_encoding(value: str) -> Dict[str, float]:
+    """'gzip, br;q=0.8, *;q=0' → {'gzip': 1.0, 'br': 0.8, '*': 0.0, 'identity': 1.0}"""
+    accepted = {}
+    for part in (value or '').split(','):
+        coding, _, params = part.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding] = quality
+    # identity는 따로 적지 않았으면 받을 수 있는 것으로 본다
+    accepted.setdefault('identity', 1.0)
+    return accepted
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match 값에 etag가 있는지 (약한 비교)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    target = etag[2:] if etag.startswith('W/') else etag
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate.startswith('W/'):
+            candidate = candidate[2:]
+        if candidate == target:
+            return True
+    return False
+
+
+def serialize(payload) -> bytes:
+    """FastAPI JSONResponse와 같은 형식의 JSON bytes"""
+    return json.dumps(payload, ensure_ascii=False, allow_nan=False, indent=None, separators=(',', ':')).encode('utf-8')
+
+
+def encode_payload(payload) -> EncodedBody:
+    """JSON 직렬화 + gzip/brotli 압축 + ETag (인코딩이 달라도 내용이 같으므로 약한 ETag)"""
+    body = serialize(payload)
+    bodies = {'identity': body, 'gzip': gzip.compress(body, compresslevel=9, mtime=0)}
+    brotli = brotli_module()
+    if brotli is not None:
+        bodies['br'] = brotli.compress(body)
+    digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+    return EncodedBody(etag=f'W/"{digest}"', bodies=bodies)
+
+
+def decode_row(etag: Optional[str], identity: Optional[bytes], gzip_body: Optional[bytes],
+               br_body: Optional[bytes]) -> Optional[EncodedBody]:
+    """저장소 행 → EncodedBody (본문이 없으면 None)"""
+    if not etag or identity is None:
+        return None
+    bodies = {'identity': bytes(identity)}
+    if gzip_body is not None:
+        bodies['gzip'] = bytes(gzip_body)
+    if br_body is not None:
+        bodies['br'] = bytes(br_body)
+    return EncodedBody(etag=etag, bodies=bodies)
+
+
+def news_payload(category: str, data: Dict) -> Dict:
+    """/api/news 응답 (기사가 있는 경우)"""
+    return {
+        "success": True,
+        "category": category,
+        "category_name": data.get('category_name', CATEGORIES.get(category, {}).get('name', category)),
+        "count": len(data['articles']),
+        "articles": data['articles'],
+        "cached_at": data.get('cached_at')
+    }
+
+
+def render_news(data: Dict) -> Optional[EncodedBody]:
+    """저장된 회차 → 직렬화/압축된 /api/news 응답 (기사가 없으면 None)"""
+    if not data.get('articles'):
+        return None
+    return encode_payload(news_payload(data['category'], data))
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# 저장소 루트 모듈(title_index 등)을 import할 수 있도록
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
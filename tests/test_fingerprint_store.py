@@ -0,0 +1,48 @@
+from article import Article
+from fingerprint_store import FingerprintStore
+
+TITLE = '삼성전자 신형 갤럭시 폴드 공개 예정, 가격은 200만원대'
+ORIGINAL = 'https://www.example.co.kr/news/1'
+
+
+def google_url(article_id: str) -> str:
+    return f'https://news.google.com/rss/articles/{article_id}?oc=5'
+
+
+def make_store(tmp_path) -> FingerprintStore:
+    store = FingerprintStore(str(tmp_path / 'fingerprints.sqlite3'))
+    store.record('it', [Article(TITLE, ORIGINAL, 'example', image_url='https://img.example/1.jpg')])
+    return store
+
+
+def test_same_normalized_title_substitutes_url(tmp_path):
+    store = make_store(tmp_path)
+    incoming = google_url('CBMiAAA')
+    article = Article('삼성전자, 신형 갤럭시 폴드 공개 예정… 가격은 200만 원대', incoming, 'google')
+
+    [(reused, found)] = store.reuse([article])
+
+    assert reused is article
+    assert (found.matched_by, found.distance, found.original_url) == ('simhash', 0, incoming)
+    assert article.url == ORIGINAL
+    assert article.image_url == 'https://img.example/1.jpg'
+
+
+def test_near_simhash_hit_keeps_incoming_url(tmp_path):
+    store = make_store(tmp_path)
+    incoming = google_url('CBMiBBB')
+    article = Article('삼성전자 신형 갤럭시폴드 공개예정 가격 200만원대', incoming, 'google')
+
+    [(_, found)] = store.reuse([article])
+
+    assert found.matched_by == 'simhash' and found.distance > 0
+    assert found.url == ORIGINAL and found.original_url == incoming
+    # 비슷하지만 같은 제목은 아니므로 링크는 바꾸지 않고 이미지만 채운다
+    assert article.url == incoming
+    assert article.image_url == 'https://img.example/1.jpg'
+
+
+def test_url_match_reports_no_distance(tmp_path):
+    store = make_store(tmp_path)
+    found = store.lookup(ORIGINAL + '/', '전혀 다른 제목')
+    assert (found.matched_by, found.distance, found.original_url) == ('url', 0, ORIGINAL + '/')
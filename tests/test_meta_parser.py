@@ -0,0 +1,31 @@
+import os
+
+import pytest
+
+from meta_parser import available_backends, extract_meta
+from page_metadata import parse_page_metadata
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'body_image_related_first.html')
+BODY_IMAGE = 'https://img.example.com/posts/running-crew.jpg'
+
+
+def load_fixture() -> bytes:
+    with open(FIXTURE, 'rb') as f:
+        return f.read()
+
+
+@pytest.mark.parametrize('backend', available_backends())
+def test_body_image_skips_related_ad_and_aside_blocks(backend):
+    # 관련 기사/광고/aside 블록의 img가 본문 이미지보다 먼저 나와도 본문 이미지를 고른다
+    assert extract_meta(load_fixture(), backend)['body_image'] == BODY_IMAGE
+
+
+@pytest.mark.parametrize('include_text', [False, True])
+def test_page_metadata_body_image(include_text):
+    meta = parse_page_metadata(load_fixture(), 'https://blog.example.com/posts/10', include_text=include_text)
+    assert meta.body_image == BODY_IMAGE
+
+
+def test_body_image_in_plain_container():
+    html = b'<div class="post"><p>intro</p><img src="/a.jpg"></div>'
+    assert extract_meta(html)['body_image'] == '/a.jpg'
@@ -0,0 +1,23 @@
+from title_index import TitleIndex, unique_title_mask
+
+
+def test_near_duplicate_titles_are_merged():
+    index = TitleIndex()
+    assert index.add_if_new('삼성전자, 신형 갤럭시 공개 예정')
+    assert not index.add_if_new('삼성전자 신형 갤럭시 공개 예정!')
+
+
+def test_titles_without_comparable_text_are_not_duplicates():
+    # 정규화하면 빈 문자열/한 글자가 되는 서로 다른 제목
+    index = TitleIndex()
+    assert index.add_if_new('🔥🔥🔥')
+    assert index.add_if_new('!!!')
+    assert index.add_if_new('A')
+    assert index.add_if_new('B')
+    assert index.find('⚡') is None
+    assert len(index) == 4
+
+
+def test_unique_title_mask_keeps_short_titles():
+    assert unique_title_mask(['😀', '...', '코스피 3주 연속 상승세', '코스피, 3주 연속 상승세'],
+                             strategy='minhash') == [True, True, True, False]
@@ -0,0 +1,197 @@
+"""제목 near-duplicate 인덱스 (문자 n-gram + MinHash + LSH banding)
+
+새 제목을 지금까지 남긴 모든 제목과 SequenceMatcher로 비교하는 O(n²) 루프 대신,
+제목을 문자 n-gram 집합으로 바꾸고 MinHash 서명을 band로 나눠 버킷에 넣는다.
+같은 버킷에 걸린 후보만 n-gram Jaccard 유사도로 확인하므로 비교 횟수가 거의 상수다.
+
+한국어 헤드라인은 띄어쓰기/조사/말줄임표가 조금씩 달라지는 경우가 많아서,
+공백과 문장부호를 지운 뒤 음절 2-gram(기본값)을 쓴다. 정규화하면 n-gram 하나보다 짧아지는
+제목(이모지/문장부호만 있는 제목 등)은 비교할 내용이 없으므로 중복으로 보지 않는다.
+임계값은 Jaccard 기준이며 환경변수 TITLE_DUP_THRESHOLD로 바꿀 수 있다
+(기본 0.65 ≈ 기존 SequenceMatcher 0.85, benchmarks/bench_title_dedupe.py 참고).
+"""
+import os
+import random
+import re
+import zlib
+from typing import Callable, Dict, FrozenSet, Hashable, List, Optional, Set, Tuple
+
+DEFAULT_THRESHOLD = float(os.getenv('TITLE_DUP_THRESHOLD', '0.65'))
+DEFAULT_NUM_PERM = 64
+DEFAULT_NGRAM = 2
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+# 문자/숫자 외 전부 제거 (한글 음절, 영문, 숫자만 남김)
+_NON_WORD_RE = re.compile(r'[\W_]+', re.UNICODE)
+
+
+def normalize_title(title: str) -> str:
+    """비교용 제목 (소문자, 공백/문장부호 제거)"""
+    return _NON_WORD_RE.sub('', title.lower())
+
+
+def shingles(title: str, n: int = DEFAULT_NGRAM) -> FrozenSet[str]:
+    """정규화 제목의 문자 n-gram 집합 (n보다 짧으면 제목 전체 하나)"""
+    text = normalize_title(title)
+    if len(text) <= n:
+        return frozenset([text]) if text else frozenset()
+    return frozenset(text[i:i + n] for i in range(len(text) - n + 1))
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def choose_bands(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """(band 수, band당 row 수) - 후보가 되는 유사도 (1/b)^(1/r)가 threshold 바로 아래인 조합
+
+    확인 단계에서 정확한 Jaccard로 다시 거르므로 후보 쪽은 넉넉하게(재현율 우선) 잡는다.
+    """
+    target = max(0.05, threshold - 0.1)
+    best = (num_perm, 1)
+    best_gap = float('inf')
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        gap = abs((1 / bands) ** (1 / rows) - target)
+        if gap < best_gap:
+            best, best_gap = (bands, rows), gap
+    return best
+
+
+class MinHasher:
+    """고정 seed 순열로 n-gram 집합의 MinHash 서명 계산"""
+
+    def __init__(self, num_perm: int = DEFAULT_NUM_PERM, seed: int = 1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self._perms = [(rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME)) for _ in range(num_perm)]
+
+    def signature(self, grams: FrozenSet[str]) -> Tuple[int, ...]:
+        if not grams:
+            return (_MAX_HASH,) * self.num_perm
+        hashes = [zlib.crc32(g.encode('utf-8')) for g in grams]
+        return tuple(
+            min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+            for a, b in self._perms
+        )
+
+
+class TitleIndex:
+    """제목 near-duplicate 인덱스
+
+    add_if_new(title)은 기존 제목과 Jaccard >= threshold면 False, 아니면 등록하고 True.
+    """
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD, num_perm: int = DEFAULT_NUM_PERM,
+                 ngram: int = DEFAULT_NGRAM):
+        self.threshold = threshold
+        self.ngram = ngram
+        self.hasher = MinHasher(num_perm)
+        self.bands, self.rows = choose_bands(threshold, num_perm)
+        self._buckets: List[Dict[Tuple[int, ...], List[int]]] = [{} for _ in range(self.bands)]
+        self._exact: Dict[str, int] = {}
+        self._grams: List[FrozenSet[str]] = []
+        self._keys: List[Hashable] = []
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _comparable(self, normalized: str) -> bool:
+        """n-gram 하나 이상 나오는 제목만 비교 (빈 제목끼리 정확 일치/같은 버킷으로 묶이지 않도록)"""
+        return len(normalized) >= self.ngram
+
+    def _band_keys(self, signature: Tuple[int, ...]):
+        rows = self.rows
+        for band in range(self.bands):
+            yield band, signature[band * rows:(band + 1) * rows]
+
+    def find(self, title: str) -> Optional[Hashable]:
+        """threshold 이상 비슷한 등록 제목의 key (없으면 None)"""
+        normalized = normalize_title(title)
+        if not self._comparable(normalized):
+            return None
+        if normalized in self._exact:
+            return self._keys[self._exact[normalized]]
+        match = self._find(shingles(title, self.ngram))
+        return None if match is None else self._keys[match]
+
+    def _find(self, grams: FrozenSet[str], signature: Optional[Tuple[int, ...]] = None) -> Optional[int]:
+        if not grams:
+            return None
+        if signature is None:
+            signature = self.hasher.signature(grams)
+        checked: Set[int] = set()
+        for band, key in self._band_keys(signature):
+            for index in self._buckets[band].get(key, ()):
+                if index in checked:
+                    continue
+                checked.add(index)
+                if jaccard(grams, self._grams[index]) >= self.threshold:
+                    return index
+        return None
+
+    def add(self, title: str, key: Optional[Hashable] = None):
+        """중복 여부와 상관없이 등록"""
+        grams = shingles(title, self.ngram)
+        self._insert(title, grams, self.hasher.signature(grams), key)
+
+    def _insert(self, title: str, grams: FrozenSet[str], signature: Tuple[int, ...], key: Optional[Hashable]):
+        index = len(self._keys)
+        self._keys.append(title if key is None else key)
+        normalized = normalize_title(title)
+        if not self._comparable(normalized):
+            # 키만 남기고 정확 일치/LSH 후보에는 넣지 않는다
+            self._grams.append(frozenset())
+            return
+        self._grams.append(grams)
+        self._exact.setdefault(normalized, index)
+        if grams:
+            for band, band_key in self._band_keys(signature):
+                self._buckets[band].setdefault(band_key, []).append(index)
+
+    def add_if_new(self, title: str, key: Optional[Hashable] = None) -> bool:
+        """비슷한 제목이 없으면 등록하고 True, 있으면 False"""
+        normalized = normalize_title(title)
+        if not self._comparable(normalized):
+            self._insert(title, frozenset(), (), key)
+            return True
+        if normalized in self._exact:
+            return False
+        grams = shingles(title, self.ngram)
+        signature = self.hasher.signature(grams)
+        if self._find(grams, signature) is not None:
+            return False
+        self._insert(title, grams, signature, key)
+        return True
+
+
+def _minhash_mask(titles: List[str]) -> List[bool]:
+    index = TitleIndex()
+    return [index.add_if_new(title) for title in titles]
+
+
+def _numpy_mask(titles: List[str]) -> List[bool]:
+    # numpy는 선택 의존성 (requirements.txt에 없음), 이 전략을 고를 때만 import한다
+    from title_similarity import unique_mask
+
+    return unique_mask(titles)
+
+
+# 제목 중복 판정 전략: 'minhash'(순차 인덱스, 기본값) | 'numpy'(일괄 코사인 클러스터, numpy 필요)
+STRATEGIES: Dict[str, Callable[[List[str]], List[bool]]] = {
+    'minhash': _minhash_mask,
+    'numpy': _numpy_mask,
+}
+
+DEFAULT_STRATEGY = os.getenv('TITLE_DEDUPE_STRATEGY', 'minhash')
+
+
+def unique_title_mask(titles: List[str], strategy: Optional[str] = None) -> List[bool]:
+    """제목별 유지 여부 (비슷한 제목 중 처음 나온 것만 True)"""
+    return STRATEGIES[strategy or DEFAULT_STRATEGY](titles)
@@ -0,0 +1,218 @@
+"""NumPy 일괄 제목 유사도 (문자 bigram CSR + 블록 단위 코사인)
+
+제목을 정규화(title_index.normalize_title)한 뒤 문자 bigram 빈도 벡터로 만들고 L2 정규화해서
+SciPy 없이 CSR 배열(indptr, indices, data)로 보관한다. 코사인 유사도는 블록 쌍 단위로 계산해서
+N×N 행렬을 만들지 않는다. 자주 나오는 bigram(상위 DENSE_FEATURES개)은 블록마다 dense로 펼쳐
+행렬곱(BLAS)으로, 나머지 드문 bigram은 겹치는 항목끼리만 곱을 만들어(np.searchsorted + np.repeat)
+np.bincount로 더한다. threshold 이상인 쌍을 union-find로 묶어 중복 클러스터를 돌려준다.
+
+numpy는 선택 의존성이다 (requirements.txt에 없음, pip install numpy). 이 모듈은
+title_index.TITLE_DEDUPE_STRATEGY='numpy'일 때만 import된다.
+
+    python title_similarity.py                 # 게시 중인 전체 카테고리 간 겹치는 기사 클러스터 출력
+    python title_similarity.py -c it -c finance [--path data/articles.sqlite3]
+"""
+import os
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from title_index import normalize_title
+
+DEFAULT_COSINE_THRESHOLD = float(os.getenv('TITLE_COSINE_THRESHOLD', '0.8'))
+DEFAULT_BLOCK_SIZE = 2048
+
+# dense 행렬곱으로 처리할 고빈도 bigram 수 (나머지는 희소 조인)
+DENSE_FEATURES = 512
+
+
+@dataclass
+class BigramMatrix:
+    """L2 정규화된 bigram 벡터 CSR (행 = 제목)"""
+    indptr: np.ndarray   # int64, 길이 n_rows + 1
+    indices: np.ndarray  # int32, bigram id
+    data: np.ndarray     # float64
+    n_features: int
+
+    @property
+    def n_rows(self) -> int:
+        return len(self.indptr) - 1
+
+
+def build_matrix(titles: Iterable[str]) -> BigramMatrix:
+    """제목 → bigram CSR (bigram id는 처음 나온 순서)"""
+    vocab: Dict[str, int] = {}
+    indptr = [0]
+    indices: List[int] = []
+    data: List[float] = []
+    for title in titles:
+        text = normalize_title(title)
+        grams = [text[i:i + 2] for i in range(len(text) - 1)] or ([text] if text else [])
+        counts: Dict[int, int] = {}
+        for gram in grams:
+            feature = vocab.setdefault(gram, len(vocab))
+            counts[feature] = counts.get(feature, 0) + 1
+        if counts:
+            features = sorted(counts)
+            values = np.array([counts[f] for f in features], dtype=np.float64)
+            values /= np.linalg.norm(values)
+            indices.extend(features)
+            data.extend(values.tolist())
+        indptr.append(len(indices))
+    return BigramMatrix(
+        indptr=np.array(indptr, dtype=np.int64),
+        indices=np.array(indices, dtype=np.int32),
+        data=np.array(data, dtype=np.float64),
+        n_features=len(vocab),
+    )
+
+
+@dataclass
+class _Block:
+    """블록 하나: 고빈도 bigram 항목(dense로 펼칠 것) + 나머지 희소 항목(bigram 순 정렬)"""
+    size: int
+    dense_rows: np.ndarray
+    dense_cols: np.ndarray
+    dense_vals: np.ndarray
+    rows: np.ndarray
+    cols: np.ndarray
+    vals: np.ndarray
+
+    def dense(self, n_dense: int) -> np.ndarray:
+        """고빈도 bigram 부분 dense 행렬 (size × n_dense, 메모리를 아끼려고 필요할 때만 만든다)"""
+        dense = np.zeros((self.size, n_dense), dtype=np.float32)
+        dense[self.dense_rows, self.dense_cols] = self.dense_vals
+        return dense
+
+
+def _dense_columns(matrix: BigramMatrix, dense_features: int) -> np.ndarray:
+    """bigram id → dense 열 번호 (희소로 처리하면 -1)"""
+    df = np.bincount(matrix.indices, minlength=matrix.n_features)
+    frequent = np.argsort(-df, kind='stable')[:dense_features]
+    frequent = frequent[df[frequent] > 1]
+    columns = np.full(matrix.n_features, -1, dtype=np.int64)
+    columns[frequent] = np.arange(len(frequent))
+    return columns
+
+
+def _block(matrix: BigramMatrix, start: int, stop: int, columns: np.ndarray) -> _Block:
+    lo, hi = matrix.indptr[start], matrix.indptr[stop]
+    rows = np.repeat(np.arange(stop - start, dtype=np.int64), np.diff(matrix.indptr[start:stop + 1]))
+    cols = matrix.indices[lo:hi]
+    vals = matrix.data[lo:hi]
+
+    dense_col = columns[cols]
+    is_dense = dense_col >= 0
+    sparse = ~is_dense
+    order = np.argsort(cols[sparse], kind='stable')
+    return _Block(
+        size=stop - start,
+        dense_rows=rows[is_dense], dense_cols=dense_col[is_dense], dense_vals=vals[is_dense],
+        rows=rows[sparse][order], cols=cols[sparse][order], vals=vals[sparse][order],
+    )
+
+
+def _tile_pairs(block_i: _Block, block_j: _Block, dense_i: np.ndarray, dense_j: np.ndarray,
+                threshold: float, same: bool):
+    """두 블록 사이 코사인 >= threshold 인 (로컬 i, 로컬 j) 쌍"""
+    size_i, size_j = block_i.size, block_j.size
+    sims = (dense_i @ dense_j.T).astype(np.float64)
+
+    # 드문 bigram: i 블록 각 항목과 같은 bigram을 가진 j 블록 항목 범위를 펼쳐서 곱
+    left = np.searchsorted(block_j.cols, block_i.cols, side='left')
+    counts = np.searchsorted(block_j.cols, block_i.cols, side='right') - left
+    total = int(counts.sum())
+    if total:
+        source = np.repeat(np.arange(len(block_i.cols)), counts)
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        target = np.repeat(left, counts) + offsets
+        pair = block_i.rows[source] * size_j + block_j.rows[target]
+        sims += np.bincount(pair, weights=block_i.vals[source] * block_j.vals[target],
+                            minlength=size_i * size_j).reshape(size_i, size_j)
+
+    if same:
+        sims = np.triu(sims, k=1)
+    # 정확히 threshold인 쌍이 float32 오차로 빠지지 않도록 여유를 둔다
+    return np.nonzero(sims >= threshold - 1e-6)
+
+
+def similar_pairs(matrix: BigramMatrix, threshold: float = DEFAULT_COSINE_THRESHOLD,
+                  block_size: int = DEFAULT_BLOCK_SIZE,
+                  dense_features: int = DENSE_FEATURES) -> List[Tuple[int, int]]:
+    """코사인 유사도 >= threshold 인 (i, j) 쌍 (i < j)"""
+    n = matrix.n_rows
+    columns = _dense_columns(matrix, dense_features)
+    n_dense = int((columns >= 0).sum())
+    starts = list(range(0, n, block_size))
+    blocks = [_block(matrix, s, min(s + block_size, n), columns) for s in starts]
+    pairs: List[Tuple[int, int]] = []
+    for bi, start_i in enumerate(starts):
+        dense_i = blocks[bi].dense(n_dense)
+        for bj in range(bi, len(starts)):
+            start_j = starts[bj]
+            dense_j = dense_i if bj == bi else blocks[bj].dense(n_dense)
+            local_i, local_j = _tile_pairs(blocks[bi], blocks[bj], dense_i, dense_j, threshold, bi == bj)
+            pairs.extend(zip((local_i + start_i).tolist(), (local_j + start_j).tolist()))
+    return pairs
+
+
+def duplicate_clusters(titles: List[str], threshold: float = DEFAULT_COSINE_THRESHOLD,
+                       block_size: int = DEFAULT_BLOCK_SIZE) -> List[List[int]]:
+    """서로 비슷한 제목 인덱스 묶음 (크기 2 이상, 각 묶음과 전체는 처음 나온 순)"""
+    parent = list(range(len(titles)))
+
+    def find(x: int) -> int:
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for i, j in similar_pairs(build_matrix(titles), threshold, block_size):
+        root_i, root_j = find(i), find(j)
+        if root_i != root_j:
+            # 앞선 인덱스를 대표로
+            parent[max(root_i, root_j)] = min(root_i, root_j)
+
+    clusters: Dict[int, List[int]] = {}
+    for index in range(len(titles)):
+        clusters.setdefault(find(index), []).append(index)
+    return [members for _, members in sorted(clusters.items()) if len(members) > 1]
+
+
+def unique_mask(titles: List[str], threshold: float = DEFAULT_COSINE_THRESHOLD) -> List[bool]:
+    """클러스터마다 처음 나온 제목만 True"""
+    keep = [True] * len(titles)
+    for members in duplicate_clusters(titles, threshold):
+        for index in members[1:]:
+            keep[index] = False
+    return keep
+
+
+def main():
+    import argparse
+
+    from article_store import ARTICLE_STORE_PATH, ArticleStore
+
+    parser = argparse.ArgumentParser(description='게시 중인 카테고리 간 중복 기사 클러스터')
+    parser.add_argument('--path', default=ARTICLE_STORE_PATH, help='기사 저장소 경로')
+    parser.add_argument('-c', '--category', action='append', help='대상 카테고리 (기본: 게시 회차가 있는 전체)')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_COSINE_THRESHOLD)
+    args = parser.parse_args()
+
+    store = ArticleStore(args.path)
+    entries = []
+    for category in args.category or sorted(store.counts()):
+        data = store.load(category)
+        if data:
+            entries.extend((category, article.get('title', '')) for article in data['articles'])
+
+    clusters = duplicate_clusters([title for _, title in entries], args.threshold)
+    cross = [members for members in clusters if len({entries[i][0] for i in members}) > 1]
+    print(f"기사 {len(entries)}개, 중복 클러스터 {len(clusters)}개 (카테고리 간 {len(cross)}개)")
+    for members in cross:
+        print(' / '.join(f"[{entries[i][0]}] {entries[i][1]}" for i in members))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,152 @@
+"""구글 뉴스 리다이렉트 URL 영구 캐시
+
+news.google.com/rss/articles/<ID> → 원문 URL 매핑을 SQLite에 보관한다.
+성공한 매핑은 길게(RESOLVE_TTL), 실패(여전히 news.google.com이거나 요청 실패)는
+짧게(NEGATIVE_TTL) 기억해서 다음 회차에 같은 기사를 다시 HEAD 요청하지 않는다.
+캐시 미스만 모아서 동시에 resolve한다 (스레드 또는 asyncio).
+"""
+import asyncio
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+URL_CACHE_PATH = os.getenv('URL_CACHE_PATH', os.path.join('cache', 'google_news_urls.sqlite3'))
+
+RESOLVE_TTL = int(os.getenv('URL_RESOLVE_TTL', str(30 * 24 * 3600)))  # 성공: 30일
+NEGATIVE_TTL = int(os.getenv('URL_NEGATIVE_TTL', str(6 * 3600)))  # 실패: 6시간
+
+_ARTICLE_ID_RE = re.compile(r'/(?:rss/)?articles/([^/?#]+)')
+
+
+def google_news_article_id(url: str) -> Optional[str]:
+    """구글 뉴스 기사 URL에서 ID 추출 (구글 뉴스 URL이 아니면 None)"""
+    parsed = urlparse(url)
+    if parsed.netloc != 'news.google.com':
+        return None
+    match = _ARTICLE_ID_RE.search(parsed.path)
+    return match.group(1) if match else None
+
+
+def is_resolved(google_url: str, final_url: str) -> bool:
+    """resolve 결과가 원문 URL인지 (원래 URL 그대로거나 구글 뉴스에 머물면 실패)"""
+    return bool(final_url) and final_url != google_url and urlparse(final_url).netloc != 'news.google.com'
+
+
+class GoogleNewsURLCache:
+    """구글 뉴스 기사 ID → 원문 URL SQLite 캐시 (TTL + 실패 캐시)"""
+
+    def __init__(self, path: str = URL_CACHE_PATH, ttl: int = RESOLVE_TTL, negative_ttl: int = NEGATIVE_TTL):
+        self.path = path
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS google_news_urls (
+                article_id TEXT PRIMARY KEY,
+                final_url TEXT NOT NULL,
+                resolved INTEGER NOT NULL,
+                expires_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute('DELETE FROM google_news_urls WHERE expires_at < ?', (time.time(),))
+        self._conn.commit()
+        self.stats = {'hit': 0, 'negative_hit': 0, 'miss': 0}
+
+    def lookup_many(self, urls: Iterable[str]) -> Dict[str, str]:
+        """만료되지 않은 캐시 항목 {google_url: 결과 URL} (실패 캐시는 원래 URL)"""
+        ids = {}
+        for url in urls:
+            article_id = google_news_article_id(url)
+            if article_id:
+                ids.setdefault(article_id, []).append(url)
+        if not ids:
+            return {}
+
+        found = {}
+        now = time.time()
+        keys = list(ids)
+        with self._lock:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ','.join('?' for _ in chunk)
+                rows = self._conn.execute(
+                    f'SELECT article_id, final_url, resolved FROM google_news_urls '
+                    f'WHERE article_id IN ({placeholders}) AND expires_at >= ?',
+                    (*chunk, now),
+                ).fetchall()
+                for article_id, final_url, resolved in rows:
+                    self.stats['hit' if resolved else 'negative_hit'] += len(ids[article_id])
+                    for url in ids[article_id]:
+                        found[url] = final_url if resolved else url
+        return found
+
+    def store_many(self, results: Dict[str, str]):
+        """resolve 결과 저장 (성공은 RESOLVE_TTL, 실패는 NEGATIVE_TTL)"""
+        now = time.time()
+        rows = []
+        for google_url, final_url in results.items():
+            article_id = google_news_article_id(google_url)
+            if not article_id:
+                continue
+            ok = is_resolved(google_url, final_url)
+            rows.append((article_id, final_url if ok else google_url, int(ok),
+                         now + (self.ttl if ok else self.negative_ttl)))
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                """
+                INSERT INTO google_news_urls (article_id, final_url, resolved, expires_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(article_id) DO UPDATE SET
+                    final_url = excluded.final_url,
+                    resolved = excluded.resolved,
+                    expires_at = excluded.expires_at
+                """,
+                rows,
+            )
+            self._conn.commit()
+
+    def _split(self, urls: List[str]):
+        unique = list(dict.fromkeys(u for u in urls if u))
+        cached = self.lookup_many(unique)
+        misses = [u for u in unique if u not in cached]
+        with self._lock:
+            self.stats['miss'] += len(misses)
+        return cached, misses
+
+    def resolve_many(self, urls: List[str], resolve: Callable[[str], str], max_workers: int = 8) -> Dict[str, str]:
+        """캐시 우선 일괄 resolve (미스만 스레드 풀로 동시 요청)"""
+        cached, misses = self._split(urls)
+        results = {}
+        if misses:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(misses))) as executor:
+                results = dict(zip(misses, executor.map(resolve, misses)))
+            self.store_many(results)
+        logger.info(f"[URL 캐시] 요청 {len(urls)}개, 캐시 {len(cached)}개, resolve {len(misses)}개")
+        return {**cached, **results}
+
+    async def resolve_many_async(self, urls: List[str], resolve: Callable[[str], Awaitable[str]]) -> Dict[str, str]:
+        """캐시 우선 일괄 resolve (미스만 asyncio로 동시 요청, 동시성 제한은 resolve 쪽에서)"""
+        cached, misses = self._split(urls)
+        results = {}
+        if misses:
+            results = dict(zip(misses, await asyncio.gather(*(resolve(url) for url in misses))))
+            self.store_many(results)
+        logger.info(f"[URL 캐시] 요청 {len(urls)}개, 캐시 {len(cached)}개, resolve {len(misses)}개")
+        return {**cached, **results}
@@ -0,0 +1,81 @@
+"""시작 시 백그라운드 워밍업 크롤링 상태
+
+게시된 데이터가 없는 카테고리만 요청이 많았던 순서로 크롤링한다. 서버는 그동안에도
+요청을 받고, 카테고리는 끝나는 즉시 저장소에 게시되어 바로 조회된다.
+/health에는 status(idle → warming → ready)와 카테고리별 진행 상태를 보여 준다.
+
+직접 크롤링하지 않는 프로세스(리더가 아닌 워커, 조회 전용 API)는 follow()로 저장소에
+게시되는 카테고리를 확인해 진행 상태만 갱신한다.
+"""
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+
+# 직접 크롤링하지 않는 프로세스가 게시를 기다리는 최대 시간 (초)
+WARMUP_FOLLOW_TIMEOUT = 15 * 60
+
+
+def order_by_demand(categories: Iterable[str], request_counts: Dict[str, int]) -> List[str]:
+    """요청 수가 많은 순 (같으면 원래 순서)"""
+    return sorted(categories, key=lambda category: -request_counts.get(category, 0))
+
+
+class WarmupState:
+    """워밍업 진행 상태 (카테고리: pending → done | failed)"""
+
+    def __init__(self):
+        self.status = 'idle'
+        self.categories: Dict[str, str] = {}
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def start(self, categories: Iterable[str]):
+        with self._lock:
+            self.categories = {category: 'pending' for category in categories}
+            self.status = 'warming' if self.categories else 'ready'
+            self.started_at = time.time()
+            self.finished_at = None if self.categories else self.started_at
+
+    def mark(self, category: str, state: str):
+        with self._lock:
+            if category in self.categories:
+                self.categories[category] = state
+
+    def finish(self):
+        """남은 pending은 failed로 두고 ready"""
+        with self._lock:
+            for category, state in self.categories.items():
+                if state == 'pending':
+                    self.categories[category] = 'failed'
+            self.status = 'ready'
+            self.finished_at = time.time()
+
+    def pending(self, category: str) -> bool:
+        return self.status == 'warming' and self.categories.get(category) == 'pending'
+
+    def to_dict(self) -> Dict:
+        with self._lock:
+            done = sum(1 for state in self.categories.values() if state != 'pending')
+            return {
+                'status': self.status,
+                'progress': f"{done}/{len(self.categories)}",
+                'categories': dict(self.categories),
+                'started_at': self.started_at,
+                'finished_at': self.finished_at,
+            }
+
+
+def follow(state: WarmupState, categories: List[str], counts: Callable[[], Dict[str, int]],
+           timeout: float = WARMUP_FOLLOW_TIMEOUT, interval: float = 2.0):
+    """counts()(카테고리별 게시 기사 수)로 게시된 카테고리를 done 처리, 다 게시되거나 timeout이면 ready"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        published = counts()
+        for category in categories:
+            if published.get(category):
+                state.mark(category, 'done')
+        if all(published.get(category) for category in categories):
+            break
+        time.sleep(interval)
+    state.finish()